@@ -4,7 +4,7 @@ Analyze the NEW VOR-based scoring system breakdown
 """
 
 from recommendation_engine import RecommendationEngine
-from data_loader import load_and_clean_data
+from data_loader import get_projections
 from config import set_league_type
 
 def analyze_new_scoring():
@@ -14,45 +14,40 @@ def analyze_new_scoring():
     print("=" * 60)
     
     # Load data
-    df = load_and_clean_data()
+    df = get_projections()
     set_league_type('non_ppr')
     engine = RecommendationEngine(df)
     engine.update_draft_state(set(), {}, 1)
     
+    # one scoring pass explains the whole board
+    breakdowns = engine.get_score_breakdowns().set_index('Player')
+    
     # Test players
     players = ['Justin Jefferson', 'Josh Jacobs', 'Bijan Robinson', 'Saquon Barkley']
     
     for player_name in players:
-        try:
-            player = engine.available_df[engine.available_df['Player'] == player_name].iloc[0]
-            
-            print(f"\n{player_name} ({player['Position']}):")
-            print(f"  VOR: {player['VOR']:.1f} | Tier: {player['Tier']} | ADP: {player['ADP']}")
-            print(f"  Ceiling: {player.get('ceiling', 'N/A')} | Floor: {player.get('floor', 'N/A')} | Uncertainty: {player.get('uncertainty', 'N/A')}")
-            
-            # Calculate each component
-            vor_score = engine.calculate_vor_score(player)
-            tier_multiplier = engine.calculate_tier_multiplier(player)
-            dropoff_bonus = engine.calculate_dropoff_bonus(player, player['Position'])
-            adp_value = engine.calculate_adp_value(player)
-            uncertainty_penalty = engine.calculate_uncertainty_penalty(player)
-            positional_adjustment = engine.calculate_positional_adjustment(player)
-            round_adjustment = engine.calculate_round_adjustment(player)
-            opportunity_cost = engine.calculate_opportunity_cost(player)
-            composite_score = engine.calculate_composite_score(player)
-            
-            print(f"  1. VOR Score: {vor_score:.1f}")
-            print(f"  2. Tier Multiplier: {tier_multiplier:+.1f}")
-            print(f"  3. Dropoff Bonus: {dropoff_bonus:+.1f}")
-            print(f"  4. ADP Value: {adp_value:+.1f}")
-            print(f"  5. Uncertainty Penalty: {uncertainty_penalty:+.1f}")
-            print(f"  6. Positional Adjustment: {positional_adjustment:+.1f}")
-            print(f"  7. Round Adjustment: {round_adjustment:+.1f}")
-            print(f"  8. Opportunity Cost: {opportunity_cost:+.1f}")
-            print(f"  TOTAL: {composite_score:.1f}")
-            
-        except IndexError:
+        if player_name not in breakdowns.index:
             print(f"\n{player_name}: Not found in data")
+            continue
+        
+        player = engine.df.loc[engine.df['Player'] == player_name].iloc[0]
+        breakdown = breakdowns.loc[player_name]
+        
+        print(f"\n{player_name} ({player['Position']}):")
+        print(f"  VOR: {player['VOR']:.1f} | Tier: {player['Tier']} | ADP: {player['ADP']}")
+        print(f"  Ceiling: {player.get('ceiling', 'N/A')} | Floor: {player.get('floor', 'N/A')} | Uncertainty: {player.get('uncertainty', 'N/A')}")
+        
+        print(f"  1. VOR Score: {breakdown['vor_score']:.1f}")
+        print(f"  2. Tier Bonus: {breakdown['tier_bonus']:+.1f}")
+        print(f"  3. Cliff Bonus: {breakdown['cliff_bonus']:+.1f}")
+        print(f"  4. ADP Value: {breakdown['adp_value']:+.1f}")
+        print(f"  5. Risk Tilt: {breakdown['risk_tilt']:+.1f}")
+        print(f"  6. Reach Cost: {breakdown['reach_cost']:+.1f}")
+        print(f"  TOTAL: {breakdown['total_score']:.1f}")
+    
+    # urgency terms for every position come from the same per-state pass
+    print("\nPOSITION URGENCY BREAKDOWN:")
+    print(engine.get_position_urgencies().round(1).to_string())
 
 def compare_old_vs_new():
     """Compare old vs new scoring systems"""
@@ -61,7 +56,7 @@ def compare_old_vs_new():
     print("=" * 60)
     
     # Load data
-    df = load_and_clean_data()
+    df = get_projections()
     set_league_type('non_ppr')
     engine = RecommendationEngine(df)
     engine.update_draft_state(set(), {}, 1)
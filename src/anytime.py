@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+# simulated boards per refinement, and per vectorized batch
+MAX_SIMULATIONS = 2000
+SIMULATION_BATCH = 100
+
+# ADP noise for the other teams' picks: a floor plus a share of the ADP itself
+ADP_NOISE_MIN = 2.0
+ADP_NOISE_SHARE = 0.15
+
+
+def simulate_boards(pool, available: np.ndarray, picks: int, simulations: int, rng) -> np.ndarray:
+    """Boards (rows) left after other teams make picks by noisy ADP; players without
+    an ADP are only taken once everyone else is gone"""
+    boards = np.repeat(available[None, :], simulations, axis=0)
+    ids = np.flatnonzero(available)
+    picks = min(picks, len(ids))
+    if picks <= 0:
+        return boards
+    adp = pool.adp[ids]
+    noisy = adp + rng.normal(0.0, 1.0, (simulations, len(ids))) * (ADP_NOISE_MIN + ADP_NOISE_SHARE * np.nan_to_num(adp))
+    noisy = np.where(np.isnan(noisy), np.inf, noisy)
+    taken = np.argpartition(noisy, picks - 1, axis=1)[:, :picks]
+    boards[np.arange(simulations)[:, None], ids[taken]] = False
+    return boards
+
+
+class AnytimeRecommendation:
+    """Recommendations that start from the heuristic answer and get refined in a
+    background thread until a deadline. The refinement simulates the other teams'
+    picks before our next turn and replaces the fixed ADP cutoff in each position's
+    opportunity cost with its average over the simulated boards."""
+
+    def __init__(self, engine, heuristic: pd.DataFrame, top_n: int, deadline_ms: float,
+                 key=None, seed: Optional[int] = None):
+        # engine is a fork owned by this refinement, so the live engine can move on
+        self.engine = engine
+        self.top_n = top_n
+        self.key = key
+        self.deadline = time.perf_counter() + deadline_ms / 1000
+        self.simulations = 0
+        self._best = heuristic
+        self._set_attrs(heuristic, 0.0, 0.0, False)
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _set_attrs(frame: pd.DataFrame, progress: float, confidence: float, refined: bool):
+        frame.attrs['progress'] = progress
+        frame.attrs['confidence'] = confidence
+        frame.attrs['refined'] = refined
+
+    @property
+    def progress(self) -> float:
+        return self.simulations / MAX_SIMULATIONS
+
+    @property
+    def confidence(self) -> float:
+        return self._best.attrs['confidence']
+
+    @property
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def best(self) -> pd.DataFrame:
+        """Best recommendations so far"""
+        with self._lock:
+            return self._best.copy()
+
+    def wait(self, timeout: Optional[float] = None) -> pd.DataFrame:
+        self._finished.wait(timeout)
+        return self.best()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _run(self):
+        try:
+            self._refine()
+        finally:
+            self._finished.set()
+
+    def _refine(self):
+        engine = self.engine
+        pool = engine.pool
+        index = engine._index
+        config = engine.league_config
+        table = engine._urgency_table()
+        positions = [pos for pos in table if not engine._position_blocked(pos) and pos in ['RB', 'WR', 'TE', 'QB']]
+        if not positions:
+            return
+
+        # our next turn after this pick, and how many players go before it
+        target = next(pick for pick in config.next_picks(config.current_round(engine.current_pick))
+                      if pick > engine.current_pick)
+        others = target - engine.current_pick - (1 if config.is_my_pick(engine.current_pick) else 0)
+
+        # per position: VOR-ordered rows and how many available players rank ahead of each slot now
+        boards = {}
+        for pos in positions:
+            position_index = index.positions[pos]
+            now = index.available[position_index.by_vor]
+            ahead = (np.cumsum(now) - now)[position_index.tie_start]
+            # waiting keeps the roster and cliff terms, only the opportunity cost moves
+            fixed = table[pos]['total_urgency'] - table[pos]['opportunity_cost']
+            boards[pos] = (position_index.by_vor, ahead, now.sum(), fixed)
+
+        totals = np.zeros(len(positions))
+        votes = np.zeros(len(positions))
+        while (self.simulations < MAX_SIMULATIONS and not self._cancelled.is_set()
+               and time.perf_counter() < self.deadline):
+            simulated = simulate_boards(pool, index.available, others, SIMULATION_BATCH, self._rng)
+            urgency = np.empty((SIMULATION_BATCH, len(positions)))
+            for column, pos in enumerate(positions):
+                by_vor, ahead, count, fixed = boards[pos]
+                board = simulated[:, by_vor]
+                best = board.argmax(axis=1)
+                # best VOR still there at our next turn, as a percentile of today's board
+                vor_pct_next = np.where(board.any(axis=1), 1 - ahead[best] / count, 0.5)
+                vor_pct_now = 1 - ahead[np.argmax(index.available[by_vor])] / count
+                urgency[:, column] = fixed + 60 * (vor_pct_now - vor_pct_next)
+            totals += urgency.sum(axis=0)
+            votes += np.bincount(urgency.argmax(axis=1), minlength=len(positions))
+            self.simulations += SIMULATION_BATCH
+
+            mean = totals / self.simulations
+            choice = int(np.argmax(mean))
+            position = positions[choice]
+            refined = engine._ranked_frame(index.available_rows(position), self.top_n)
+            refined.attrs['recommended_position'] = position
+            refined.attrs['position_urgency'] = float(mean[choice])
+            # share of simulated boards whose own best position agrees
+            self._set_attrs(refined, self.progress, float(votes[choice] / self.simulations), True)
+            with self._lock:
+                self._best = refined
@@ -0,0 +1,373 @@
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+# board versions are unique across every index and copy, so caches keyed on
+# them can never mix up two different boards
+_VERSIONS = itertools.count(1)
+
+
+class FenwickTree:
+    """Binary indexed tree over 0/1 availability flags"""
+
+    def __init__(self, size: int, filled: bool = True):
+        self.size = size
+        # a fully set tree has node i covering exactly lowbit(i) slots
+        self.tree = [(i & -i) if filled else 0 for i in range(size + 1)]
+        self._top_bit = 1 << max(0, size.bit_length() - 1) if size else 0
+
+    def add(self, slot: int, delta: int):
+        i = slot + 1
+        tree = self.tree
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, slot: int) -> int:
+        """Number of set slots in [0, slot)"""
+        total = 0
+        tree = self.tree
+        i = slot
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find_kth(self, k: int) -> int:
+        """0-based slot of the k-th set flag (k is 1-based), or -1"""
+        if k <= 0:
+            return -1
+        pos = 0
+        step = self._top_bit
+        tree = self.tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos if pos < self.size else -1
+
+    def copy(self) -> 'FenwickTree':
+        tree = FenwickTree.__new__(FenwickTree)
+        tree.size = self.size
+        tree.tree = list(self.tree)
+        tree._top_bit = self._top_bit
+        return tree
+
+
+class MinSegmentTree:
+    """Range-minimum tree over integer keys; cleared slots hold EMPTY"""
+
+    EMPTY = 1 << 62
+
+    def __init__(self, keys: np.ndarray):
+        self.size = len(keys)
+        self.width = 1 << max(0, (self.size - 1).bit_length())
+        tree = [self.EMPTY] * (2 * self.width)
+        tree[self.width:self.width + self.size] = [int(key) for key in keys]
+        for i in range(self.width - 1, 0, -1):
+            tree[i] = min(tree[2 * i], tree[2 * i + 1])
+        self.tree = tree
+        self.keys = tree[self.width:self.width + self.size]
+
+    def set_active(self, slot: int, active: bool):
+        tree = self.tree
+        i = slot + self.width
+        tree[i] = self.keys[slot] if active else self.EMPTY
+        i >>= 1
+        while i:
+            tree[i] = min(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def query(self, lo: int, hi: int) -> int:
+        """Smallest active key in slots [lo, hi), or EMPTY"""
+        best = self.EMPTY
+        tree = self.tree
+        lo += self.width
+        hi += self.width
+        while lo < hi:
+            if lo & 1:
+                best = min(best, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = min(best, tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def copy(self) -> 'MinSegmentTree':
+        tree = MinSegmentTree.__new__(MinSegmentTree)
+        tree.size = self.size
+        tree.width = self.width
+        tree.tree = list(self.tree)
+        # leaf keys never change, so they are shared
+        tree.keys = self.keys
+        return tree
+
+
+class PositionIndex:
+    """Availability of one position's players in VOR and ADP order"""
+
+    def __init__(self, rows: np.ndarray, vor: np.ndarray, adp: np.ndarray, tiers: np.ndarray, tier_slots: int):
+        # rows are positional indexes into the projections frame, in frame order
+        self.rows = rows
+        # available players per tier code (0 means no tier), updated per pick
+        self.tier_counts = np.bincount(tiers[rows], minlength=tier_slots).tolist()
+        # stable sorts keep frame order among ties, matching idxmax()
+        self.by_vor = rows[np.argsort(-vor[rows], kind='stable')]
+        # rank arrays: first VOR-order slot holding each slot's VOR value (NaNs tie together)
+        sorted_vor = vor[self.by_vor]
+        self.sorted_vor = sorted_vor
+        new_value = np.r_[True, (sorted_vor[1:] != sorted_vor[:-1]) & ~(np.isnan(sorted_vor[1:]) & np.isnan(sorted_vor[:-1]))]
+        self.tie_start = np.maximum.accumulate(np.where(new_value, np.arange(len(rows)), 0))
+        adp_keys = np.where(np.isnan(adp[rows]), np.inf, adp[rows])
+        adp_order = np.argsort(adp_keys, kind='stable')
+        self.by_adp = rows[adp_order]
+        self.sorted_adp = adp_keys[adp_order]
+        self.vor_tree = FenwickTree(len(rows))
+        self.adp_tree = FenwickTree(len(rows))
+        # ADP-ordered slots keyed by VOR-order slot, so a range min is the best VOR
+        vor_slot_of_row = dict(zip(self.by_vor.tolist(), range(len(rows))))
+        self.best_vor_tree = MinSegmentTree(np.array([vor_slot_of_row[row] for row in self.by_adp.tolist()], dtype=np.int64))
+        self.count = len(rows)
+        self.version = next(_VERSIONS)
+        # doubly linked list of available VOR-order slots; -1 and len(rows) are the ends
+        self.next_slot = np.arange(1, len(rows) + 1)
+        self.prev_slot = np.arange(-1, len(rows) - 1)
+        # live VOR gap from each available slot to the next available one (NaN at the end)
+        self.gap = np.append(sorted_vor[:-1] - sorted_vor[1:], np.nan)
+
+    def copy(self) -> 'PositionIndex':
+        """Copy of the availability trees and links; the sorted player orders are shared"""
+        index = PositionIndex.__new__(PositionIndex)
+        index.__dict__.update(self.__dict__)
+        index.vor_tree = self.vor_tree.copy()
+        index.adp_tree = self.adp_tree.copy()
+        index.best_vor_tree = self.best_vor_tree.copy()
+        index.next_slot = self.next_slot.copy()
+        index.prev_slot = self.prev_slot.copy()
+        index.gap = self.gap.copy()
+        index.tier_counts = list(self.tier_counts)
+        return index
+
+    def _link(self, prev: int, nxt: int):
+        if prev >= 0:
+            self.next_slot[prev] = nxt
+            self.gap[prev] = self.sorted_vor[prev] - self.sorted_vor[nxt] if nxt < len(self.rows) else np.nan
+        if nxt < len(self.rows):
+            self.prev_slot[nxt] = prev
+
+    def unlink(self, slot: int):
+        """Take a VOR slot off the board; only its two neighbours change"""
+        self._link(self.prev_slot[slot], self.next_slot[slot])
+        self.gap[slot] = np.nan
+
+    def relink(self, slot: int):
+        """Put a VOR slot back between its nearest available neighbours (before the tree update)"""
+        rank = self.vor_tree.prefix(slot)
+        prev = self.vor_tree.find_kth(rank) if rank else -1
+        nxt = self.vor_tree.find_kth(rank + 1)
+        self._link(prev, slot)
+        self._link(slot, nxt if nxt >= 0 else len(self.rows))
+
+
+class AvailabilityIndex:
+    """Per-position index of undrafted players, updated one pick at a time"""
+
+    def __init__(self, positions: np.ndarray, vor: np.ndarray, adp: np.ndarray, tiers: Optional[np.ndarray] = None):
+        n = len(positions)
+        self.available = np.ones(n, dtype=bool)
+        self.total = n
+        self.vor_slot = np.zeros(n, dtype=np.int64)
+        self.adp_slot = np.zeros(n, dtype=np.int64)
+        self.row_position = list(positions)
+        tiers = np.zeros(n, dtype=np.int64) if tiers is None else np.asarray(tiers, dtype=np.int64)
+        self.row_tier = tiers.tolist()
+        tier_slots = int(tiers.max()) + 1 if n else 1
+        self.positions: Dict[str, PositionIndex] = {}
+        # positions whose trees this index may modify in place; the rest are
+        # shared with copies and get cloned on first write
+        self._owned = set()
+
+        for pos in pd.unique(positions):
+            rows = np.flatnonzero(positions == pos)
+            index = PositionIndex(rows, vor, adp, tiers, tier_slots)
+            self.vor_slot[index.by_vor] = np.arange(len(rows))
+            self.adp_slot[index.by_adp] = np.arange(len(rows))
+            self.positions[pos] = index
+            self._owned.add(pos)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'AvailabilityIndex':
+        positions = df['Position'].to_numpy(dtype=object)
+        vor = pd.to_numeric(df['VOR'], errors='coerce').to_numpy(dtype=np.float64)
+        adp = pd.to_numeric(df['ADP'], errors='coerce').to_numpy(dtype=np.float64)
+        tiers = None
+        if 'Tier' in df.columns:
+            tiers = pd.to_numeric(df['Tier'], errors='coerce').to_numpy(dtype=np.float64)
+            tiers = np.where(np.isnan(tiers), 0, np.clip(np.trunc(np.nan_to_num(tiers)), 1, 127)).astype(np.int64)
+        return cls(positions, vor, adp, tiers)
+
+    @classmethod
+    def from_pool(cls, pool) -> 'AvailabilityIndex':
+        positions = np.array(pool.position_names, dtype=object)[pool.pos]
+        return cls(positions, pool.vor, pool.adp, pool.tier)
+
+    def copy(self) -> 'AvailabilityIndex':
+        """Copy-on-write copy: position trees are shared until either side drafts there"""
+        index = AvailabilityIndex.__new__(AvailabilityIndex)
+        index.available = self.available.copy()
+        index.total = self.total
+        index.vor_slot = self.vor_slot
+        index.adp_slot = self.adp_slot
+        index.row_position = self.row_position
+        index.row_tier = self.row_tier
+        index.positions = dict(self.positions)
+        index._owned = set()
+        self._owned = set()
+        return index
+
+    def _writable(self, position: str) -> PositionIndex:
+        if position not in self._owned:
+            self.positions[position] = self.positions[position].copy()
+            self._owned.add(position)
+        index = self.positions[position]
+        index.version = next(_VERSIONS)
+        return index
+
+    def mark_drafted(self, row: int) -> bool:
+        if not self.available[row]:
+            return False
+        self.available[row] = False
+        self.total -= 1
+        index = self._writable(self.row_position[row])
+        index.unlink(int(self.vor_slot[row]))
+        index.vor_tree.add(int(self.vor_slot[row]), -1)
+        index.adp_tree.add(int(self.adp_slot[row]), -1)
+        index.best_vor_tree.set_active(int(self.adp_slot[row]), False)
+        index.tier_counts[self.row_tier[row]] -= 1
+        index.count -= 1
+        return True
+
+    def mark_available(self, row: int) -> bool:
+        if self.available[row]:
+            return False
+        self.available[row] = True
+        self.total += 1
+        index = self._writable(self.row_position[row])
+        index.relink(int(self.vor_slot[row]))
+        index.vor_tree.add(int(self.vor_slot[row]), 1)
+        index.adp_tree.add(int(self.adp_slot[row]), 1)
+        index.best_vor_tree.set_active(int(self.adp_slot[row]), True)
+        index.tier_counts[self.row_tier[row]] += 1
+        index.count += 1
+        return True
+
+    def apply(self, rows: np.ndarray, drafted: np.ndarray):
+        """Move the given rows to match a drafted row mask"""
+        for row in rows:
+            if drafted[row]:
+                self.mark_drafted(row)
+            else:
+                self.mark_available(row)
+
+    def count(self, position: Optional[str] = None) -> int:
+        if position is None:
+            return self.total
+        index = self.positions.get(position)
+        return index.count if index is not None else 0
+
+    def position_counts(self) -> Dict[str, int]:
+        counts = {pos: index.count for pos, index in self.positions.items() if index.count > 0}
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def position_version(self, position: str) -> int:
+        """Token that changes whenever a player at the position is drafted or returned"""
+        index = self.positions.get(position)
+        return index.version if index is not None else 0
+
+    def tier_count(self, position: str, tier: int) -> int:
+        """Available players at a position in one tier"""
+        index = self.positions.get(position)
+        if index is None or not 0 <= tier < len(index.tier_counts):
+            return 0
+        return index.tier_counts[tier]
+
+    def tier_counts(self, position: Optional[str] = None) -> Dict[int, int]:
+        """Available players per tier (tiered players only), for one position or all"""
+        indexes = [self.positions[position]] if position in self.positions else []
+        if position is None:
+            indexes = list(self.positions.values())
+        counts = {}
+        for index in indexes:
+            for tier, count in enumerate(index.tier_counts[1:], 1):
+                if count:
+                    counts[tier] = counts.get(tier, 0) + count
+        return dict(sorted(counts.items()))
+
+    def nth_by_vor(self, position: str, n: int) -> Optional[int]:
+        """Row of the n-th best available player by VOR (n is 1-based)"""
+        index = self.positions.get(position)
+        if index is None or n > index.count:
+            return None
+        slot = index.vor_tree.find_kth(n)
+        return int(index.by_vor[slot]) if slot >= 0 else None
+
+    def vor_rank(self, row: int) -> int:
+        """Number of available players at the row's position with a higher VOR"""
+        index = self.positions[self.row_position[row]]
+        return index.vor_tree.prefix(int(index.tie_start[self.vor_slot[row]]))
+
+    def live_dropoff(self, row: int) -> float:
+        """VOR gap from an available row to the next available player at its position"""
+        index = self.positions[self.row_position[row]]
+        return float(index.gap[self.vor_slot[row]])
+
+    def cliffs(self, position: str, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Available rows whose live dropoff exceeds threshold, best VOR first,
+        with the next available row and the gap"""
+        index = self.positions.get(position)
+        if index is None:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        # slots are in VOR order already, so no sort is needed
+        slots = np.flatnonzero(index.gap > threshold)
+        return index.by_vor[slots], index.by_vor[index.next_slot[slots]], index.gap[slots]
+
+    def best_by_vor(self, position: str) -> Optional[int]:
+        return self.nth_by_vor(position, 1)
+
+    def best_by_vor_from_adp(self, position: str, min_adp: float) -> Optional[int]:
+        """Row of the best available player by VOR with ADP >= min_adp (missing ADP counts)"""
+        index = self.positions.get(position)
+        if index is None or index.count == 0:
+            return None
+        lo = int(np.searchsorted(index.sorted_adp, min_adp, side='left'))
+        best = index.best_vor_tree.query(lo, len(index.rows))
+        return int(index.by_vor[best]) if best != MinSegmentTree.EMPTY else None
+
+    def best_by_adp(self, position: str) -> Optional[int]:
+        index = self.positions.get(position)
+        if index is None or index.count == 0:
+            return None
+        slot = index.adp_tree.find_kth(1)
+        return int(index.by_adp[slot]) if slot >= 0 else None
+
+    def available_by_vor(self, position: str) -> np.ndarray:
+        """Available rows at a position, best VOR first (missing VOR last)"""
+        index = self.positions.get(position)
+        if index is None:
+            return np.empty(0, dtype=np.int64)
+        return index.by_vor[self.available[index.by_vor]]
+
+    def available_rows(self, position: Optional[str] = None) -> np.ndarray:
+        """Available rows in frame order, optionally for one position"""
+        if position is None:
+            return np.flatnonzero(self.available)
+        index = self.positions.get(position)
+        if index is None:
+            return np.empty(0, dtype=np.int64)
+        return index.rows[self.available[index.rows]]
@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 LEAGUE_ID = 1296971572
 YEAR = 2025
 ESPN_S2 = "AECwvTudMsJwR8SOZpn6u8E1AsVsJsV4I2FsuNOExZzCpkvzzT7iEu9pJCYsYhvNuHA%2FpsSYkkixmTmvASX4ObW98D1gDwpyCZUbCMc5Q%2BKMl6DEnck7icrnyy8i3ShTClRsGaR%2B5jBZOvd4wT2ZWsvnuFML4Q8hLzHC63gTCmc%2F%2F8NfixnTC%2BRSGJM%2BgzKbeEq%2BmHt744NgbKIr2k5UqTxeE4SBOPc1%2B8L3GAtoO9VwqX7nQUhllqCGXat0769mhpYwxzVLqX%2FZZj5vWCCOjfT8%2FPkfeGZRRuS3Y1s9TpF6Sw%3D%3D"
@@ -26,6 +28,9 @@ STARTING_LINEUP = {
 
 TOTAL_ROSTER_SIZE = 16  
 
+# time the GUI gives the background lookahead to refine a recommendation (ms)
+RECOMMENDATION_DEADLINE_MS = 3000
+
 SCORING_CONFIG = {
     # Offensive scoring
     "passing_yards_per_point": 25,
@@ -130,6 +135,60 @@ POSITION_WEIGHTS = {
     }
 }
 
+class LeagueConfig:
+    """Settings for one league; engines and analyzers take one instead of reading the globals above"""
+
+    def __init__(self, total_teams: Optional[int] = None, your_draft_slot: Optional[int] = None,
+                 position_limits: Optional[Dict[str, int]] = None, starting_lineup: Optional[Dict[str, int]] = None,
+                 total_roster_size: Optional[int] = None, league_type: Optional[str] = None):
+        # anything not given falls back to the module-level settings
+        self.total_teams = TOTAL_TEAMS if total_teams is None else total_teams
+        self.your_draft_slot = YOUR_DRAFT_SLOT if your_draft_slot is None else your_draft_slot  # 0-based
+        self.position_limits = dict(POSITION_LIMITS if position_limits is None else position_limits)
+        self.starting_lineup = dict(STARTING_LINEUP if starting_lineup is None else starting_lineup)
+        self.total_roster_size = TOTAL_ROSTER_SIZE if total_roster_size is None else total_roster_size
+        self.league_type = league_type or RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
+
+    def with_draft_slot(self, your_draft_slot: int) -> 'LeagueConfig':
+        """Same league seen from another draft slot"""
+        return LeagueConfig(self.total_teams, your_draft_slot, self.position_limits,
+                            self.starting_lineup, self.total_roster_size, self.league_type)
+
+    def recommendation_cap(self, position: str) -> int:
+        """Most players at a position worth recommending: the roster limit, and for
+        positions without bench value (QB, K, DST) no more than the starting slots"""
+        cap = self.position_limits.get(position, 999)
+        if position in ['QB', 'K', 'DST']:
+            cap = min(cap, max(1, self.starting_lineup.get(position, 1)))
+        return cap
+
+    def lineup_key(self) -> tuple:
+        """The parts of the league that decide replacement levels"""
+        return (self.total_teams, tuple(sorted(self.starting_lineup.items())))
+
+    def cache_key(self) -> tuple:
+        """Every setting that can change a recommendation"""
+        return (self.lineup_key(), self.your_draft_slot, tuple(sorted(self.position_limits.items())),
+                self.total_roster_size, self.league_type)
+
+    def current_round(self, pick: int) -> int:
+        return (pick - 1) // self.total_teams + 1
+
+    def my_pick_in_round(self, round_num: int) -> int:
+        # snake draft: odd rounds go forward, even rounds in reverse
+        if round_num % 2 == 1:
+            return self.your_draft_slot + 1
+        return self.total_teams - self.your_draft_slot
+
+    def is_my_pick(self, pick: int) -> bool:
+        pick_in_round = ((pick - 1) % self.total_teams) + 1
+        return pick_in_round == self.my_pick_in_round(self.current_round(pick))
+
+    def next_picks(self, current_round: int, count: int = 3) -> List[int]:
+        """Overall pick numbers of our picks in this round and the following ones"""
+        return [(round_num - 1) * self.total_teams + self.my_pick_in_round(round_num)
+                for round_num in range(current_round, current_round + count)]
+
 def set_league_type(league_type: str):
     global RECOMMENDATION_CONFIG
     
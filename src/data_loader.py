@@ -1,12 +1,20 @@
 import pandas as pd
 import os
 from config import RECOMMENDATION_CONFIG
+from player_pool import PlayerPool
+from replacement import compute_vor
+
+# one shared projections table per scoring format, loaded once per process
+_PROJECTIONS = {}
+
+# projections with VOR recomputed for a league lineup, per scoring format and lineup
+_LEAGUE_PROJECTIONS = {}
 
 def get_ppr_setting():
     return RECOMMENDATION_CONFIG.get("ppr_value", 0)
 
-def select_csv_file():
-    league_type = RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
+def select_csv_file(league_type=None):
+    league_type = league_type or RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
     
     if league_type == "half_ppr":
         return "projections_half_ppr.csv"
@@ -22,9 +30,9 @@ def clean_dataset(df):
     df_cleaned = df_cleaned.reset_index(drop=True)
     return df_cleaned
 
-def load_and_clean_data():
-    csv_file = select_csv_file()
-    league_type = RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
+def load_and_clean_data(league_type=None):
+    league_type = league_type or RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
+    csv_file = select_csv_file(league_type)
     
     if not os.path.exists(csv_file):
         print(f"Error: {csv_file} not found!")
@@ -50,6 +58,26 @@ def load_and_clean_data():
     
     return df_cleaned
 
+def get_projections(league_type=None, league_config=None):
+    """Shared projections for a scoring format; treat the frame as read-only.
+    With a league_config, VOR is recomputed from points for that league's lineup."""
+    league_type = league_type or RECOMMENDATION_CONFIG.get("league_type", "non_ppr")
+    df = _PROJECTIONS.get(league_type)
+    if df is None:
+        df = load_and_clean_data(league_type)
+        if df is not None:
+            _PROJECTIONS[league_type] = df
+    if df is None or league_config is None:
+        return df
+    
+    key = (league_type, league_config.lineup_key())
+    league_df = _LEAGUE_PROJECTIONS.get(key)
+    if league_df is None:
+        league_df = df.copy()
+        league_df['VOR'] = compute_vor(PlayerPool.for_frame(df), league_config)
+        _LEAGUE_PROJECTIONS[key] = league_df
+    return league_df
+
 if __name__ == "__main__":
     df = load_and_clean_data()
     if df is not None:
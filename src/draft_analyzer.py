@@ -1,14 +1,20 @@
+import weakref
+import numpy as np
 import pandas as pd
 from config import *
+from availability_index import AvailabilityIndex
+from player_pool import NO_TIER, DraftedSet, PlayerPool
+from ranking import top_k
+from perf import timed
 
 def analyze_position_depth(df, position, drafted, top_n=5):
-    available_df = df[~df['Player'].isin(drafted)]
-    pos_data = available_df[available_df['Position'] == position].copy()
-    pos_data = pos_data.sort_values('VOR', ascending=False).head(top_n)
+    pool = PlayerPool.for_frame(df)
+    pos_ids = pool.available_ids(drafted, position)
+    pos_data = pool.to_frame(pos_ids[top_k(pool.vor[pos_ids], top_n)])
     
     analysis = {
         'position': position,
-        'total_players': len(available_df[available_df['Position'] == position]),
+        'total_players': len(pos_ids),
         'top_players': pos_data,
         'tier_breakdown': pos_data['Tier'].value_counts().to_dict(),
         'avg_uncertainty': pos_data['uncertainty'].mean() if 'uncertainty' in pos_data.columns else None,
@@ -17,33 +23,44 @@ def analyze_position_depth(df, position, drafted, top_n=5):
     
     return analysis
 
-def get_position_cliffs(df, position, drafted, threshold=10):
-    available_df = df[~df['Player'].isin(drafted)]
-    pos_data = available_df[available_df['Position'] == position].copy()
-    pos_data = pos_data.sort_values('VOR', ascending=False)
+# one live board per pool with its drafted rows, moved to each caller's drafted set
+# by diff; neither refers back to the pool, so the entry goes away with it
+_LIVE_INDEXES = weakref.WeakKeyDictionary()
+
+@timed('analyzer.state_update')
+def _live_index(pool, drafted):
+    drafted_rows = DraftedSet.coerce(pool, drafted).row_mask()
+    index, previous = _LIVE_INDEXES.get(pool) or (AvailabilityIndex.from_pool(pool), np.zeros(pool.size, dtype=bool))
+    index.apply(np.flatnonzero(previous != drafted_rows), drafted_rows)
+    _LIVE_INDEXES[pool] = (index, drafted_rows)
+    return index
+
+def _cliff_records(pool, index, position, threshold):
+    rows, next_rows, gaps = index.cliffs(position, threshold)
     
     cliffs = []
-    for i in range(len(pos_data) - 1):
-        current_vor = pos_data.iloc[i]['VOR']
-        next_vor = pos_data.iloc[i + 1]['VOR']
-        dropoff = current_vor - next_vor
-        
-        if dropoff > threshold:
-            cliffs.append({
-                'player': pos_data.iloc[i]['Player'],
-                'vor': current_vor,
-                'tier': pos_data.iloc[i]['Tier'],
-                'dropoff': dropoff,
-                'next_player': pos_data.iloc[i + 1]['Player'],
-                'next_vor': next_vor
-            })
+    for row, next_row, gap in zip(rows, next_rows, gaps):
+        cliffs.append({
+            'player': pool.names[row],
+            'vor': pool.vor[row],
+            'tier': pool.frame['Tier'].iat[row],
+            'dropoff': gap,
+            'next_player': pool.names[next_row],
+            'next_vor': pool.vor[next_row]
+        })
     
     return cliffs
 
+@timed('analyzer.cliffs')
+def get_position_cliffs(df, position, drafted, threshold=10):
+    pool = PlayerPool.for_frame(df)
+    return _cliff_records(pool, _live_index(pool, drafted), position, threshold)
+
 def get_risk_analysis(df, position, drafted):
-    available_df = df[~df['Player'].isin(drafted)]
-    pos_data = available_df[available_df['Position'] == position].copy()
-    pos_data = pos_data.sort_values('VOR', ascending=False).head(10)
+    pool = PlayerPool.for_frame(df)
+    ids = pool.available_ids(drafted, position)
+    ids = ids[top_k(pool.vor[ids], 10)]
+    pos_data = pool.to_frame(ids)
     
     if 'uncertainty' not in pos_data.columns or 'sd_pts' not in pos_data.columns:
         return None
@@ -58,34 +75,48 @@ def get_risk_analysis(df, position, drafted):
         'avg_volatility': pos_data['sd_pts'].mean() if 'sd_pts' in pos_data.columns else None
     }
 
+@timed('analyzer.tiers')
 def get_tier_analysis(df, drafted):
-    available_df = df[~df['Player'].isin(drafted)]
-    tier_counts = available_df['Tier'].value_counts().sort_index()
+    pool = PlayerPool.for_frame(df)
+    index = _live_index(pool, drafted)
+    ids = np.flatnonzero(index.available)
+    ids = ids[pool.tier[ids] != NO_TIER]
+    # group by tier once instead of filtering the frame per tier
+    ids = ids[np.argsort(pool.tier[ids], kind='stable')]
+    tiers, starts = np.unique(pool.tier[ids], return_index=True)
     
     analysis = {}
-    for tier in tier_counts.index:
-        tier_players = available_df[available_df['Tier'] == tier]
-        analysis[f'tier_{tier}'] = {
-            'count': tier_counts[tier],
-            'positions': tier_players['Position'].value_counts().to_dict(),
-            'avg_vor': tier_players['VOR'].mean(),
-            'players': tier_players[['Player', 'Position', 'VOR', 'ADP']].to_dict('records')
+    for tier, start in zip(tiers, starts):
+        # counts per position come from the live counters
+        position_counts = [index.tier_count(pos, int(tier)) for pos in pool.position_names]
+        count = sum(position_counts)
+        tier_ids = np.sort(ids[start:start + count])
+        tier_label = pool.frame['Tier'].iat[tier_ids[0]]
+        positions = {pool.position_names[code]: position_counts[code]
+                     for code in np.argsort(-np.array(position_counts), kind='stable') if position_counts[code] > 0}
+        analysis[f'tier_{tier_label}'] = {
+            'count': count,
+            'positions': positions,
+            'avg_vor': float(pool.vor[tier_ids].mean()),
+            'players': [{'Player': name, 'Position': pool.position_names[code], 'VOR': vor, 'ADP': adp}
+                        for name, code, vor, adp in zip(pool.names[tier_ids], pool.pos[tier_ids].tolist(),
+                                                        pool.vor[tier_ids].tolist(), pool.adp[tier_ids].tolist())]
         }
     
     return analysis
 
+@timed('analyzer.insights')
 def get_strategic_insights(df, current_pick, total_teams, drafted):
     insights = []
     
-    available_df = df[~df['Player'].isin(drafted)]
+    pool = PlayerPool.for_frame(df)
+    index = _live_index(pool, drafted)
     
     # Only mention tiers that actually have players remaining
     for pos in ['QB', 'RB', 'WR', 'TE']:
-        pos_data = available_df[available_df['Position'] == pos]
-        
         # Check each tier and only mention if there are players
-        for tier in ['1', '2', '3']:
-            tier_count = len(pos_data[pos_data['Tier'] == tier])
+        for tier in [1, 2, 3]:
+            tier_count = index.tier_count(pos, tier)
             if tier_count > 0:
                 if tier_count <= 2:
                     insights.append(f"⚠️  {pos} Tier {tier} players running low ({tier_count} remaining)")
@@ -94,15 +125,17 @@ def get_strategic_insights(df, current_pick, total_teams, drafted):
     
     # analyze cliffs
     for pos in ['RB', 'WR']:
-        cliffs = get_position_cliffs(df, pos, drafted, threshold=15)
+        cliffs = _cliff_records(pool, index, pos, threshold=15)
         if cliffs:
             insights.append(f"📉 {pos} cliff detected: {cliffs[0]['player']} → {cliffs[0]['dropoff']:.1f} VOR drop")
     
-    # analyze risk profiles
-    for pos in ['WR', 'RB']:
-        risk_analysis = get_risk_analysis(df, pos, drafted)
-        if risk_analysis and risk_analysis['avg_uncertainty'] > 20:
-            insights.append(f"🎲 {pos} has high uncertainty ({risk_analysis['avg_uncertainty']:.1f}) - consider steady options")
+    # analyze risk profiles of the top 10 by VOR, read off the live VOR order
+    if 'uncertainty' in pool.columns and 'sd_pts' in pool.columns:
+        for pos in ['WR', 'RB']:
+            uncertainty = pool.uncertainty[index.available_by_vor(pos)[:10]]
+            uncertainty = uncertainty[~np.isnan(uncertainty)]
+            if len(uncertainty) and uncertainty.mean() > 20:
+                insights.append(f"🎲 {pos} has high uncertainty ({uncertainty.mean():.1f}) - consider steady options")
     
     return insights
 
@@ -128,33 +161,28 @@ def format_position_analysis(analysis):
     
     return "\n".join(output)
 
-def get_best_by_position(df, positions=['QB', 'RB', 'WR', 'TE']):
-    """Get best available player at each position"""
+def _best_by_position(pool, ids, positions):
     best_by_pos = {}
     
     for pos in positions:
-        pos_data = df[df['Position'] == pos]
-        if len(pos_data) > 0:
-            best = pos_data.loc[pos_data['VOR'].idxmax()]
-            best_by_pos[pos] = best
+        pos_ids = ids[pool.pos[ids] == pool.position_code(pos)]
+        if len(pos_ids) > 0:
+            best_by_pos[pos] = pool.row(pos_ids[np.argmax(pool.vor[pos_ids])])
     
     return best_by_pos
 
+def get_best_by_position(df, positions=['QB', 'RB', 'WR', 'TE']):
+    """Get best available player at each position"""
+    pool = PlayerPool.for_frame(df)
+    return _best_by_position(pool, pool.ids, positions)
+
 def get_best_by_position_available(df, drafted, positions=['QB', 'RB', 'WR', 'TE']):
-    best_by_pos = {}
-    
-    available_df = df[~df['Player'].isin(drafted)]
-    
-    for pos in positions:
-        pos_data = available_df[available_df['Position'] == pos]
-        if len(pos_data) > 0:
-            best = pos_data.loc[pos_data['VOR'].idxmax()]
-            best_by_pos[pos] = best
-    
-    return best_by_pos
+    pool = PlayerPool.for_frame(df)
+    return _best_by_position(pool, pool.available_ids(drafted), positions)
 
-def analyze_roster_needs(drafted_positions, available_df):
+def analyze_roster_needs(drafted_positions, available_df, league_config=None):
     """Analyze roster needs and recommend positions to target"""
+    league_config = league_config or LeagueConfig()
     needs = {}
     
     # Calculate current roster composition
@@ -170,14 +198,14 @@ def analyze_roster_needs(drafted_positions, available_df):
     total_drafted = sum(current_roster.values())
     
     # Determine needs based on ESPN standard roster limits
-    for pos, limit in POSITION_LIMITS.items():
+    for pos, limit in league_config.position_limits.items():
         current = current_roster.get(pos, 0)
         
         if current < limit:
-            if current < STARTING_LINEUP.get(pos, 0):
+            if current < league_config.starting_lineup.get(pos, 0):
                 needs[pos] = {
                     'priority': 'critical',
-                    'reason': f'Need {STARTING_LINEUP.get(pos, 0) - current} more {pos}(s) for starting lineup'
+                    'reason': f'Need {league_config.starting_lineup.get(pos, 0) - current} more {pos}(s) for starting lineup'
                 }
             else:
                 needs[pos] = {
@@ -197,139 +225,104 @@ def analyze_roster_needs(drafted_positions, available_df):
     
     # Special handling for FLEX position
     flex_candidates = current_roster['RB'] + current_roster['WR'] + current_roster['TE']
-    if flex_candidates < STARTING_LINEUP['FLEX']:
+    if flex_candidates < league_config.starting_lineup['FLEX']:
         needs['FLEX'] = {
             'priority': 'critical',
-            'reason': f'Need {STARTING_LINEUP["FLEX"] - flex_candidates} more RB/WR/TE for FLEX spot'
+            'reason': f'Need {league_config.starting_lineup["FLEX"] - flex_candidates} more RB/WR/TE for FLEX spot'
         }
     
     # Overall roster size check
-    if total_drafted >= TOTAL_ROSTER_SIZE:
+    if total_drafted >= league_config.total_roster_size:
         needs['ROSTER_FULL'] = {
             'priority': 'critical',
-            'reason': f'Roster is full ({total_drafted}/{TOTAL_ROSTER_SIZE})'
+            'reason': f'Roster is full ({total_drafted}/{league_config.total_roster_size})'
         }
     
     return needs
 
-def get_advanced_player_score(player, position_needs, current_pick, available_df):
-    """Calculate advanced player score using strategic fantasy football principles"""
-    score = 0
-    pos = player['Position']
-    
-    # 1. VOR Weight (increased to be the primary driver)
-    score += player['VOR'] * 0.6
-    
-    # 2. Tier Bonus (scaled down to avoid overshadowing VOR)
-    tier = int(player['Tier']) if isinstance(player['Tier'], (int, float)) else 10
-    tier_bonus = max(0, (10 - tier) * 2)  # Tier 1 gets +18, Tier 2 gets +16, etc.
-    score += tier_bonus
-    
-    # 3. Roster Need (moderated to not override value)
-    if pos in position_needs:
-        if position_needs[pos]['priority'] == 'critical':
-            score += 30
-        elif position_needs[pos]['priority'] == 'high':
-            score += 20
-        elif position_needs[pos]['priority'] == 'medium':
-            score += 10
-    
-    # 4. Scarcity Cliff Bonus for RBs/WRs (positional value protection)
-    if 'dropoff' in player and not pd.isna(player['dropoff']):
-        dropoff = player['dropoff']
-        if dropoff > 20 and pos in ['RB', 'WR']:
-            score += 25  # Protect against positional cliffs
-    
-    # 5. Positional Scarcity Analysis
-    pos_players = available_df[available_df['Position'] == pos]
-    if len(pos_players) <= 5:  # Very scarce position
-        score += 15
-    elif len(pos_players) <= 10:  # Moderately scarce
-        score += 8
-    
-    # 6. QB/TE Deprioritization (unless elite tier)
-    if pos in ['QB', 'TE'] and tier > 2:
-        score -= 20  # Penalize non-elite QBs/TEs
-    
-    # 7. Risk Adjustment
-    if 'uncertainty' in player and not pd.isna(player['uncertainty']):
-        uncertainty = player['uncertainty']
-        if uncertainty < 10:
-            score += 10  # Low risk bonus
-        elif uncertainty > 30:
-            score -= 15  # High risk penalty
-    
-    # 8. Floor/Ceiling Analysis
-    if 'floor' in player and 'ceiling' in player and not pd.isna(player['floor']) and not pd.isna(player['ceiling']):
-        floor = player['floor']
-        ceiling = player['ceiling']
-        consistency = ceiling - floor
-        if consistency < 50:  # High floor, consistent player
-            score += 10
-        elif consistency > 100:  # High ceiling, boom/bust
-            score += 5
-    
-    # 9. ADP Value (contextual)
-    if not pd.isna(player['ADP']) and player['ADP'] != 'NA':
-        adp = float(player['ADP'])
-        if adp > current_pick + 12:  # Going 1+ rounds later than current pick
-            score += 15
-        elif adp < current_pick - 12:  # Going 1+ rounds earlier than current pick
-            score -= 10
-    
-    # 10. FLEX Bonus (only if truly needed)
-    if pos in ['RB', 'WR', 'TE'] and 'FLEX' in position_needs:
-        if position_needs['FLEX']['priority'] == 'critical':
-            score += 15  # Reduced from 25
+@timed('analyzer.scoring')
+def _advanced_scores(pool, ids, position_needs, current_pick):
+    """Advanced score for many players at once: VOR, tier, roster need, cliff,
+    scarcity, risk, floor/ceiling, ADP value and FLEX need"""
+    pos = pool.pos[ids]
+    score = pool.vor[ids] * 0.6
+    
+    tier = np.where(pool.tier[ids] == NO_TIER, 10, pool.tier[ids]).astype(np.float64)
+    score += np.maximum(0, (10 - tier) * 2)
+    
+    need_bonus = {'critical': 30, 'high': 20, 'medium': 10}
+    for position, need in position_needs.items():
+        code = pool.position_code(position)
+        if code >= 0:
+            score += np.where(pos == code, need_bonus.get(need['priority'], 0), 0)
+    
+    rb_wr = np.isin(pos, [pool.position_code('RB'), pool.position_code('WR')])
+    if 'dropoff' in pool.columns:
+        score += np.where((pool.dropoff[ids] > 20) & rb_wr, 25, 0)
+    
+    position_counts = np.bincount(pos, minlength=len(pool.position_names))[pos]
+    score += np.where(position_counts <= 5, 15, np.where(position_counts <= 10, 8, 0))
+    
+    qb_te = np.isin(pos, [pool.position_code('QB'), pool.position_code('TE')])
+    score -= np.where(qb_te & (tier > 2), 20, 0)
+    
+    if 'uncertainty' in pool.columns:
+        uncertainty = pool.uncertainty[ids]
+        score += np.where(uncertainty < 10, 10, np.where(uncertainty > 30, -15, 0))
+    
+    if 'floor' in pool.columns and 'ceiling' in pool.columns:
+        consistency = pool.ceiling[ids] - pool.floor[ids]
+        score += np.where(consistency < 50, 10, np.where(consistency > 100, 5, 0))
+    
+    adp = pool.adp[ids]
+    score += np.where(adp > current_pick + 12, 15, np.where(adp < current_pick - 12, -10, 0))
+    
+    if position_needs.get('FLEX', {}).get('priority') == 'critical':
+        flex = np.isin(pos, [pool.position_code('RB'), pool.position_code('WR'), pool.position_code('TE')])
+        score += np.where(flex, 15, 0)
     
     return score
 
-def get_overall_pick_recommendations(df, drafted, drafted_positions, current_pick, top_n=5):
+@timed('analyzer.recommendations')
+def get_overall_pick_recommendations(df, drafted, drafted_positions, current_pick, top_n=5, league_config=None):
     """Get overall pick recommendations considering roster needs and advanced stats"""
-    available_df = df[~df['Player'].isin(drafted)]
+    pool = PlayerPool.for_frame(df)
+    ids = pool.available_ids(drafted)
     
     # Analyze roster needs
-    position_needs = analyze_roster_needs(drafted_positions, available_df)
-    
-    # Calculate advanced scores for all available players
-    scored_players = []
-    for _, player in available_df.iterrows():
-        score = get_advanced_player_score(player, position_needs, current_pick, available_df)
-        scored_players.append({
-            'player': player,
-            'score': score,
-            'position': player['Position'],
-            'vor': player['VOR'],
-            'tier': player['Tier']
-        })
+    position_needs = analyze_roster_needs(drafted_positions, None, league_config)
     
-    # Sort by score and return top recommendations
-    scored_players.sort(key=lambda x: x['score'], reverse=True)
+    # Calculate advanced scores for all available players, highest first
+    scores = _advanced_scores(pool, ids, position_needs, current_pick)
+    order = top_k(scores, top_n)
     
     recommendations = []
-    for i, item in enumerate(scored_players[:top_n]):
-        player = item['player']
+    for i, idx in enumerate(order):
+        player = pool.row(ids[idx])
+        position = player['Position']
         recommendations.append({
             'rank': i + 1,
             'player': player,
-            'score': item['score'],
-            'position': item['position'],
-            'vor': item['vor'],
-            'tier': item['tier'],
-            'need_priority': position_needs.get(item['position'], {}).get('priority', 'low'),
-            'need_reason': position_needs.get(item['position'], {}).get('reason', 'Depth pick')
+            'score': float(scores[idx]),
+            'position': position,
+            'vor': player['VOR'],
+            'tier': player['Tier'],
+            'need_priority': position_needs.get(position, {}).get('priority', 'low'),
+            'need_reason': position_needs.get(position, {}).get('reason', 'Depth pick')
         })
     
     return recommendations, position_needs
 
-def print_draft_insights(df, current_pick, drafted, drafted_positions=None, is_my_pick=False):
+@timed('analyzer.print_insights')
+def print_draft_insights(df, current_pick, drafted, drafted_positions=None, is_my_pick=False, league_config=None):
+    league_config = league_config or LeagueConfig()
     if is_my_pick:
         print(f"\n🎯 IT'S YOUR PICK (#{current_pick})")
         print("=" * 50)
         
         # Show overall pick recommendations first
         if drafted_positions:
-            recommendations, position_needs = get_overall_pick_recommendations(df, drafted, drafted_positions, current_pick, top_n=5)
+            recommendations, position_needs = get_overall_pick_recommendations(df, drafted, drafted_positions, current_pick, top_n=5, league_config=league_config)
             
             print("\n🎯 OVERALL PICK RECOMMENDATIONS:")
             for rec in recommendations:
@@ -357,7 +350,7 @@ def print_draft_insights(df, current_pick, drafted, drafted_positions=None, is_m
             adp_str = f"ADP: {player['ADP']}" if not pd.isna(player['ADP']) and player['ADP'] != 'NA' else "ADP: N/A"
             print(f"  {pos}: {player['Player']} | VOR: {player['VOR']:.1f} | Tier {player['Tier']} | {adp_str}{uncertainty_str}")
         
-        insights = get_strategic_insights(df, current_pick, TOTAL_TEAMS, drafted)
+        insights = get_strategic_insights(df, current_pick, league_config.total_teams, drafted)
         if insights:
             print("\n💡 STRATEGIC INSIGHTS:")
             for insight in insights:
@@ -378,15 +371,6 @@ def print_draft_insights(df, current_pick, drafted, drafted_positions=None, is_m
     
     print("=" * 50)
 
-def is_my_pick(current_pick_number):
+def is_my_pick(current_pick_number, league_config=None):
     """Determine if it's our pick based on snake draft logic"""
-    current_round = (current_pick_number - 1) // TOTAL_TEAMS + 1
-    
-    if current_round % 2 == 1:  # Odd round - forward
-        my_pick_in_round = YOUR_DRAFT_SLOT + 1
-    else:  # Even round - reverse
-        my_pick_in_round = TOTAL_TEAMS - YOUR_DRAFT_SLOT
-    
-    pick_in_round = ((current_pick_number - 1) % TOTAL_TEAMS) + 1
-    
-    return pick_in_round == my_pick_in_round
+    return (league_config or LeagueConfig()).is_my_pick(current_pick_number)
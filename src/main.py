@@ -21,22 +21,24 @@ sys.stderr = original_stderr
 
 from espn_api.football import League
 from config import *
-from data_loader import load_and_clean_data
+from data_loader import get_projections
 from draft_analyzer import print_draft_insights, is_my_pick
+from player_pool import DraftedSet, PlayerPool
 
 # Load data
-df = load_and_clean_data()
+df = get_projections()
 if df is None:
     print("Failed to load data. Exiting.")
     exit(1)
 
-df["Drafted"] = False
+player_pool = PlayerPool.for_frame(df)
+league_config = LeagueConfig()
 
 # Set to False for live ESPN draft, True for testing
 TEST_MODE = False
 
 if TEST_MODE:
-    mock_drafted_players = set()
+    mock_drafted_players = DraftedSet(player_pool)
     mock_draft_slot = YOUR_DRAFT_SLOT
     mock_total_teams = TOTAL_TEAMS
 
@@ -136,12 +138,14 @@ def fetch_draft_recap(league_id, year):
         return set()
 
 
-def get_best_available(df, drafted, drafted_positions, current_pick_number):
-    df["Drafted"] = df["Player"].isin(drafted)
-    available = df[~df["Drafted"]]
+def get_best_available(df, drafted, drafted_positions, current_pick_number, league_config=None):
+    pool = PlayerPool.for_frame(df)
+    league_config = league_config or LeagueConfig()
+    available = df[pool.available_mask(drafted)]
+    total_teams = league_config.total_teams
 
     for pos in ["QB", "TE", "K", "DST", "RB", "WR"]:
-        limit = POSITION_LIMITS.get(pos, None)
+        limit = league_config.position_limits.get(pos, None)
         if limit is not None and drafted_positions.get(pos, 0) >= limit:
             available = available[available["Position"] != pos]
 
@@ -154,21 +158,13 @@ def get_best_available(df, drafted, drafted_positions, current_pick_number):
             return True
 
         adp = float(adp)
-        current_round = (current_pick_number - 1) // TOTAL_TEAMS + 1
-        next_picks = []
-        for i in range(3):
-            round_num = current_round + i
-            if round_num % 2 == 1:
-                pick_num = (round_num - 1) * TOTAL_TEAMS + YOUR_DRAFT_SLOT + 1
-            else:
-                pick_num = round_num * TOTAL_TEAMS - YOUR_DRAFT_SLOT
-            next_picks.append(pick_num)
+        next_picks = league_config.next_picks(league_config.current_round(current_pick_number))
 
-        max_reasonable_adp = max(next_picks) + (TOTAL_TEAMS * 1)
+        max_reasonable_adp = max(next_picks) + (total_teams * 1)
         if vor > 50:
-            max_reasonable_adp = max(next_picks) + (TOTAL_TEAMS * 2)
+            max_reasonable_adp = max(next_picks) + (total_teams * 2)
         elif str(tier) == "1":
-            max_reasonable_adp = max(next_picks) + (TOTAL_TEAMS * 3)
+            max_reasonable_adp = max(next_picks) + (total_teams * 3)
 
         return adp <= max_reasonable_adp
 
@@ -176,11 +172,10 @@ def get_best_available(df, drafted, drafted_positions, current_pick_number):
     return available.sort_values(by=["Tier", "VOR"], ascending=[True, False]).head(10)
 
 
-def show_position_analysis(df, drafted, position):
+def show_position_analysis(df, drafted, position, page_size=10):
+    pool = PlayerPool.for_frame(df)
     
-    available_df = df[~df['Player'].isin(drafted)]
-    pos_data = available_df[available_df['Position'] == position].copy()
-    pos_data = pos_data.sort_values('VOR', ascending=False).head(10)
+    pos_data = pool.to_frame(pool.top_available('VOR', drafted, page_size, position))
     
     print(f"\n=== {position} ANALYSIS ===")
     print(f"Available players: {len(pos_data)}")
@@ -190,9 +185,17 @@ def show_position_analysis(df, drafted, position):
         return
     
     print(f"\nTop {position} players:")
-    for i, (_, player) in enumerate(pos_data.iterrows(), 1):
-        adp_str = f"ADP: {player['ADP']}" if not pd.isna(player['ADP']) and player['ADP'] != 'NA' else "ADP: N/A"
-        print(f"  {i}. {player['Player']} | VOR: {player['VOR']:.1f} | Tier {player['Tier']} | {adp_str}")
+    shown = 0
+    while len(pos_data) > 0:
+        for i, (_, player) in enumerate(pos_data.iterrows(), shown + 1):
+            adp_str = f"ADP: {player['ADP']}" if not pd.isna(player['ADP']) and player['ADP'] != 'NA' else "ADP: N/A"
+            print(f"  {i}. {player['Player']} | VOR: {player['VOR']:.1f} | Tier {player['Tier']} | {adp_str}")
+        shown += len(pos_data)
+        
+        # page deeper by scanning further along the fixed VOR order
+        if len(pos_data) < page_size or input(f"Show next {page_size}? (y/n): ").strip().lower() != 'y':
+            break
+        pos_data = pool.to_frame(pool.top_available('VOR', drafted, shown + page_size, position)[shown:])
 
 
 def show_roster_summary(drafted_positions):
@@ -209,8 +212,8 @@ def show_roster_summary(drafted_positions):
 
 
 def show_quick_recommendations(df, drafted, drafted_positions, current_pick):
-    available_df = df[~df['Player'].isin(drafted)]
-    available_df = available_df.sort_values('VOR', ascending=False).head(5)
+    pool = PlayerPool.for_frame(df)
+    available_df = pool.to_frame(pool.top_available('VOR', drafted, 5))
     
     print(f"\n=== TOP RECOMMENDATIONS (Filtered from {len(drafted)} drafted players) ===")
     for i, (_, player) in enumerate(available_df.iterrows(), 1):
@@ -236,7 +239,7 @@ def show_draft_status(current_pick, drafted, is_my_turn):
         
         # Calculate picks until my turn
         for pick in range(current_pick, current_pick + TOTAL_TEAMS * 2):
-            if is_my_pick(pick):
+            if is_my_pick(pick, league_config):
                 picks_until_my_turn = pick - current_pick
                 break
         
@@ -378,7 +381,7 @@ def popup_recommendations(picks):
 
 drafted_positions = {}
 seen_picks = set()
-manual_drafted_players = set()  # For manual picks when API fails
+manual_drafted_players = DraftedSet(player_pool)  # For manual picks when API fails
 last_known_pick_count = 0  # Track changes in pick count
 
 print("Draft Assistant Started!")
@@ -386,7 +389,7 @@ print(f"Your draft slot: {YOUR_DRAFT_SLOT + 1}")
 print(f"Position limits: {POSITION_LIMITS}")
 
 while True:
-    drafted = get_drafted_players()
+    drafted = DraftedSet(player_pool, get_drafted_players())
     # Combine API detected picks with manual picks
     drafted.update(manual_drafted_players)
     
@@ -406,14 +409,14 @@ while True:
             drafted_positions[pos] = drafted_positions.get(pos, 0) + 1
 
     current_pick_number = len(drafted) + 1
-    my_pick = is_my_pick(current_pick_number)
+    my_pick = is_my_pick(current_pick_number, league_config)
 
     if my_pick:
         print(f"\n🎯 IT'S YOUR PICK (#{current_pick_number})")
         print("=" * 50)
         
         top_recs = get_best_available(
-            df.copy(), drafted, drafted_positions, current_pick_number
+            df, drafted, drafted_positions, current_pick_number, league_config
         )
         
         print("\nTOP RECOMMENDATIONS FOR YOUR PICK:")
@@ -472,14 +475,13 @@ while True:
         print(f"\n=== ADD MANUAL PICK (Pick #{current_pick_number}) ===")
         
         # Get available players sorted by ADP
-        available_df = df[~df['Player'].isin(drafted)]
-        available_df = available_df.sort_values('ADP', ascending=True)
+        available_df = player_pool.to_frame(player_pool.top_available('ADP', drafted, 20))
         
         # Show top 20 players by ADP
         print("Top 20 available players by ADP:")
         print("=" * 60)
         
-        for i, (_, player) in enumerate(available_df.head(20).iterrows(), 1):
+        for i, (_, player) in enumerate(available_df.iterrows(), 1):
             adp_str = f"ADP: {player['ADP']}" if not pd.isna(player['ADP']) and player['ADP'] != 'NA' else "ADP: N/A"
             checkbox = "[ ]" if player['Player'] not in manual_drafted_players else "[✓]"
             print(f"{checkbox} {i:2d}. {player['Player']} ({player['Position']}) | {adp_str} | VOR: {player['VOR']:.1f}")
@@ -534,11 +536,10 @@ while True:
         
         # Show next likely picks
         print(f"\n=== NEXT LIKELY PICKS (Pick #{current_pick_number}) ===")
-        available_df = df[~df['Player'].isin(drafted)]
-        available_df = available_df.sort_values('ADP', ascending=True)
+        available_df = player_pool.to_frame(player_pool.top_available('ADP', drafted, 10))
         
         print("Top 10 available by ADP:")
-        for i, (_, player) in enumerate(available_df.head(10).iterrows(), 1):
+        for i, (_, player) in enumerate(available_df.iterrows(), 1):
             adp_str = f"ADP: {player['ADP']}" if not pd.isna(player['ADP']) and player['ADP'] != 'NA' else "ADP: N/A"
             print(f"  {i}. {player['Player']} ({player['Position']}) | {adp_str} | VOR: {player['VOR']:.1f}")
     elif choice == 'C':
@@ -17,29 +17,32 @@ sys.stderr = original_stderr
 
 from espn_api.football import League
 from config import *
-from data_loader import load_and_clean_data
+from data_loader import get_projections
 from draft_analyzer import print_draft_insights, is_my_pick
+from player_pool import DraftedSet, PlayerPool
 from recommendation_engine import RecommendationEngine
 
-df = load_and_clean_data()
+df = get_projections()
 if df is None:
     print("Failed to load data. Exiting.")
     raise SystemExit(1)
 
-df["Drafted"] = False
-recommendation_engine = RecommendationEngine(df)
+player_pool = PlayerPool.for_frame(df)
+league_config = LeagueConfig()
+recommendation_engine = RecommendationEngine(df, league_config)
 
 TEST_MODE = False
 
 
 class DraftState:
-    def __init__(self, total_teams, your_draft_slot, current_pick=1):
+    def __init__(self, total_teams, your_draft_slot, pool, current_pick=1):
         self.total_teams = total_teams
         self.your_draft_slot = your_draft_slot
         self.current_pick = current_pick
-        self.all_drafted_players = set()
-        self.your_roster = set()
-        self.manual_picks = set()
+        # drafted sets are bool masks over the pool's name ids, so copies are cheap
+        self.all_drafted_players = DraftedSet(pool)
+        self.your_roster = DraftedSet(pool)
+        self.manual_picks = DraftedSet(pool)
 
     def is_my_pick(self):
         current_round = (self.current_pick - 1) // self.total_teams + 1
@@ -77,7 +80,7 @@ class DraftState:
     def get_manual_picks(self):
         return self.manual_picks.copy()
 
-draft_state = DraftState(TOTAL_TEAMS, YOUR_DRAFT_SLOT, current_pick=1)
+draft_state = DraftState(league_config.total_teams, league_config.your_draft_slot, player_pool, current_pick=1)
 
 if TEST_MODE:
     def get_drafted_players():
@@ -399,11 +402,8 @@ def create_main_window():
 
 
 def create_manual_pick_window(df, drafted, current_pick):
-    # Ensure drafted is a set for efficient lookup
-    if not isinstance(drafted, set):
-        drafted = set(drafted)
-    
-    available_df = df[~df['Player'].isin(drafted)]
+    pool = PlayerPool.for_frame(df)
+    available_count = int(pool.available_mask(drafted).sum())
     title_color = '#66BB6A'
     section_color = '#42A5F5'
     
@@ -412,7 +412,7 @@ def create_manual_pick_window(df, drafted, current_pick):
     tabs = []
 
     # All
-    all_players = available_df.sort_values('ADP', ascending=True).head(60)
+    all_players = pool.to_frame(pool.top_available('ADP', drafted, 60))
     all_list = []
     for i, (_, p) in enumerate(all_players.iterrows(), 1):
         adp_str = f"ADP: {p['ADP']}" if not pd.isna(p['ADP']) and p['ADP'] != 'NA' else "ADP: N/A"
@@ -429,7 +429,7 @@ def create_manual_pick_window(df, drafted, current_pick):
 
     # Positions
     for position in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']:
-        pos_players = available_df[available_df['Position'] == position].sort_values('ADP', ascending=True).head(50)
+        pos_players = pool.to_frame(pool.top_available('ADP', drafted, 50, position))
         pos_list = []
         for i, (_, p) in enumerate(pos_players.iterrows(), 1):
             adp_str = f"ADP: {p['ADP']}" if not pd.isna(p['ADP']) and p['ADP'] != 'NA' else "ADP: N/A"
@@ -446,7 +446,7 @@ def create_manual_pick_window(df, drafted, current_pick):
 
     layout = [
         [sg.Text('Manual Pick', font=('Helvetica', 14, 'bold'), text_color=title_color)],
-        [sg.Text(f'Pick #{current_pick} | Available: {len(available_df)} players', font=('Helvetica', 10), text_color=section_color)],
+        [sg.Text(f'Pick #{current_pick} | Available: {available_count} players', font=('Helvetica', 10), text_color=section_color)],
         [sg.TabGroup([tabs])],
         [sg.Button('Close', key='-CLOSE-', size=(10, 1))]
     ]
@@ -454,24 +454,39 @@ def create_manual_pick_window(df, drafted, current_pick):
     return sg.Window('Manual Pick', layout, modal=True, finalize=True, resizable=True)
 
 
-def update_main_window(window, df, drafted, current_pick, manual_picks):
-    all_drafted = draft_state.get_all_drafted()
-    recommendation_engine.update_draft_state(all_drafted, {}, current_pick)
-
+def format_recommendations(top_recs):
     # Recommendations (position-first)
-    top_recs = recommendation_engine.get_recommendations(5)
     if len(top_recs) > 0:
         recommended_position = top_recs.attrs.get('recommended_position', 'Unknown')
         position_urgency = top_recs.attrs.get('position_urgency', 0)
-        lines = [f"RECOMMENDED POSITION: {recommended_position} (Urgency: {position_urgency:.1f})", ""]
+        refinement = recommendation_engine.refinement
+        if refinement is not None and not refinement.done:
+            status = f" | Refining {top_recs.attrs['progress']:.0%}"
+        elif top_recs.attrs.get('refined'):
+            status = f" | Confidence {top_recs.attrs['confidence']:.0%}"
+        else:
+            status = ""
+        lines = [f"RECOMMENDED POSITION: {recommended_position} (Urgency: {position_urgency:.1f}){status}", ""]
         for i, (_, p) in enumerate(top_recs.iterrows(), 1):
             adp_str = f"ADP: {p['ADP']}" if not pd.isna(p['ADP']) and p['ADP'] != 'NA' else "ADP: N/A"
             tier_icon = '🟢' if p['Tier'] == 1 else '🟡' if p['Tier'] == 2 else '🟠' if p['Tier'] == 3 else '🔴'
             score_str = f"{p['composite_score']:.1f}" if 'composite_score' in p else ""
             lines.append(f"{tier_icon} {i}. {p['Player']} ({p['Position']}) | VOR {p['VOR']:.1f} | T{p['Tier']} | {adp_str} | Score {score_str}")
-        recommendations = "\n".join(lines)
-    else:
-        recommendations = "No recommendations right now."
+        return "\n".join(lines)
+    return "No recommendations right now."
+
+
+def update_main_window(window, df, drafted, current_pick, manual_picks):
+    all_drafted = draft_state.get_all_drafted()
+    recommendation_engine.update_draft_state(all_drafted, {}, current_pick)
+
+    # best answer so far; the lookahead keeps refining it in the background
+    top_recs = recommendation_engine.get_recommendations(5, deadline_ms=RECOMMENDATION_DEADLINE_MS)
+    recommendations = format_recommendations(top_recs)
+
+    # while opponents are on the clock, warm the likeliest boards at our next pick
+    if not draft_state.is_my_pick():
+        recommendation_engine.speculate(5)
 
     # Overall position urgency (stored for popup)
     insights = recommendation_engine.get_strategic_insights()
@@ -549,9 +564,9 @@ def update_main_window(window, df, drafted, current_pick, manual_picks):
 
 
 def show_position_analysis(df, drafted, position):
+    pool = PlayerPool.for_frame(df)
     all_drafted = draft_state.get_all_drafted()
-    available_df = df[~df['Player'].isin(all_drafted)]
-    pos_data = available_df[available_df['Position'] == position].sort_values('VOR', ascending=False).head(10)
+    pos_data = pool.to_frame(pool.top_available('VOR', all_drafted, 10, position))
 
     tier_icon = {1: '🟢', 2: '🟡', 3: '🟠'}
     lines = [f"{position} — Top by VOR", ""]
@@ -567,16 +582,15 @@ def show_position_analysis(df, drafted, position):
 
 def show_player_analysis(df, drafted, position=None):
     """Show top 10 players by ceiling with detailed stats"""
+    pool = PlayerPool.for_frame(df)
     all_drafted = draft_state.get_all_drafted()
-    available_df = df[~df['Player'].isin(all_drafted)]
+    pos_data = pool.to_frame(pool.top_available('ceiling', all_drafted, 10, position))
     
     if position:
         # Show specific position
-        pos_data = available_df[available_df['Position'] == position].sort_values('ceiling', ascending=False).head(10)
         title = f"Top 10 by Ceiling"
     else:
         # Show all positions
-        pos_data = available_df.sort_values('ceiling', ascending=False).head(10)
         title = "All Positions — Top 10 by Ceiling"
     
     tier_icon = {1: '🟢', 2: '🟡', 3: '🟠'}
@@ -605,14 +619,28 @@ def show_player_analysis(df, drafted, position=None):
 def main():
     window = create_main_window()
 
+    next_refresh = 0.0
+    refining = False
     while True:
-        event, values = window.read(timeout=5000)
+        # poll quickly while a recommendation is still being refined, and once more
+        # after it finishes so the final answer doesn't wait for the 5 s tick
+        refinement = recommendation_engine.refinement
+        was_refining, refining = refining, refinement is not None and not refinement.done
+        fast_poll = refining or (was_refining and refinement is not None)
+        event, values = window.read(timeout=250 if fast_poll else 5000)
 
         if event == sg.WIN_CLOSED or event == '-EXIT-':
             break
 
+        # fast polls only redraw the refined recommendations; the ESPN fetch
+        # and the full refresh stay on the 5 s tick
+        if event == sg.TIMEOUT_KEY and fast_poll and time.time() < next_refresh:
+            window['-RECOMMENDATIONS-'].update(format_recommendations(refinement.best()))
+            continue
+
         drafted = get_drafted_players()
         update_main_window(window, df, drafted, draft_state.current_pick, draft_state.get_manual_picks())
+        next_refresh = time.time() + 5
 
         if event == '-ADD_PICK-':
             if draft_state.is_my_pick():
@@ -635,7 +663,7 @@ def main():
                         added = 0
                         # Get fresh available players (excluding newly drafted ones)
                         current_drafted = draft_state.get_all_drafted()
-                        avail = df[~df['Player'].isin(current_drafted)].sort_values('ADP', ascending=True)
+                        avail = player_pool.to_frame(player_pool.top_available('ADP', current_drafted, 60))
                         
                         for s in selected:
                             try:
@@ -664,8 +692,7 @@ def main():
                         added = 0
                         # Get fresh available players (excluding newly drafted ones)
                         current_drafted = draft_state.get_all_drafted()
-                        avail = df[~df['Player'].isin(current_drafted)]
-                        pos_df = avail[avail['Position'] == pos].sort_values('ADP', ascending=True)
+                        pos_df = player_pool.to_frame(player_pool.top_available('ADP', current_drafted, 50, pos))
                         
                         for s in selected:
                             try:
@@ -750,9 +777,9 @@ def main():
                                     adp_str = f"ADP {adp}" if not pd.isna(adp) and adp != 'NA' else "ADP N/A"
                                     txt.append(f"    {i}. {pl} | {adp_str}")
                             txt.append("")
-                avail = df[~df['Player'].isin(drafted)].sort_values('ADP', ascending=True)
+                avail = player_pool.to_frame(player_pool.top_available('ADP', drafted, 10))
                 txt.append("NEXT UP (by ADP):")
-                for i, (_, p) in enumerate(avail.head(10).iterrows(), 1):
+                for i, (_, p) in enumerate(avail.iterrows(), 1):
                     adp_str = f"ADP {p['ADP']}" if not pd.isna(p['ADP']) and p['ADP'] != 'NA' else "ADP N/A"
                     txt.append(f"  {i}. {p['Player']} ({p['Position']}) | {adp_str} | VOR {p['VOR']:.1f}")
                 sg.popup_scrolled("\n".join(txt), title="Draft Status", size=(60, 25))
@@ -0,0 +1,108 @@
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# histogram bucket upper bounds in microseconds (1-2-5 steps up to 10 s); slower calls go in a last bucket
+BUCKETS_US = [mantissa * 10 ** exponent for exponent in range(7) for mantissa in (1, 2, 5)] + [10 ** 7]
+
+
+class PerfRecorder:
+    """Per-stage wall time and call counts, bucketed into histograms"""
+
+    def __init__(self):
+        self.enabled = False
+        # thread whose calls are recorded (None records every thread)
+        self.thread: Optional[int] = None
+        self._stages: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        if self.thread is not None and threading.get_ident() != self.thread:
+            return
+        micros = seconds * 1e6
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                # calls, total, min, max, histogram
+                entry = self._stages[stage] = [0, 0.0, micros, micros, [0] * (len(BUCKETS_US) + 1)]
+            entry[0] += 1
+            entry[1] += micros
+            entry[2] = min(entry[2], micros)
+            entry[3] = max(entry[3], micros)
+            entry[4][bisect.bisect_left(BUCKETS_US, micros)] += 1
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def stats(self, prefix: str = '') -> Dict[str, Dict[str, any]]:
+        """Calls, total/mean/min/max time and a histogram per stage, slowest total first"""
+        with self._lock:
+            stages = {stage: (entry[0], entry[1], entry[2], entry[3], list(entry[4]))
+                      for stage, entry in self._stages.items() if stage.startswith(prefix)}
+        result = {}
+        for stage, (calls, total, low, high, counts) in sorted(stages.items(), key=lambda item: item[1][1], reverse=True):
+            labels = [f"<={bound}us" for bound in BUCKETS_US] + [f">{BUCKETS_US[-1]}us"]
+            result[stage] = {
+                'calls': calls,
+                'total_ms': total / 1000,
+                'mean_us': total / calls,
+                'min_us': low,
+                'max_us': high,
+                'histogram': {label: count for label, count in zip(labels, counts) if count},
+            }
+        return result
+
+
+RECORDER = PerfRecorder()
+
+
+def timed(stage: str):
+    """Decorator recording a function's wall time under stage; one flag check when disabled"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not RECORDER.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                RECORDER.record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def enable(all_threads: bool = False):
+    """Start recording; by default only calls from the enabling thread count, so
+    background refinement and speculation don't mix into a refresh's numbers"""
+    RECORDER.thread = None if all_threads else threading.get_ident()
+    RECORDER.enabled = True
+
+
+def disable():
+    RECORDER.enabled = False
+
+
+def reset():
+    RECORDER.reset()
+
+
+def get_perf_stats(prefix: str = '') -> Dict[str, Dict[str, any]]:
+    return RECORDER.stats(prefix)
+
+
+@contextmanager
+def recording(all_threads: bool = False, reset_stats: bool = True):
+    """Record stage timings inside the block, then restore the previous setting"""
+    previous = (RECORDER.enabled, RECORDER.thread)
+    if reset_stats:
+        RECORDER.reset()
+    enable(all_threads)
+    try:
+        yield RECORDER
+    finally:
+        RECORDER.enabled, RECORDER.thread = previous
@@ -0,0 +1,256 @@
+import weakref
+import numpy as np
+import pandas as pd
+from ranking import sort_keys
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+# position codes; positions outside this list get codes after these
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DST']
+
+# tier code for players without a usable tier
+NO_TIER = 0
+
+# columns the display lists rank by, and whether higher is better
+SORT_KEYS = {'VOR': True, 'ceiling': True, 'ADP': False}
+
+_POOL_CACHE: Dict[int, tuple] = {}
+
+
+def _float_column(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=np.float64)
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+
+class PlayerPool:
+    """Projections stored as typed column arrays for the engine's hot paths"""
+
+    def __init__(self, df: pd.DataFrame):
+        # the frame is only used to build display rows; held weakly so the pool
+        # cache below doesn't keep every frame alive
+        self._frame = weakref.ref(df)
+        self.columns = set(df.columns)
+        self.size = len(df)
+        self.ids = np.arange(self.size, dtype=np.int32)
+        self.names = df['Player'].to_numpy(dtype=object)
+
+        positions = df['Position'].to_numpy(dtype=object)
+        extra = [pos for pos in pd.unique(positions) if pos not in POSITIONS]
+        self.position_names: List[str] = POSITIONS + extra
+        codes = {pos: code for code, pos in enumerate(self.position_names)}
+        self.pos = np.array([codes[pos] for pos in positions], dtype=np.int8)
+
+        self.vor = _float_column(df, 'VOR', np.nan)
+        self.floor = _float_column(df, 'floor', np.nan) if 'floor' in df.columns else self.vor
+        self.ceiling = _float_column(df, 'ceiling', np.nan) if 'ceiling' in df.columns else self.vor
+        self.adp = _float_column(df, 'ADP', np.nan)
+        self.points = _float_column(df, 'points', np.nan)
+        self.dropoff = _float_column(df, 'dropoff', 0.0)
+        self.uncertainty = _float_column(df, 'uncertainty', 0.0)
+
+        tier = _float_column(df, 'Tier', np.nan)
+        self.tier = np.where(np.isnan(tier), NO_TIER, np.clip(np.trunc(np.nan_to_num(tier)), 1, 127)).astype(np.int8)
+
+        self._position_ids = {pos: np.flatnonzero(self.pos == code).astype(np.int32)
+                              for code, pos in enumerate(self.position_names)}
+        # names are interned once to dense ids; duplicate names share an id
+        self.name_ids, self.unique_names = pd.factorize(self.names)
+        self.name_ids = self.name_ids.astype(np.int32)
+        self.unique_names = np.asarray(self.unique_names, dtype=object)
+        self._name_ids: Dict[str, int] = {name: name_id for name_id, name in enumerate(self.unique_names)}
+        self._ids_by_name: Dict[str, List[int]] = {}
+        for player_id, name in enumerate(self.names):
+            self._ids_by_name.setdefault(name, []).append(player_id)
+
+        # pools are shared between engines, so their columns are read-only
+        for column in (self.ids, self.names, self.pos, self.vor, self.floor, self.ceiling, self.adp,
+                       self.points, self.dropoff, self.uncertainty, self.tier, self.name_ids):
+            column.flags.writeable = False
+
+        # fixed sort permutations, built on first use
+        self._sort_orders: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def for_frame(cls, df: pd.DataFrame) -> 'PlayerPool':
+        """Pool for a projections frame, built once and reused while the frame lives"""
+        key = id(df)
+        cached = _POOL_CACHE.get(key)
+        if cached is not None and cached[0]() is df and cached[1].size == len(df):
+            return cached[1]
+        pool = cls(df)
+        _POOL_CACHE[key] = (weakref.ref(df, lambda _, key=key: _POOL_CACHE.pop(key, None)), pool)
+        return pool
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._frame()
+
+    def position_code(self, position: str) -> int:
+        try:
+            return self.position_names.index(position)
+        except ValueError:
+            return -1
+
+    def position_ids(self, position: str) -> np.ndarray:
+        """Ids at one position, in projections order"""
+        ids = self._position_ids.get(position)
+        return ids if ids is not None else np.empty(0, dtype=np.int32)
+
+    def ids_for_name(self, name: str) -> List[int]:
+        return self._ids_by_name.get(name, [])
+
+    def name_id(self, name: str) -> int:
+        """Interned id for a player name, or -1 if the name is not in the projections"""
+        return self._name_ids.get(name, -1)
+
+    def available_ids(self, drafted: Iterable[str], position: Optional[str] = None) -> np.ndarray:
+        """Undrafted ids, optionally limited to one position, in projections order"""
+        mask = self.available_mask(drafted)
+        ids = self.position_ids(position) if position is not None else self.ids
+        return ids[mask[ids]]
+
+    def available_mask(self, drafted: Iterable[str]) -> np.ndarray:
+        """Boolean mask of players whose names are not in drafted"""
+        if isinstance(drafted, DraftedSet) and drafted.pool is self:
+            return ~drafted.row_mask()
+        mask = np.ones(self.size, dtype=bool)
+        for name in drafted:
+            for player_id in self._ids_by_name.get(name, ()):
+                mask[player_id] = False
+        return mask
+
+    def sort_order(self, column: str, position: Optional[str] = None) -> np.ndarray:
+        """Ids ranked by a column (best first, missing last), built once per pool"""
+        key = (column, position)
+        order = self._sort_orders.get(key)
+        if order is None:
+            if position is None:
+                values = {'VOR': self.vor, 'ceiling': self.ceiling, 'ADP': self.adp}.get(column)
+                if values is None:
+                    values = _float_column(self.frame, column, np.nan)
+                order = np.argsort(sort_keys(values, SORT_KEYS.get(column, True)), kind='stable').astype(np.int32)
+            else:
+                # a stable filter of the full order keeps the same tie-breaking
+                order = self.sort_order(column)
+                order = order[self.pos[order] == self.position_code(position)]
+            self._sort_orders[key] = order
+        return order
+
+    def top_available(self, column: str, drafted: Iterable[str], n: int, position: Optional[str] = None) -> np.ndarray:
+        """First n undrafted ids in a column's fixed order"""
+        available = self.available_mask(drafted)
+        order = self.sort_order(column, position)
+        # scan from the front in chunks; drafted players cluster near the top
+        found = []
+        needed = n
+        chunk = max(64, 2 * n)
+        for start in range(0, len(order), chunk):
+            ids = order[start:start + chunk]
+            ids = ids[available[ids]][:needed]
+            found.append(ids)
+            needed -= len(ids)
+            if needed <= 0:
+                break
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int32)
+
+    def scoring_inputs(self) -> Dict[str, np.ndarray]:
+        return {
+            'vor': self.vor,
+            'tier': np.where(self.tier == NO_TIER, np.nan, self.tier.astype(np.float64)),
+            'dropoff': self.dropoff,
+            'adp': self.adp,
+            'floor': self.floor,
+            'ceiling': self.ceiling,
+            'uncertainty': self.uncertainty,
+        }
+
+    def to_frame(self, ids: np.ndarray) -> pd.DataFrame:
+        """Display rows for the given ids, in the given order"""
+        return self.frame.iloc[ids]
+
+    def row(self, player_id: int) -> pd.Series:
+        return self.frame.iloc[int(player_id)]
+
+
+class DraftedSet:
+    """Set of drafted player names stored as a bool mask over the pool's name ids"""
+
+    def __init__(self, pool: PlayerPool, names: Iterable[str] = ()):
+        self.pool = pool
+        self.mask = np.zeros(len(pool.unique_names), dtype=bool)
+        # names the projections don't know about (e.g. from ESPN) are kept as strings
+        self.unknown: Set[str] = set()
+        self.update(names)
+
+    @classmethod
+    def coerce(cls, pool: PlayerPool, drafted: Iterable[str]) -> 'DraftedSet':
+        """Copy of drafted as a DraftedSet over pool"""
+        if isinstance(drafted, DraftedSet) and drafted.pool is pool:
+            return drafted.copy()
+        return cls(pool, drafted)
+
+    def add(self, name: str):
+        name_id = self.pool.name_id(name)
+        if name_id >= 0:
+            self.mask[name_id] = True
+        else:
+            self.unknown.add(name)
+
+    def discard(self, name: str):
+        name_id = self.pool.name_id(name)
+        if name_id >= 0:
+            self.mask[name_id] = False
+        else:
+            self.unknown.discard(name)
+
+    def update(self, names: Iterable[str]):
+        if isinstance(names, DraftedSet) and names.pool is self.pool:
+            self.mask |= names.mask
+            self.unknown |= names.unknown
+            return
+        for name in names:
+            self.add(name)
+
+    def clear(self):
+        self.mask[:] = False
+        self.unknown.clear()
+
+    def copy(self) -> 'DraftedSet':
+        drafted = DraftedSet.__new__(DraftedSet)
+        drafted.pool = self.pool
+        drafted.mask = self.mask.copy()
+        drafted.unknown = set(self.unknown)
+        return drafted
+
+    def row_mask(self) -> np.ndarray:
+        """Boolean mask over pool rows of drafted players"""
+        return self.mask[self.pool.name_ids]
+
+    def changed_rows(self, other: 'DraftedSet') -> np.ndarray:
+        """Pool rows whose drafted flag differs between self and other"""
+        changed = self.mask != other.mask
+        return np.flatnonzero(changed[self.pool.name_ids])
+
+    def changed_name_ids(self, other: 'DraftedSet') -> np.ndarray:
+        """Name ids drafted in exactly one of self and other"""
+        return np.flatnonzero(self.mask != other.mask)
+
+    def __contains__(self, name: str) -> bool:
+        name_id = self.pool.name_id(name)
+        return bool(self.mask[name_id]) if name_id >= 0 else name in self.unknown
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.mask)) + len(self.unknown)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.pool.unique_names[self.mask]
+        yield from self.unknown
+
+    def __or__(self, other: Iterable[str]) -> 'DraftedSet':
+        drafted = self.copy()
+        drafted.update(other)
+        return drafted
+
+    def __ior__(self, other: Iterable[str]) -> 'DraftedSet':
+        self.update(other)
+        return self
@@ -0,0 +1,63 @@
+import heapq
+import numpy as np
+import pandas as pd
+from typing import Iterator, Optional
+
+
+def sort_keys(values: np.ndarray, descending: bool) -> np.ndarray:
+    """Ascending sort keys with missing values last, like sort_values(na_position='last')"""
+    keys = -np.asarray(values, dtype=np.float64) if descending else np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(keys), np.inf, keys)
+
+
+def top_k(values: np.ndarray, k: int, descending: bool = True) -> np.ndarray:
+    """Positions of the k best values in ranked order, ties kept in input order"""
+    keys = sort_keys(values, descending)
+    n = len(keys)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= n:
+        return np.argsort(keys, kind='stable')
+
+    # partial selection, then only the k winners get sorted
+    cutoff = keys[np.argpartition(keys, k - 1)[k - 1]]
+    better = np.flatnonzero(keys < cutoff)
+    tied = np.flatnonzero(keys == cutoff)[:k - len(better)]
+    chosen = np.concatenate([better, tied])
+    return chosen[np.argsort(keys[chosen], kind='stable')]
+
+
+class RankedPages:
+    """Player ids in ranked order, produced a page at a time without a full sort"""
+
+    def __init__(self, pool, ids: np.ndarray, values: np.ndarray, descending: bool = True):
+        self.pool = pool
+        keys = sort_keys(values, descending)
+        # heap entries carry the input position so ties come out in input order
+        self._heap = list(zip(keys.tolist(), range(len(ids)), np.asarray(ids).tolist()))
+        heapq.heapify(self._heap)
+        self._values = dict(zip(np.asarray(ids).tolist(), np.asarray(values).tolist()))
+        self.served = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self._heap)
+
+    def next_ids(self, n: int) -> np.ndarray:
+        count = min(n, len(self._heap))
+        ids = [heapq.heappop(self._heap)[2] for _ in range(count)]
+        self.served += count
+        return np.array(ids, dtype=np.int64)
+
+    def next_page(self, n: int, value_column: Optional[str] = None) -> pd.DataFrame:
+        """Display rows for the next n players, optionally with their ranking value"""
+        ids = self.next_ids(n)
+        page = self.pool.to_frame(ids)
+        if value_column is not None:
+            page = page.copy()
+            page[value_column] = [self._values[player_id] for player_id in ids.tolist()]
+        return page
+
+    def __iter__(self) -> Iterator[int]:
+        while self._heap:
+            yield int(self.next_ids(1)[0])
@@ -1,118 +1,297 @@
+import copy
+import time
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-from config import RECOMMENDATION_CONFIG, POSITION_LIMITS, TOTAL_TEAMS, YOUR_DRAFT_SLOT, POSITION_WEIGHTS, STARTING_LINEUP
+from availability_index import AvailabilityIndex
+from player_pool import NO_TIER, DraftedSet, PlayerPool
+from ranking import RankedPages, top_k
+from replacement import replacement_levels
+from tiering import DEFAULT_TIERS, optimal_tiers
+from state_cache import LRUCache, ZobristKeys
+from what_if import Scenario, board_terms, ranked_matrix
+from shadow import ShadowMode
+from anytime import AnytimeRecommendation
+from speculation import SPECULATIVE_BRANCHES, Speculator
+from perf import get_perf_stats, timed
+from scoring import BREAKDOWN_COLUMNS, SCORE_COLUMNS, score_breakdown, score_components, score_frame
+from config import LeagueConfig
+
+# columns of the per-position urgency table
+URGENCY_COLUMNS = ['opportunity_cost', 'cliff_pressure', 'roster_need', 'early_qb_penalty', 'total_urgency']
+
+# results kept per engine (and its forks) for draft states seen before
+RESULT_CACHE_SIZE = 256
+
 
 class RecommendationEngine:
     """Recommendation engine with two-layer position-first approach"""
     
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
-        self.available_df = None
-        self.drafted_players = set()
+    def __init__(self, df: pd.DataFrame, league_config: Optional[LeagueConfig] = None):
+        # projections are shared read-only, never copied per engine
+        self.df = df
+        self.league_config = league_config or LeagueConfig()
         self.drafted_positions = {}
         self.current_pick = 1
         
+        # typed column arrays back every hot path; frames are only built for display
+        self.pool = PlayerPool.for_frame(df)
+        self.drafted_players = DraftedSet(self.pool)
+        
+        # availability index is updated per pick instead of re-filtering the frame
+        self._index = AvailabilityIndex.from_pool(self.pool)
+        self._has_state = False
+        self._available_df = None
+        
+        # bumped on every update_draft_state; per-state caches are keyed on it
+        self._state_version = 0
+        self._urgency_cache: Dict[str, Dict[str, float]] = {}
+        self._urgency_version = -1
+        # per-position urgency rows, keyed on the position's board version and the pick/roster inputs
+        self._position_rows: Dict[str, tuple] = {}
+        
+        # scoring inputs never change, scores only change with the pick
+        self._score_inputs = self.pool.scoring_inputs()
+        self._scores = None
+        self._scores_pick = None
+        
+        # live tiers per position, keyed by which of its players are still on the board
+        self._tier_cache: Dict[str, tuple] = {}
+        
+        # results keyed by a Zobrist hash of the draft state; the drafted-set part
+        # is updated with one XOR per changed player. forks share the cache.
+        self._zobrist = ZobristKeys.for_pool(self.pool)
+        self._drafted_hash = 0
+        self.result_cache = LRUCache(RESULT_CACHE_SIZE)
+        
+        # optional check of sampled calls against the pandas reference
+        self.shadow: Optional[ShadowMode] = None
+        # background refinement behind the latest deadline-bound get_recommendations
+        self.refinement: Optional[AnytimeRecommendation] = None
+        # background warming of the result cache while opponents are on the clock
+        self.speculator: Optional[Speculator] = None
+        
+    @property
+    def available_df(self) -> Optional[pd.DataFrame]:
+        # built lazily for display code; the engine itself reads the index
+        if not self._has_state:
+            return None
+        if self._available_df is None:
+            self._available_df = self.df[self._index.available]
+        return self._available_df
+        
+    @timed('engine.state_update')
     def update_draft_state(self, drafted_players: set, drafted_positions: dict, current_pick: int):
+        drafted_players = DraftedSet.coerce(self.pool, drafted_players)
+        self._index.apply(self.drafted_players.changed_rows(drafted_players), drafted_players.row_mask())
+        self._drafted_hash ^= self._zobrist.names_hash(self.drafted_players.changed_name_ids(drafted_players))
+        for name in self.drafted_players.unknown ^ drafted_players.unknown:
+            self._drafted_hash ^= self._zobrist.name_key(name)
+        
         self.drafted_players = drafted_players
         self.drafted_positions = drafted_positions
         self.current_pick = current_pick
-        self.available_df = self.df[~self.df['Player'].isin(drafted_players)].copy()
+        self._has_state = True
+        self._available_df = None
+        self._state_version += 1
+        
+    @timed('engine.state_update')
+    def apply_pick(self, player_name: str, current_pick: Optional[int] = None, drafted_positions: Optional[dict] = None):
+        """Record a single pick without diffing the whole drafted set; only the
+        drafted player's position has to be recomputed"""
+        if player_name not in self.drafted_players:
+            self.drafted_players.add(player_name)
+            self._drafted_hash ^= self._zobrist.name_key(player_name)
+            for player_id in self.pool.ids_for_name(player_name):
+                self._index.mark_drafted(player_id)
+        if drafted_positions is not None:
+            self.drafted_positions = drafted_positions
+        self.current_pick = current_pick if current_pick is not None else self.current_pick + 1
+        self._has_state = True
+        self._available_df = None
+        self._state_version += 1
+        
+    def state_key(self) -> tuple:
+        """Hash of (drafted players, our roster counts, current pick) plus the league settings"""
+        state_hash = (self._drafted_hash ^ self._zobrist.roster_hash(self.drafted_positions)
+                      ^ self._zobrist.pick_key(self.current_pick))
+        return state_hash, self.league_config.cache_key()
+    
+    def _cached(self, name: str, args: tuple, compute):
+        if not self._has_state:
+            return compute(*args)
+        key = (name, args, self.state_key())
+        result = self.result_cache.get(key)
+        if result is None:
+            result = compute(*args)
+            self.result_cache.put(key, result)
+        # callers get their own copy; the cache is shared with forks and background threads
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        return copy.deepcopy(result)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        return self.result_cache.stats()
+    
+    def get_perf_stats(self, prefix: str = '') -> Dict[str, Dict[str, any]]:
+        """Per-stage timings recorded while perf.recording() (or perf.enable()) is on;
+        stage times include the stages they call"""
+        return get_perf_stats(prefix)
+    
+    def enable_shadow(self, sample_rate: float = 1.0, tolerance: float = 1e-6, seed: Optional[int] = None) -> ShadowMode:
+        """Check a sample of recommendation calls against the straightforward pandas
+        reference; divergences and timings are kept on the returned ShadowMode"""
+        self.shadow = ShadowMode(sample_rate, tolerance, seed)
+        return self.shadow
+    
+    def disable_shadow(self):
+        self.shadow = None
+    
+    def _shadowed(self, call: str, args: tuple, compute, top_n: int, position: Optional[str] = None):
+        shadow = self.shadow
+        if shadow is None or not self._has_state or not shadow.sample():
+            return self._cached(call, args, compute)
+        # hits are still checked, but their time says nothing about the fast path
+        cached = (call, args, self.state_key()) in self.result_cache
+        start = time.perf_counter()
+        result = self._cached(call, args, compute)
+        shadow.check(self, call, result, time.perf_counter() - start, top_n, position, cached)
+        return result
+        
+    def fork(self) -> 'RecommendationEngine':
+        """Independent engine for what-if branches; projections and caches are shared"""
+        engine = copy.copy(self)
+        engine._index = self._index.copy()
+        engine.drafted_players = self.drafted_players.copy()
+        engine.drafted_positions = dict(self.drafted_positions)
+        engine._position_rows = dict(self._position_rows)
+        engine.refinement = None
+        engine.speculator = None
+        return engine
+        
+    def speculate(self, top_n: int = 10, branches: int = SPECULATIVE_BRANCHES, seed: Optional[int] = None) -> Optional[Speculator]:
+        """While opponents pick, warm recommendations and insights for the likeliest
+        boards at our next pick (predicted from ADP). Calling again for the same state
+        keeps the running speculation; a new state replaces it."""
+        if not self._has_state or self.league_config.is_my_pick(self.current_pick):
+            return None
+        key = (self.state_key(), top_n)
+        if self.speculator is not None:
+            if self.speculator.key == key:
+                return self.speculator
+            self.speculator.cancel()
+        current_round = self.league_config.current_round(self.current_pick)
+        target_pick = next(pick for pick in self.league_config.next_picks(current_round) if pick > self.current_pick)
+        worker = self.fork()
+        worker.shadow = None
+        self.speculator = Speculator(worker, target_pick, top_n, key, branches, seed)
+        return self.speculator
         
     def _calculate_next_picks(self, current_round: int) -> List[int]:
-        next_picks = []
-        for i in range(3):
-            round_num = current_round + i
-            if round_num % 2 == 1:
-                pick_num = (round_num - 1) * TOTAL_TEAMS + YOUR_DRAFT_SLOT + 1
-            else:
-                pick_num = round_num * TOTAL_TEAMS - YOUR_DRAFT_SLOT
-            next_picks.append(pick_num)
-        return next_picks
+        return self.league_config.next_picks(current_round)
     
     def get_position_urgency(self, position: str) -> float:
         """Calculate position urgency using within-position normalization"""
-        if self.available_df is None or len(self.available_df) == 0:
-            return 0
-            
-        pos_players = self.available_df[self.available_df['Position'] == position]
-        if len(pos_players) == 0:
-            return 0
-            
+        components = self._urgency_components(position)
+        return components['total_urgency'] if components else 0
+    
+    def _urgency_table(self) -> Dict[str, Dict[str, float]]:
+        """Urgency components for every position, computed once per draft state"""
+        if self._urgency_version != self._state_version:
+            self._urgency_cache = self._compute_urgency_table()
+            self._urgency_version = self._state_version
+        return self._urgency_cache
+    
+    def _urgency_components(self, position: str) -> Dict[str, float]:
+        return self._urgency_table().get(position, {})
+    
+    def get_position_urgencies(self) -> pd.DataFrame:
+        """Urgency components (columns) for every position with players left (rows)"""
+        table = self._urgency_table()
+        return pd.DataFrame([list(row.values()) for row in table.values()], index=list(table), columns=URGENCY_COLUMNS, dtype=float)
+    
+    @timed('engine.urgency')
+    def _compute_urgency_table(self) -> Dict[str, Dict[str, float]]:
+        if not self._has_state or self._index.count() == 0:
+            return {}
+        pool = self.pool
+        
         # Get current round and next picks
-        current_round = (self.current_pick - 1) // TOTAL_TEAMS + 1
-        next_picks = self._calculate_next_picks(current_round)
+        current_round = self.league_config.current_round(self.current_pick)
+        next_pick = self._calculate_next_picks(current_round)[0]
         
-        # top now and who is expected to be available next
-        top_now = pos_players.loc[pos_players['VOR'].idxmax()]
+        lineup = self.league_config.starting_lineup
+        # flex share for RB/WR/TE
+        total_flex_candidates = sum(self.drafted_positions.get(p, 0) for p in ['RB', 'WR', 'TE'])
+        flex_open = total_flex_candidates < lineup.get('FLEX', 0)
         
+        # every position with players left; rows are reused for positions nobody drafted from
+        return {position: self._position_urgency(position, next_pick, current_round, flex_open)
+                for position in pool.position_names if self._index.count(position) > 0}
+    
+    def _position_urgency(self, position: str, next_pick: int, current_round: int, flex_open: bool) -> Dict[str, float]:
+        """Urgency components for one position, cached until its board, our next pick
+        or the roster and round terms change"""
+        lineup = self.league_config.starting_lineup
+        drafted_count = self.drafted_positions.get(position, 0)
+        early_qb = position == 'QB' and current_round <= 6
+        fallback_depth = max(1, (next_pick - self.current_pick) // self.league_config.total_teams)
+        key = (self._index.position_version(position), next_pick, fallback_depth, drafted_count, flex_open, early_qb)
+        cached = self._position_rows.get(position)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        count = self._index.count(position)
+        # top now: best VOR, ties in frame order like idxmax()
+        top_now = self._index.best_by_vor(position)
+        
+        # within-position normalization (percentile ranks, 1.0 is the best available)
+        vor_pct_now = 1 - self._index.vor_rank(top_now) / count
         # expected best available at next pick
-        expected_next = self._get_expected_player_at_pick(position, next_picks[0])
+        expected = self._expected_player_id(position, next_pick)
+        vor_pct_next = 1 - self._index.vor_rank(expected) / count if expected is not None else 0.5
         
-        # within-position normalization (percentile ranks)
-        all_pos_vor = pos_players['VOR'].sort_values(ascending=False)
-        vor_pct_now = (all_pos_vor == top_now['VOR']).idxmax() / len(all_pos_vor)
-        vor_pct_next = (all_pos_vor == expected_next['VOR']).idxmax() / len(all_pos_vor) if expected_next is not None else 0.5
-        
-        # cliff pressure (dropoff)
-        drop_now = top_now.get('dropoff', 0)
-        drop_norm = min(1.0, drop_now / 25.0) if not pd.isna(drop_now) else 0
+        # cliff pressure (live dropoff to the next available player)
+        drop_now = self._index.live_dropoff(top_now)
+        drop_norm = 0.0 if np.isnan(drop_now) else min(1.0, drop_now / 25.0)
         
         # roster need (starters & flex)
-        drafted_count = self.drafted_positions.get(position, 0)
-        starter_need = max(0, STARTING_LINEUP.get(position, 0) - drafted_count) / max(1, STARTING_LINEUP.get(position, 1))
-        
-        # flex share for RB/WR/TE
-        flex_need = 0
-        if position in ['RB', 'WR', 'TE']:
-            total_flex_candidates = sum(self.drafted_positions.get(pos, 0) for pos in ['RB', 'WR', 'TE'])
-            if total_flex_candidates < STARTING_LINEUP.get('FLEX', 0):
-                flex_need = 0.5
+        starters = lineup.get(position, 0)
+        starter_need = max(0, starters - drafted_count) / max(1, lineup.get(position, 1))
+        flex_need = 0.5 if position in ['RB', 'WR', 'TE'] and flex_open else 0
         
         # diminishing returns penalty
-        diminishing_penalty = 0
-        if drafted_count >= STARTING_LINEUP.get(position, 0) + (1 if flex_need > 0 else 0):
-            diminishing_penalty = -0.2
+        diminishing_penalty = -0.2 if drafted_count >= starters + (flex_need > 0) else 0
         
         # step 5: Early-QB rule (1-QB leagues)
-        early_qb_penalty = 0
-        if position == 'QB' and current_round <= 6:
-            early_qb_penalty = 12
-        
-        # position urgency calculation
-        pos_urgency = (
-            60 * (vor_pct_now - vor_pct_next) +  # opportunity cost if you wait
-            25 * drop_norm +                      # cliff pressure
-            15 * (starter_need + flex_need + diminishing_penalty) -  # roster need
-            early_qb_penalty
-        )
-        
-        return pos_urgency
+        early_qb_penalty = 12 if early_qb else 0
+        
+        opportunity_cost = 60 * (vor_pct_now - vor_pct_next)  # opportunity cost if you wait
+        cliff_pressure = 25 * drop_norm
+        roster_need = 15 * (starter_need + flex_need + diminishing_penalty)
+        # the total is summed from the same terms the breakdown reports
+        total_urgency = opportunity_cost + cliff_pressure + roster_need - early_qb_penalty
+        row = dict(zip(URGENCY_COLUMNS, map(float, (
+            opportunity_cost, cliff_pressure, roster_need, -early_qb_penalty, total_urgency))))
+        self._position_rows[position] = (key, row)
+        return row
     
-    def _get_expected_player_at_pick(self, position: str, target_pick: int) -> Optional[pd.Series]:
+    @timed('engine.expected_player')
+    def _expected_player_id(self, position: str, target_pick: int) -> Optional[int]:
         # estimate which player will be available at a specific pick
-        pos_players = self.available_df[self.available_df['Position'] == position]
-        if len(pos_players) == 0:
+        count = self._index.count(position)
+        if count == 0:
             return None
-            
-        # sort by ADP, then by VOR as fallback
-        pos_players = pos_players.copy()
-        pos_players['adp_num'] = pd.to_numeric(pos_players['ADP'], errors='coerce')
-        
-        # filter to players likely available at target pick
-        available_at_pick = pos_players[
-            (pos_players['adp_num'] >= target_pick) | 
-            (pos_players['adp_num'].isna())
-        ]
         
-        if len(available_at_pick) > 0:
-            # return the highest VOR player likely available
-            return available_at_pick.loc[available_at_pick['VOR'].idxmax()]
+        # highest VOR player likely available (ADP at or after the pick, or unknown)
+        best = self._index.best_by_vor_from_adp(position, target_pick)
+        if best is not None:
+            return best
         
         # fallback: return the k-th remaining player (where k is reasonable)
-        k = max(1, (target_pick - self.current_pick) // TOTAL_TEAMS)
-        if k < len(pos_players):
-            return pos_players.nlargest(k, 'VOR').iloc[-1]
+        k = max(1, (target_pick - self.current_pick) // self.league_config.total_teams)
+        if k < count:
+            return self._index.nth_by_vor(position, k)
         
         return None
     
@@ -120,143 +299,186 @@ class RecommendationEngine:
         # get the position with highest urgency
         positions = ['RB', 'WR', 'TE', 'QB']
         position_urgencies = {}
+        urgencies = self._urgency_table()
         
         for pos in positions:
-            # skip if at position limit
-            if self.drafted_positions.get(pos, 0) >= POSITION_LIMITS.get(pos, 999):
+            if self._position_blocked(pos):
                 position_urgencies[pos] = -999
                 continue
-            if pos in ['QB', 'K', 'DST'] and self.drafted_positions.get(pos, 0) >= 1:
-                position_urgencies[pos] = -999
-                continue
-            urgency = self.get_position_urgency(pos)
-            position_urgencies[pos] = urgency
+            position_urgencies[pos] = urgencies.get(pos, {}).get('total_urgency', 0)
         
         # return position with highest urgency
         return max(position_urgencies, key=position_urgencies.get)
     
-    def calculate_player_score(self, player_row: pd.Series) -> float:
-        """Calculate player score within a position using the new system"""
-        current_round = (self.current_pick - 1) // TOTAL_TEAMS + 1
-        
-        # Base VOR score (70% weight)
-        vor_score = player_row['VOR'] * 0.70
-        
-        # Tier bonus (15% weight)
-        tier = player_row.get('Tier', 10)
-        if not pd.isna(tier):
-            tier = int(tier)
-            tier_bonus = max(0, (6 - tier)) * 1.5  
-        else:
-            tier_bonus = 0
-        
-        # Cliff bonus (10% weight)
-        dropoff = player_row.get('dropoff', 0)
-        if not pd.isna(dropoff):
-            if dropoff > 25:
-                cliff_bonus = 10
-            elif dropoff > 15:
-                cliff_bonus = 5
-            else:
-                cliff_bonus = 0
-        else:
-            cliff_bonus = 0
-        
-        # ADP value (5% weight)
-        adp_value = self._calculate_adp_value_simple(player_row)
-        
-        # Risk tilt based on round
-        risk_tilt = self._calculate_risk_tilt(player_row, current_round)
-        
-        # Reach cost
-        reach_cost = self._calculate_reach_cost(player_row)
-        
-        # Total score
-        total_score = (
-            vor_score +
-            tier_bonus * 0.15 +
-            cliff_bonus * 0.10 +
-            adp_value * 0.05 +
-            risk_tilt -
-            reach_cost
-        )
-        
-        return total_score
-    
-    def _calculate_adp_value_simple(self, player_row: pd.Series) -> float:
-        """Simplified ADP value calculation"""
-        adp = player_row.get('ADP', 'NA')
-        if pd.isna(adp) or adp == 'NA':
-            return 0
-            
-        try:
-            adp = float(adp)
-            if adp > self.current_pick + 12:  # going 1+ rounds later
-                return 5
-            elif adp > self.current_pick + 6:  # going 0.5+ rounds later
-                return 3
-        except (ValueError, TypeError):
-            pass
-        
-        return 0
-    
-    def _calculate_risk_tilt(self, player_row: pd.Series, current_round: int) -> float:
-        # calculate risk tilt based on draft round
-        vor = player_row['VOR']
-        floor = player_row.get('floor', vor)
-        ceiling = player_row.get('ceiling', vor)
-        uncertainty = player_row.get('uncertainty', 0)
-        
-        if pd.isna(floor) or pd.isna(ceiling):
-            return 0
-        
-        if current_round <= 5:  # early rounds - prefer floor
-            risk_tilt = (floor - vor) * 0.2 - uncertainty * 0.1
-        elif current_round <= 8:  # middle rounds - blend
-            risk_tilt = ((floor + ceiling) / 2 - vor) * 0.1 - uncertainty * 0.05
-        else:  # late rounds - prefer ceiling
-            risk_tilt = (ceiling - vor) * 0.2 - uncertainty * 0.05
-        
-        return risk_tilt
+    def _position_blocked(self, pos: str) -> bool:
+        # skip if at position limit (or the starting slots for QB/K/DST)
+        return self.drafted_positions.get(pos, 0) >= self.league_config.recommendation_cap(pos)
     
-    def _calculate_reach_cost(self, player_row: pd.Series) -> float:
-        # calculate reach penalty
-        adp = player_row.get('ADP', 'NA')
-        if pd.isna(adp) or adp == 'NA':
-            return 0
+    def candidate_scenarios(self, top_n: int = 10, take: bool = False) -> List[Scenario]:
+        """One scenario per top candidate by composite score: gone before our pick,
+        or with take=True, on our roster with the draft one pick further on"""
+        ids = self._index.available_rows()
+        scores = self._pool_scores()['composite_score'][ids]
+        scenarios = []
+        for player_id in ids[top_k(scores, top_n)]:
+            name = self.pool.names[player_id]
+            if not take:
+                scenarios.append(Scenario(name, drafted=[name]))
+                continue
+            position = self.pool.position_names[self.pool.pos[player_id]]
+            roster = dict(self.drafted_positions)
+            roster[position] = roster.get(position, 0) + 1
+            scenarios.append(Scenario(name, drafted=[name], current_pick=self.current_pick + 1, drafted_positions=roster))
+        return scenarios
+    
+    def slot_scenarios(self) -> List[Scenario]:
+        """The current board seen from every draft slot"""
+        return [Scenario(f"slot {slot + 1}", draft_slot=slot) for slot in range(self.league_config.total_teams)]
+    
+    @timed('engine.what_if')
+    def evaluate_scenarios(self, scenarios: List[Scenario], top_n: int = 1) -> Dict[str, pd.DataFrame]:
+        """Next-pick recommendation and position urgencies for many hypothetical states
+        at once. Each scenario is a row of one availability matrix, and every position is
+        evaluated for all rows in a single vectorized pass, so nothing is rebuilt per scenario.
+        Returns the recommended position, the top_n players and their scores, and the
+        total urgency per position (NaN where a position has no players left)."""
+        pool = self.pool
+        labels = [scenario.label for scenario in scenarios]
+        available = np.repeat(self._index.available[None, :], len(scenarios), axis=0)
+        for row, scenario in enumerate(scenarios):
+            for name in scenario.drafted:
+                available[row, self.pool.ids_for_name(name)] = False
+        
+        current_pick = np.array([scenario.current_pick or self.current_pick for scenario in scenarios], dtype=np.int64)
+        current_round = (current_pick - 1) // self.league_config.total_teams + 1
+        next_pick = np.empty(len(scenarios), dtype=np.int64)
+        for row, scenario in enumerate(scenarios):
+            config = self.league_config
+            if scenario.draft_slot is not None:
+                config = config.with_draft_slot(scenario.draft_slot)
+            next_pick[row] = config.next_picks(int(current_round[row]))[0]
+        rosters = [self.drafted_positions if scenario.drafted_positions is None else scenario.drafted_positions
+                   for scenario in scenarios]
+        
+        lineup = self.league_config.starting_lineup
+        flex_open = np.array([sum(roster.get(p, 0) for p in ['RB', 'WR', 'TE']) < lineup.get('FLEX', 0)
+                              for roster in rosters])
+        urgencies = {}
+        for position in pool.position_names:
+            index = self._index.positions.get(position)
+            if index is None:
+                continue
+            count, vor_pct_now, vor_pct_next, drop_now = board_terms(
+                index, pool.adp, available, next_pick, current_pick, self.league_config.total_teams)
+            drop_norm = np.where(np.isnan(drop_now), 0.0, np.minimum(1.0, drop_now / 25.0))
             
-        try:
-            adp = float(adp)
-            reach_amount = self.current_pick - adp
+            # roster terms, as in _position_urgency
+            drafted_count = np.array([roster.get(position, 0) for roster in rosters])
+            starters = lineup.get(position, 0)
+            starter_need = np.maximum(0, starters - drafted_count) / max(1, lineup.get(position, 1))
+            flex_need = np.where(flex_open, 0.5, 0) if position in ['RB', 'WR', 'TE'] else np.zeros(len(scenarios))
+            diminishing_penalty = np.where(drafted_count >= starters + (flex_need > 0), -0.2, 0)
+            early_qb_penalty = np.where(current_round <= 6, 12, 0) if position == 'QB' else 0
             
-            if reach_amount > 12:  # reaching by more than 1 round
-                return 15
-            elif reach_amount > 6:  # reaching by more than 0.5 rounds
-                return reach_amount * 1.25
-        except (ValueError, TypeError):
-            pass
+            total = (60 * (vor_pct_now - vor_pct_next) + 25 * drop_norm
+                     + 15 * (starter_need + flex_need + diminishing_penalty) - early_qb_penalty)
+            urgencies[position] = np.where(count > 0, total, np.nan)
+        urgency_frame = pd.DataFrame(urgencies, index=labels, dtype=float)
         
-        return 0
+        # recommended position, with the same limits as get_recommended_position
+        positions = ['RB', 'WR', 'TE', 'QB']
+        candidates = np.column_stack([np.nan_to_num(urgency_frame[pos].to_numpy(), nan=0.0) if pos in urgency_frame
+                                      else np.zeros(len(scenarios)) for pos in positions])
+        for row, roster in enumerate(rosters):
+            for column, pos in enumerate(positions):
+                if roster.get(pos, 0) >= self.league_config.recommendation_cap(pos):
+                    candidates[row, column] = -999
+        recommended = np.array(positions, dtype=object)[candidates.argmax(axis=1)]
+        
+        # composite scores only depend on the pick
+        picks, pick_rows = np.unique(current_pick, return_inverse=True)
+        scores = np.stack([score_components(self._score_inputs, int(pick), self.league_config.current_round(int(pick)))['composite_score']
+                           for pick in picks])[pick_rows]
+        ranked = np.full((len(scenarios), top_n), -1, dtype=np.int64)
+        for position in positions:
+            rows = np.flatnonzero(recommended == position)
+            if len(rows) and position in self._index.positions:
+                top = ranked_matrix(self._index.positions[position].rows, scores[rows], available[rows], top_n)
+                ranked[rows, :top.shape[1]] = top
+        
+        columns = range(1, top_n + 1)
+        names = np.where(ranked >= 0, pool.names[np.maximum(ranked, 0)], None)
+        ranked_scores = np.where(ranked >= 0, np.take_along_axis(scores, np.maximum(ranked, 0), axis=1), np.nan)
+        return {
+            'recommended_position': pd.Series(recommended, index=labels, name='recommended_position'),
+            'players': pd.DataFrame(names, index=labels, columns=columns),
+            'scores': pd.DataFrame(ranked_scores, index=labels, columns=columns),
+            'urgencies': urgency_frame,
+        }
+    
+    def _pool_scores(self) -> Dict[str, np.ndarray]:
+        """Score components for the whole pool at the current pick, computed once per pick"""
+        if self._scores is None or self._scores_pick != self.current_pick:
+            self._scores = self._score_pool()
+            self._scores_pick = self.current_pick
+        return self._scores
+    
+    @timed('engine.scoring')
+    def _score_pool(self) -> Dict[str, np.ndarray]:
+        current_round = self.league_config.current_round(self.current_pick)
+        return score_components(self._score_inputs, self.current_pick, current_round)
     
-    def get_recommendations(self, top_n: int = 10) -> pd.DataFrame:
+    def _player_components(self, player_row: pd.Series) -> Dict[str, float]:
+        """Cached score components for a row of the projections frame"""
+        row = self.df.index.get_indexer([player_row.name])[0] if player_row.name is not None else -1
+        if row >= 0 and self.pool.names[row] == player_row.get('Player'):
+            scores = self._pool_scores()
+            return {column: scores[column][row] for column in SCORE_COLUMNS}
+        # rows from outside the projections frame are scored on their own
+        current_round = self.league_config.current_round(self.current_pick)
+        return score_frame(player_row.to_frame().T, self.current_pick, current_round).iloc[0].to_dict()
+    
+    def calculate_player_score(self, player_row: pd.Series) -> float:
+        """Calculate player score within a position using the new system"""
+        return self._player_components(player_row)['composite_score']
+    
+    @timed('engine.recommendations')
+    def get_recommendations(self, top_n: int = 10, deadline_ms: Optional[float] = None) -> pd.DataFrame:
+        """Top players at the recommended position. With a deadline, the heuristic answer
+        comes back at once and a lookahead refines it in the background until the deadline;
+        calling again for the same draft state returns the best answer so far, with
+        'progress' and 'confidence' in its attrs."""
+        if deadline_ms is None or not self._has_state:
+            return self._shadowed('recommendations', (top_n,), self._compute_recommendations, top_n)
+        key = (self.state_key(), top_n)
+        if self.refinement is not None:
+            if self.refinement.key == key:
+                return self.refinement.best()
+            self.refinement.cancel()
+            self.refinement = None
+        heuristic = self._shadowed('recommendations', (top_n,), self._compute_recommendations, top_n)
+        if heuristic.empty:
+            return heuristic
+        worker = self.fork()
+        worker.shadow = None
+        self.refinement = AnytimeRecommendation(worker, heuristic, top_n, deadline_ms, key)
+        return self.refinement.best()
+    
+    def _compute_recommendations(self, top_n: int) -> pd.DataFrame:
         # get recommendations using the new two-layer system
-        if self.available_df is None or len(self.available_df) == 0:
+        if not self._has_state or self._index.count() == 0:
             return pd.DataFrame()
         
         # step 1: choose the position to draft
         recommended_position = self.get_recommended_position()
         
         # step 2: get top players within that position
-        pos_players = self.available_df[self.available_df['Position'] == recommended_position].copy()
-        
-        if len(pos_players) == 0:
+        ids = self._index.available_rows(recommended_position)
+        if len(ids) == 0:
             return pd.DataFrame()
         
-        # calculate player scores
-        pos_players['composite_score'] = pos_players.apply(self.calculate_player_score, axis=1)
-        
         # sort and return top recommendations
-        recommendations = pos_players.sort_values('composite_score', ascending=False).head(top_n)
+        recommendations = self._ranked_frame(ids, top_n)
         
         # add position urgency info
         urgency = self.get_position_urgency(recommended_position)
@@ -265,39 +487,60 @@ class RecommendationEngine:
         
         return recommendations
     
+    @timed('engine.sort')
+    def _ranked_frame(self, ids: np.ndarray, top_n: int) -> pd.DataFrame:
+        """Display frame of the top_n ids by composite score"""
+        scores = self._pool_scores()['composite_score'][ids]
+        order = top_k(scores, top_n)
+        ranked = self.pool.to_frame(ids[order]).copy()
+        ranked['composite_score'] = scores[order]
+        return ranked
+    
+    def iter_ranked_players(self, position: Optional[str] = None) -> RankedPages:
+        """Available players by composite score, served a page at a time"""
+        ids = self._index.available_rows(position) if self._has_state else np.empty(0, dtype=np.int64)
+        return RankedPages(self.pool, ids, self._pool_scores()['composite_score'][ids])
+    
+    @timed('engine.position_analysis')
     def get_position_analysis(self, position: str, top_n: int = 10) -> pd.DataFrame:
+        return self._shadowed('position_analysis', (position, top_n), self._compute_position_analysis, top_n, position)
+    
+    def _compute_position_analysis(self, position: str, top_n: int) -> pd.DataFrame:
         # get position analysis using the new scoring system
-        if self.available_df is None:
+        if not self._has_state:
             return pd.DataFrame()
             
-        pos_df = self.available_df[self.available_df['Position'] == position].copy()
-        if len(pos_df) == 0:
+        ids = self._index.available_rows(position)
+        if len(ids) == 0:
             return pd.DataFrame()
         
-        pos_df['composite_score'] = pos_df.apply(self.calculate_player_score, axis=1)
-        
-        return pos_df.sort_values('composite_score', ascending=False).head(top_n)
+        return self._ranked_frame(ids, top_n)
     
+    @timed('engine.insights')
     def get_strategic_insights(self) -> Dict[str, any]:
         """Get strategic insights including position urgency"""
-        if self.available_df is None:
+        return self._cached('strategic_insights', (), self._compute_strategic_insights)
+    
+    def _compute_strategic_insights(self) -> Dict[str, any]:
+        if not self._has_state:
             return {}
         
         insights = {
-            'total_available': len(self.available_df),
-            'position_counts': self.available_df['Position'].value_counts().to_dict(),
-            'tier_breakdown': self.available_df['Tier'].value_counts().sort_index().to_dict(),
+            'total_available': self._index.count(),
+            'position_counts': self._index.position_counts(),
+            'tier_breakdown': self._tier_breakdown(),
             'position_urgencies': {},
             'recommended_position': None,
             'cliffs_detected': {},
+            'live_top_tier': {},
             'value_opportunities': []
         }
         
         # Calculate position urgencies
+        urgencies = self._urgency_table()
         for pos in ['RB', 'WR', 'TE', 'QB']:
-            if self.drafted_positions.get(pos, 0) < POSITION_LIMITS.get(pos, 999):
-                urgency = self.get_position_urgency(pos)
-                insights['position_urgencies'][pos] = urgency
+            if self.drafted_positions.get(pos, 0) < self.league_config.position_limits.get(pos, 999):
+                insights['position_urgencies'][pos] = urgencies.get(pos, {}).get('total_urgency', 0)
         
         # Get recommended position
         if insights['position_urgencies']:
@@ -305,78 +548,84 @@ class RecommendationEngine:
         
         # Cliff detection
         for pos in ['RB', 'WR', 'TE']:
-            pos_players = self.available_df[self.available_df['Position'] == pos].sort_values('VOR', ascending=False)
-            if len(pos_players) > 1:
-                top_vor = pos_players.iloc[0]['VOR']
-                second_vor = pos_players.iloc[1]['VOR']
-                dropoff = top_vor - second_vor
+            if self._index.count(pos) > 1:
+                dropoff = self._index.live_dropoff(self._index.best_by_vor(pos))
                 
                 if dropoff > 20:
                     insights['cliffs_detected'][pos] = f"Cliff: {dropoff:.1f} VOR drop"
         
+        # players left in each position's best live tier
+        for pos in ['RB', 'WR', 'TE', 'QB']:
+            _, tiers = self._position_live_tiers(pos)
+            if len(tiers):
+                insights['live_top_tier'][pos] = int(np.count_nonzero(tiers == 1))
+        
         return insights
     
+    def _position_live_tiers(self, position: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Available rows at a position in VOR order and their re-clustered tiers"""
+        rows = self._index.available_by_vor(position)
+        rows = rows[~np.isnan(self.pool.vor[rows])]
+        key = rows.tobytes()
+        cached = self._tier_cache.get(position)
+        if cached is not None and cached[0] == key:
+            return rows, cached[1]
+        
+        # as many tiers as the projections still have at this position
+        source_tiers = self.pool.tier[rows]
+        k = len(np.unique(source_tiers[source_tiers != NO_TIER])) or DEFAULT_TIERS
+        tiers = optimal_tiers(self.pool.vor[rows], k)
+        self._tier_cache[position] = (key, tiers)
+        return rows, tiers
+    
+    def get_live_tiers(self, position: Optional[str] = None) -> pd.Series:
+        """Tiers re-clustered from VOR over the players still on the board, best first per position"""
+        if not self._has_state:
+            return pd.Series(dtype='int8', name='Tier')
+        positions = [position] if position is not None else self.pool.position_names
+        rows, tiers = [], []
+        for pos in positions:
+            pos_rows, pos_tiers = self._position_live_tiers(pos)
+            rows.append(pos_rows)
+            tiers.append(pos_tiers)
+        rows = np.concatenate(rows)
+        return pd.Series(np.concatenate(tiers), index=self.df.index[rows], name='Tier')
+    
+    def get_replacement_levels(self, live: bool = True) -> Dict[str, float]:
+        """Replacement points per position for this league; live levels account for
+        starting slots already filled by drafted players"""
+        if not live or not self._has_state:
+            return replacement_levels(self.pool, self.league_config)
+        available = self._index.available
+        counts = np.bincount(self.pool.pos[~available], minlength=len(self.pool.position_names))
+        drafted_counts = dict(zip(self.pool.position_names, counts.tolist()))
+        return replacement_levels(self.pool, self.league_config, available, drafted_counts)
+    
+    def _tier_breakdown(self) -> Dict[int, int]:
+        # read from the index's per-position tier counters
+        return self._index.tier_counts()
+    
     def get_detailed_score_breakdown(self, player_row: pd.Series) -> Dict[str, float]:
         """Get detailed breakdown of player scoring components"""
-        current_round = (self.current_pick - 1) // TOTAL_TEAMS + 1
-        
-        breakdown = {
-            'vor_score': player_row['VOR'] * 0.70,
-            'tier_bonus': max(0, (6 - int(player_row.get('Tier', 10)))) * 1.5 * 0.15,
-            'cliff_bonus': (10 if player_row.get('dropoff', 0) > 25 else 5 if player_row.get('dropoff', 0) > 15 else 0) * 0.10,
-            'adp_value': self._calculate_adp_value_simple(player_row) * 0.05,
-            'risk_tilt': self._calculate_risk_tilt(player_row, current_round),
-            'reach_cost': -self._calculate_reach_cost(player_row)
-        }
-        
-        breakdown['total_score'] = sum(breakdown.values())
-        return breakdown
+        components = self._player_components(player_row)
+        breakdown = score_breakdown({column: np.float64(value) for column, value in components.items()})
+        return {column: float(breakdown[column]) for column in BREAKDOWN_COLUMNS}
+    
+    def get_score_breakdowns(self, position: Optional[str] = None) -> pd.DataFrame:
+        """Score breakdown for every available player, best first, from the cached scoring pass"""
+        if not self._has_state:
+            return pd.DataFrame(columns=['Player', 'Position'] + BREAKDOWN_COLUMNS)
+        ids = self._index.available_rows(position)
+        breakdown = score_breakdown(self._pool_scores())
+        order = ids[top_k(breakdown['total_score'][ids], len(ids))]
+        table = self.pool.to_frame(order)[['Player', 'Position']].copy()
+        for column in BREAKDOWN_COLUMNS:
+            table[column] = breakdown[column][order]
+        return table
     
     def get_position_urgency_breakdown(self, position: str) -> Dict[str, float]:
         """Get detailed breakdown of position urgency calculation"""
-        if self.available_df is None or len(self.available_df) == 0:
-            return {}
-        
-        pos_players = self.available_df[self.available_df['Position'] == position]
-        if len(pos_players) == 0:
-            return {}
-        
-        current_round = (self.current_pick - 1) // TOTAL_TEAMS + 1
-        next_picks = self._calculate_next_picks(current_round)
-        
-        top_now = pos_players.loc[pos_players['VOR'].idxmax()]
-        expected_next = self._get_expected_player_at_pick(position, next_picks[0])
-        
-        # Calculate components
-        all_pos_vor = pos_players['VOR'].sort_values(ascending=False)
-        vor_pct_now = (all_pos_vor == top_now['VOR']).idxmax() / len(all_pos_vor)
-        vor_pct_next = (all_pos_vor == expected_next['VOR']).idxmax() / len(all_pos_vor) if expected_next is not None else 0.5
-        
-        drop_now = top_now.get('dropoff', 0)
-        drop_norm = min(1.0, drop_now / 25.0) if not pd.isna(drop_now) else 0
-        
-        drafted_count = self.drafted_positions.get(position, 0)
-        starter_need = max(0, STARTING_LINEUP.get(position, 0) - drafted_count) / max(1, STARTING_LINEUP.get(position, 1))
-        
-        flex_need = 0
-        if position in ['RB', 'WR', 'TE']:
-            total_flex_candidates = sum(self.drafted_positions.get(pos, 0) for pos in ['RB', 'WR', 'TE'])
-            if total_flex_candidates < STARTING_LINEUP.get('FLEX', 0):
-                flex_need = 0.5
-        
-        diminishing_penalty = 0
-        if drafted_count >= STARTING_LINEUP.get(position, 0) + (1 if flex_need > 0 else 0):
-            diminishing_penalty = -0.2
-        
-        early_qb_penalty = 12 if (position == 'QB' and current_round <= 6) else 0
-        
-        return {
-            'opportunity_cost': 60 * (vor_pct_now - vor_pct_next),
-            'cliff_pressure': 25 * drop_norm,
-            'roster_need': 15 * (starter_need + flex_need + diminishing_penalty),
-            'early_qb_penalty': -early_qb_penalty,
-            'total_urgency': 60 * (vor_pct_now - vor_pct_next) + 25 * drop_norm + 15 * (starter_need + flex_need + diminishing_penalty) - early_qb_penalty
-        }
+        return dict(self._urgency_components(position))
 
     # Legacy methods for backward compatibility
     def calculate_vor_score(self, player_row: pd.Series) -> float:
@@ -385,25 +634,15 @@ class RecommendationEngine:
     
     def calculate_tier_multiplier(self, player_row: pd.Series) -> float:
         """Legacy method"""
-        tier = player_row.get('Tier', 10)
-        if not pd.isna(tier):
-            tier = int(tier)
-            return max(0, (6 - tier)) * 1.5 * 0.15
-        return 0
+        return self._player_components(player_row)['tier_bonus'] * 0.15
     
     def calculate_dropoff_bonus(self, player_row: pd.Series, position: str) -> float:
         """Legacy method"""
-        dropoff = player_row.get('dropoff', 0)
-        if not pd.isna(dropoff):
-            if dropoff > 25:
-                return 10 * 0.10
-            elif dropoff > 15:
-                return 5 * 0.10
-        return 0
+        return self._player_components(player_row)['cliff_bonus'] * 0.10
     
     def calculate_adp_value(self, player_row: pd.Series) -> float:
         """Legacy method"""
-        return self._calculate_adp_value_simple(player_row) * 0.05
+        return self._player_components(player_row)['adp_value'] * 0.05
     
     def calculate_uncertainty_penalty(self, player_row: pd.Series) -> float:
         """Legacy method"""
@@ -418,8 +657,7 @@ class RecommendationEngine:
     
     def calculate_round_adjustment(self, player_row: pd.Series) -> float:
         """Legacy method"""
-        current_round = (self.current_pick - 1) // TOTAL_TEAMS + 1
-        return self._calculate_risk_tilt(player_row, current_round)
+        return self._player_components(player_row)['risk_tilt']
     
     def calculate_scoring_format_bonus(self, player_row: pd.Series) -> float:
         """Legacy method"""
@@ -0,0 +1,73 @@
+import weakref
+import numpy as np
+from typing import Dict, Optional
+from ranking import top_k
+
+# positions that can fill a FLEX slot
+FLEX_POSITIONS = ['RB', 'WR', 'TE']
+
+# recomputed VOR columns per pool, keyed by league lineup
+_VOR_CACHE = weakref.WeakKeyDictionary()
+
+
+def _points_orders(pool, available: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+    """Ids per position, most projected points first, limited to available players"""
+    orders = {}
+    for pos in pool.position_names:
+        order = pool.sort_order('points', pos)
+        if available is not None:
+            order = order[available[order]]
+        orders[pos] = order[~np.isnan(pool.points[order])]
+    return orders
+
+
+def starter_slots(pool, league_config, available: Optional[np.ndarray] = None,
+                  drafted_counts: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Starting slots left to fill per position across the league, with FLEX slots
+    going to the best leftover RB/WR/TE by points"""
+    teams = league_config.total_teams
+    lineup = league_config.starting_lineup
+    drafted_counts = drafted_counts or {}
+    orders = _points_orders(pool, available)
+
+    # drafted players fill their position's slots first, then FLEX
+    slots = {pos: max(0, teams * lineup.get(pos, 0) - drafted_counts.get(pos, 0)) for pos in pool.position_names}
+    flex = teams * lineup.get('FLEX', 0) - sum(max(0, drafted_counts.get(pos, 0) - teams * lineup.get(pos, 0))
+                                               for pos in FLEX_POSITIONS)
+    flex_positions = [pos for pos in FLEX_POSITIONS if pos in orders]
+    if flex > 0 and flex_positions:
+        leftovers = [orders[pos][slots[pos]:] for pos in flex_positions]
+        owners = np.repeat(np.arange(len(flex_positions)), [len(ids) for ids in leftovers])
+        winners = top_k(pool.points[np.concatenate(leftovers)], flex)
+        for owner, count in enumerate(np.bincount(owners[winners], minlength=len(flex_positions))):
+            slots[flex_positions[owner]] += int(count)
+    return slots
+
+
+def replacement_levels(pool, league_config, available: Optional[np.ndarray] = None,
+                       drafted_counts: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """Projected points of the best player left once every starting slot is filled.
+    Given the board (available mask and drafted players per position), slots already
+    filled by drafted players are taken out first."""
+    orders = _points_orders(pool, available)
+    slots = starter_slots(pool, league_config, available, drafted_counts)
+    levels = {}
+    for pos, order in orders.items():
+        if len(order):
+            # more slots than players leaves the last one as replacement
+            levels[pos] = float(pool.points[order[min(slots[pos], len(order) - 1)]])
+    return levels
+
+
+def compute_vor(pool, league_config) -> np.ndarray:
+    """Points over replacement for every player in a league, cached per lineup"""
+    cache = _VOR_CACHE.setdefault(pool, {})
+    key = league_config.lineup_key()
+    vor = cache.get(key)
+    if vor is None:
+        levels = replacement_levels(pool, league_config)
+        replacement = np.array([levels.get(pos, np.nan) for pos in pool.position_names])[pool.pos]
+        vor = pool.points - replacement
+        vor.flags.writeable = False
+        cache[key] = vor
+    return vor
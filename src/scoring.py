@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+
+# columns produced by score_components, in the order they add up
+SCORE_COLUMNS = ['vor_score', 'tier_bonus', 'cliff_bonus', 'adp_value', 'risk_tilt', 'reach_cost', 'composite_score']
+
+# weight of each raw component in composite_score (vor_score already carries its 70%)
+SCORE_WEIGHTS = {
+    'vor_score': 1.0,
+    'tier_bonus': 0.15,
+    'cliff_bonus': 0.10,
+    'adp_value': 0.05,
+    'risk_tilt': 1.0,
+    'reach_cost': -1.0,
+}
+
+# columns of a score breakdown: weighted contributions, then their total
+BREAKDOWN_COLUMNS = list(SCORE_WEIGHTS) + ['total_score']
+
+
+def _numeric_column(df: pd.DataFrame, column: str, default) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=np.float64)
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+
+def scoring_inputs(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Pull the numeric columns the scoring kernel needs out of a projections frame"""
+    vor = _numeric_column(df, 'VOR', np.nan)
+    return {
+        'vor': vor,
+        'tier': _numeric_column(df, 'Tier', np.nan),
+        'dropoff': _numeric_column(df, 'dropoff', 0.0),
+        'adp': _numeric_column(df, 'ADP', np.nan),
+        # missing floor/ceiling columns fall back to VOR like row.get() did
+        'floor': _numeric_column(df, 'floor', np.nan) if 'floor' in df.columns else vor,
+        'ceiling': _numeric_column(df, 'ceiling', np.nan) if 'ceiling' in df.columns else vor,
+        'uncertainty': _numeric_column(df, 'uncertainty', 0.0),
+    }
+
+
+def score_components(inputs: Dict[str, np.ndarray], current_pick: int, current_round: int) -> Dict[str, np.ndarray]:
+    """Score a whole player pool at once, returning every component as a column"""
+    vor, tier, dropoff, adp, floor, ceiling, uncertainty = (
+        np.asarray(inputs[key], dtype=np.float64)
+        for key in ('vor', 'tier', 'dropoff', 'adp', 'floor', 'ceiling', 'uncertainty')
+    )
+
+    # Base VOR score (70% weight)
+    vor_score = vor * 0.70
+
+    # Tier bonus (15% weight), missing tiers earn nothing
+    tier_bonus = np.where(np.isnan(tier), 0.0, np.maximum(0, 6 - np.trunc(np.nan_to_num(tier))) * 1.5)
+
+    # Cliff bonus (10% weight), NaN compares False and falls through to 0
+    cliff_bonus = np.where(dropoff > 25, 10.0, np.where(dropoff > 15, 5.0, 0.0))
+
+    # ADP value (5% weight)
+    adp_value = np.where(adp > current_pick + 12, 5.0, np.where(adp > current_pick + 6, 3.0, 0.0))
+
+    # Risk tilt based on round
+    if current_round <= 5:  # early rounds - prefer floor
+        risk_tilt = (floor - vor) * 0.2 - uncertainty * 0.1
+    elif current_round <= 8:  # middle rounds - blend
+        risk_tilt = ((floor + ceiling) / 2 - vor) * 0.1 - uncertainty * 0.05
+    else:  # late rounds - prefer ceiling
+        risk_tilt = (ceiling - vor) * 0.2 - uncertainty * 0.05
+    risk_tilt = np.where(np.isnan(floor) | np.isnan(ceiling), 0.0, risk_tilt)
+
+    # Reach cost
+    reach_amount = current_pick - adp
+    reach_cost = np.where(reach_amount > 12, 15.0, np.where(reach_amount > 6, reach_amount * 1.25, 0.0))
+
+    components = {
+        'vor_score': vor_score,
+        'tier_bonus': tier_bonus,
+        'cliff_bonus': cliff_bonus,
+        'adp_value': adp_value,
+        'risk_tilt': risk_tilt,
+        'reach_cost': reach_cost,
+    }
+
+    # composite is the weighted sum, in column order
+    composite_score = np.zeros_like(vor_score)
+    for column, weight in SCORE_WEIGHTS.items():
+        composite_score = composite_score + components[column] * weight
+    components['composite_score'] = composite_score
+    return components
+
+
+def score_breakdown(scores: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Weighted contribution of each component, taken from an existing scoring pass"""
+    breakdown = {column: scores[column] * weight for column, weight in SCORE_WEIGHTS.items()}
+    # the total is the composite itself, so explanations can't drift from the ranking
+    breakdown['total_score'] = scores['composite_score']
+    return breakdown
+
+
+def score_frame(df: pd.DataFrame, current_pick: int, current_round: int) -> pd.DataFrame:
+    """Component columns for every row of a projections frame"""
+    components = score_components(scoring_inputs(df), current_pick, current_round)
+    return pd.DataFrame(components, index=df.index, columns=SCORE_COLUMNS)
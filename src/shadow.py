@@ -0,0 +1,210 @@
+import random
+import time
+from collections import deque
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+# checked calls kept per shadow run
+SHADOW_HISTORY = 500
+
+
+def reference_player_score(player: pd.Series, current_pick: int, current_round: int) -> float:
+    """Composite score for one player, written out row by row like the original
+    engine did, so it shares no code with the vectorized scoring kernel"""
+    vor = player['VOR']
+
+    # Base VOR score (70% weight)
+    vor_score = vor * 0.70
+
+    # Tier bonus (15% weight)
+    tier = player.get('Tier', 10)
+    tier_bonus = 0 if pd.isna(tier) else max(0, (6 - int(tier))) * 1.5
+
+    # Cliff bonus (10% weight)
+    dropoff = player.get('dropoff', 0)
+    cliff_bonus = 0
+    if not pd.isna(dropoff):
+        if dropoff > 25:
+            cliff_bonus = 10
+        elif dropoff > 15:
+            cliff_bonus = 5
+
+    # ADP value (5% weight) and reach cost
+    adp = pd.to_numeric(player.get('ADP', np.nan), errors='coerce')
+    adp_value = 0
+    reach_cost = 0
+    if not pd.isna(adp):
+        if adp > current_pick + 12:
+            adp_value = 5
+        elif adp > current_pick + 6:
+            adp_value = 3
+        reach_amount = current_pick - adp
+        if reach_amount > 12:
+            reach_cost = 15
+        elif reach_amount > 6:
+            reach_cost = reach_amount * 1.25
+
+    # Risk tilt based on round
+    floor = player.get('floor', vor)
+    ceiling = player.get('ceiling', vor)
+    uncertainty = player.get('uncertainty', 0)
+    if pd.isna(floor) or pd.isna(ceiling):
+        risk_tilt = 0
+    elif current_round <= 5:
+        risk_tilt = (floor - vor) * 0.2 - uncertainty * 0.1
+    elif current_round <= 8:
+        risk_tilt = ((floor + ceiling) / 2 - vor) * 0.1 - uncertainty * 0.05
+    else:
+        risk_tilt = (ceiling - vor) * 0.2 - uncertainty * 0.05
+
+    return vor_score + tier_bonus * 0.15 + cliff_bonus * 0.10 + adp_value * 0.05 + risk_tilt - reach_cost
+
+
+class ReferenceEngine:
+    """Straightforward pandas version of the recommendation rules: filters the
+    projections frame on every call and recomputes everything from scratch.
+    Slow on purpose, so it shares nothing with the engine's indexes, caches or
+    scoring kernel."""
+
+    def __init__(self, df: pd.DataFrame, league_config):
+        self.df = df
+        self.league_config = league_config
+
+    def _board(self, drafted_players, position: str) -> pd.DataFrame:
+        available = self.df[~self.df['Player'].isin(list(drafted_players))]
+        players = available[available['Position'] == position].copy()
+        players['VOR'] = pd.to_numeric(players['VOR'], errors='coerce')
+        players['adp_num'] = pd.to_numeric(players['ADP'], errors='coerce')
+        return players.sort_values('VOR', ascending=False, kind='stable', na_position='last')
+
+    def position_urgency(self, drafted_players, drafted_positions: dict, current_pick: int, position: str) -> Optional[float]:
+        """Total urgency for one position, or None with nobody left there"""
+        players = self._board(drafted_players, position)
+        count = len(players)
+        if count == 0:
+            return None
+        vor = players['VOR']
+        current_round = self.league_config.current_round(current_pick)
+        next_pick = self.league_config.next_picks(current_round)[0]
+
+        def pct(player):
+            value = player['VOR']
+            ahead = vor.notna().sum() if pd.isna(value) else (vor > value).sum()
+            return 1 - ahead / count
+
+        top_now = players.iloc[0]
+        reachable = players[(players['adp_num'] >= next_pick) | players['adp_num'].isna()]
+        depth = max(1, (next_pick - current_pick) // self.league_config.total_teams)
+        if len(reachable):
+            vor_pct_next = pct(reachable.iloc[0])
+        elif depth < count:
+            vor_pct_next = pct(players.iloc[depth - 1])
+        else:
+            vor_pct_next = 0.5
+
+        drop_now = vor.iloc[0] - vor.iloc[1] if count >= 2 else np.nan
+        drop_norm = 0.0 if pd.isna(drop_now) else min(1.0, drop_now / 25.0)
+
+        lineup = self.league_config.starting_lineup
+        drafted_count = drafted_positions.get(position, 0)
+        starters = lineup.get(position, 0)
+        starter_need = max(0, starters - drafted_count) / max(1, lineup.get(position, 1))
+        flex_open = sum(drafted_positions.get(p, 0) for p in ['RB', 'WR', 'TE']) < lineup.get('FLEX', 0)
+        flex_need = 0.5 if position in ['RB', 'WR', 'TE'] and flex_open else 0
+        diminishing_penalty = -0.2 if drafted_count >= starters + (flex_need > 0) else 0
+        early_qb_penalty = 12 if position == 'QB' and current_round <= 6 else 0
+        return (60 * (pct(top_now) - vor_pct_next) + 25 * drop_norm
+                + 15 * (starter_need + flex_need + diminishing_penalty) - early_qb_penalty)
+
+    def recommended_position(self, drafted_players, drafted_positions: dict, current_pick: int) -> str:
+        urgencies = {}
+        for pos in ['RB', 'WR', 'TE', 'QB']:
+            if drafted_positions.get(pos, 0) >= self.league_config.recommendation_cap(pos):
+                urgencies[pos] = -999
+                continue
+            urgency = self.position_urgency(drafted_players, drafted_positions, current_pick, pos)
+            urgencies[pos] = 0 if urgency is None else urgency
+        return max(urgencies, key=urgencies.get)
+
+    def ranked(self, drafted_players, current_pick: int, position: str, top_n: int) -> pd.DataFrame:
+        """Top players at a position by composite score"""
+        players = self.df[~self.df['Player'].isin(list(drafted_players)) & (self.df['Position'] == position)].copy()
+        current_round = self.league_config.current_round(current_pick)
+        players['composite_score'] = [reference_player_score(player, current_pick, current_round)
+                                      for _, player in players.iterrows()]
+        return players.sort_values('composite_score', ascending=False, kind='stable').head(top_n)
+
+
+class ShadowMode:
+    """Runs the reference engine next to a sample of the engine's calls and records
+    every divergence in position choice, ranking or score, with both timings.
+    Cache hits are still checked but left out of the timing comparison."""
+
+    def __init__(self, sample_rate: float = 1.0, tolerance: float = 1e-6, seed: Optional[int] = None):
+        self.sample_rate = sample_rate
+        self.tolerance = tolerance
+        self._rng = random.Random(seed)
+        self.records = deque(maxlen=SHADOW_HISTORY)
+
+    def sample(self) -> bool:
+        return self.sample_rate >= 1 or self._rng.random() < self.sample_rate
+
+    def check(self, engine, call: str, result: pd.DataFrame, fast_seconds: float, top_n: int,
+              position: Optional[str] = None, cached: bool = False) -> Dict[str, any]:
+        """Recompute a recommendations or position-analysis result with the reference and record the comparison"""
+        reference = ReferenceEngine(engine.df, engine.league_config)
+        drafted = list(engine.drafted_players)
+        start = time.perf_counter()
+        reference_position = position
+        urgency = None
+        if call == 'recommendations':
+            reference_position = reference.recommended_position(drafted, engine.drafted_positions, engine.current_pick)
+            urgency = reference.position_urgency(drafted, engine.drafted_positions, engine.current_pick, reference_position)
+        expected = reference.ranked(drafted, engine.current_pick, reference_position, top_n)
+        reference_seconds = time.perf_counter() - start
+
+        fast_position = result.attrs.get('recommended_position', position) if len(result) else reference_position
+        fast_players = list(result['Player']) if len(result) else []
+        players_match = fast_players == list(expected['Player'])
+        score_diff = 0.0
+        if players_match and fast_players:
+            score_diff = float(np.max(np.abs(result['composite_score'].to_numpy() - expected['composite_score'].to_numpy())))
+        urgency_diff = 0.0
+        if urgency is not None and 'position_urgency' in result.attrs:
+            urgency_diff = abs(result.attrs['position_urgency'] - urgency)
+
+        record = {
+            'call': call,
+            'pick': engine.current_pick,
+            'position': fast_position,
+            'reference_position': reference_position,
+            'players_match': players_match,
+            'score_diff': score_diff,
+            'urgency_diff': urgency_diff,
+            'diverged': bool(fast_position != reference_position or not players_match
+                             or score_diff > self.tolerance or urgency_diff > self.tolerance),
+            'cached': cached,
+            'fast_ms': fast_seconds * 1000,
+            'reference_ms': reference_seconds * 1000,
+        }
+        self.records.append(record)
+        if record['diverged']:
+            print(f"⚠️  Shadow check: {call} diverged from the reference at pick {engine.current_pick}")
+        return record
+
+    def divergences(self) -> List[Dict[str, any]]:
+        return [record for record in self.records if record['diverged']]
+
+    def summary(self) -> Dict[str, any]:
+        """Checked calls, divergences and mean timings of both paths over the computed
+        (not cached) calls"""
+        records = list(self.records)
+        timed = [record for record in records if not record['cached']]
+        return {
+            'checked': len(records),
+            'diverged': sum(record['diverged'] for record in records),
+            'timed': len(timed),
+            'fast_ms': float(np.mean([record['fast_ms'] for record in timed])) if timed else 0.0,
+            'reference_ms': float(np.mean([record['reference_ms'] for record in timed])) if timed else 0.0,
+        }
@@ -0,0 +1,91 @@
+import threading
+from typing import List, Optional, Tuple
+import numpy as np
+from anytime import simulate_boards
+
+# board branches warmed per speculation, and simulated drafts used to rank them
+SPECULATIVE_BRANCHES = 8
+SPECULATIVE_SIMULATIONS = 400
+
+
+def likely_branches(pool, available: np.ndarray, picks: int, branches: int, simulations: int,
+                    rng) -> List[Tuple[np.ndarray, float]]:
+    """Likeliest sets of players gone after the next picks, with their share of the
+    simulated drafts. The straight ADP order comes first, then the most frequent
+    simulated outcomes."""
+    ids = np.flatnonzero(available)
+    picks = min(picks, len(ids))
+    if picks <= 0:
+        return [(np.empty(0, dtype=np.int64), 1.0)]
+
+    taken = ~simulate_boards(pool, available, picks, simulations, rng)[:, ids]
+    outcomes, first, counts = np.unique(np.packbits(taken, axis=1), axis=0, return_index=True, return_counts=True)
+    # most frequent first, ties by first appearance
+    order = np.lexsort((first, -counts))
+
+    adp = np.where(np.isnan(pool.adp[ids]), np.inf, pool.adp[ids])
+    by_adp = np.zeros(len(ids), dtype=bool)
+    by_adp[np.argsort(adp, kind='stable')[:picks]] = True
+    by_adp_key = np.packbits(by_adp).tobytes()
+    share = {outcome.tobytes(): count / simulations for outcome, count in zip(outcomes, counts)}
+
+    result = [(ids[by_adp], share.get(by_adp_key, 0.0))]
+    for outcome in order[:branches]:
+        row = taken[first[outcome]]
+        if outcomes[outcome].tobytes() != by_adp_key and len(result) < branches:
+            result.append((ids[row], counts[outcome] / simulations))
+    return result
+
+
+class Speculator:
+    """Warms the engine's result cache in the background for the likeliest boards at
+    our next pick, so the answer is ready when the last opponent pick lands"""
+
+    def __init__(self, engine, target_pick: int, top_n: int, key=None,
+                 branches: int = SPECULATIVE_BRANCHES, seed: Optional[int] = None):
+        # engine is a fork owned by the speculation; its result cache is the live engine's
+        self.engine = engine
+        self.target_pick = target_pick
+        self.top_n = top_n
+        self.key = key
+        self.branches = branches
+        self.warmed = 0
+        self.coverage = 0.0
+        self._rng = np.random.default_rng(seed)
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _run(self):
+        try:
+            self._warm()
+        finally:
+            self._finished.set()
+
+    def _warm(self):
+        base = self.engine
+        picks = self.target_pick - base.current_pick
+        for gone, share in likely_branches(base.pool, base._index.available, picks, self.branches,
+                                           SPECULATIVE_SIMULATIONS, self._rng):
+            if self._cancelled.is_set():
+                return
+            branch = base.fork()
+            drafted = base.drafted_players.copy()
+            drafted.update(base.pool.names[gone])
+            branch.update_draft_state(drafted, base.drafted_positions, self.target_pick)
+            # the calls a refresh makes at our pick
+            branch.get_recommendations(self.top_n)
+            branch.get_strategic_insights()
+            self.warmed += 1
+            self.coverage += share
@@ -0,0 +1,116 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+import numpy as np
+
+_MISSING = object()
+
+# Zobrist keys per pool, so engines over the same projections hash states alike
+_KEYS_CACHE = weakref.WeakKeyDictionary()
+
+
+class ZobristKeys:
+    """Random 64-bit keys for the parts of a draft state; a state's hash is the XOR of its parts"""
+
+    def __init__(self, pool, seed: int = 2025):
+        self._rng = np.random.default_rng(seed)
+        # one key per interned player name, so a pick updates the hash with one XOR
+        self.name_keys = self._rng.integers(1, 2 ** 63, size=len(pool.unique_names), dtype=np.int64)
+        self.name_keys.flags.writeable = False
+        # weak, so the per-pool cache entry goes away with the pool
+        self._pool = weakref.ref(pool)
+        # keys for anything else (unknown names, roster counts, picks) are drawn on first use
+        self._extra: Dict[Hashable, int] = {}
+
+    @classmethod
+    def for_pool(cls, pool) -> 'ZobristKeys':
+        keys = _KEYS_CACHE.get(pool)
+        if keys is None:
+            keys = cls(pool)
+            _KEYS_CACHE[pool] = keys
+        return keys
+
+    def key(self, part: Hashable) -> int:
+        value = self._extra.get(part)
+        if value is None:
+            # setdefault keeps the first key drawn if two threads race here
+            value = self._extra.setdefault(part, int(self._rng.integers(1, 2 ** 63)))
+        return value
+
+    def name_key(self, name: str) -> int:
+        name_id = self._pool().name_id(name)
+        return int(self.name_keys[name_id]) if name_id >= 0 else self.key(('name', name))
+
+    def names_hash(self, name_ids: np.ndarray) -> int:
+        """XOR of the keys for a batch of name ids"""
+        if len(name_ids) == 0:
+            return 0
+        return int(np.bitwise_xor.reduce(self.name_keys[name_ids]))
+
+    def drafted_hash(self, drafted) -> int:
+        """Hash of a whole DraftedSet, for starting or checking the incremental one"""
+        value = self.names_hash(np.flatnonzero(drafted.mask))
+        for name in drafted.unknown:
+            value ^= self.key(('name', name))
+        return value
+
+    def roster_hash(self, drafted_positions: Dict[str, int]) -> int:
+        value = 0
+        for position, count in drafted_positions.items():
+            if count:
+                value ^= self.key(('roster', position, count))
+        return value
+
+    def pick_key(self, pick: int) -> int:
+        return self.key(('pick', pick))
+
+
+class LRUCache:
+    """Bounded least-recently-used cache that counts hits, misses and evictions.
+    Safe to share with background threads warming it."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for deadline-bound recommendations
+Checks the immediate heuristic answer, background refinement and the deadline cutoff
+"""
+
+import time
+
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+
+
+def test_heuristic_then_refined():
+    """The first answer is the heuristic one; the refined one replaces it for the same state"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    order = list(df.sort_values('ADP')['Player'])
+    engine.update_draft_state(set(order[:19]), {'RB': 1}, 20)
+    heuristic = engine.get_recommendations(5)
+
+    start = time.perf_counter()
+    first = engine.get_recommendations(5, deadline_ms=2000)
+    elapsed = time.perf_counter() - start
+    assert list(first['Player']) == list(heuristic['Player'])
+    assert first.attrs['progress'] == 0.0 and not first.attrs['refined']
+
+    refinement = engine.refinement
+    refined = refinement.wait(5)
+    assert refinement.done and refined.attrs['refined']
+    assert 0 < refined.attrs['progress'] <= 1 and 0 <= refined.attrs['confidence'] <= 1
+    assert refined.attrs['recommended_position'] in ['RB', 'WR', 'TE', 'QB']
+    # asking again for the same board serves the best answer instead of restarting
+    again = engine.get_recommendations(5, deadline_ms=2000)
+    assert engine.refinement is refinement and again.attrs['refined']
+    print(f"⏱️  heuristic answer in {elapsed * 1000:.1f} ms, refined over {refinement.simulations} boards")
+
+
+def test_deadline_and_new_state():
+    """A spent deadline leaves the heuristic answer; a new pick starts a new refinement"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(set(), {}, 1)
+    first = engine.get_recommendations(5, deadline_ms=0)
+    old = engine.refinement
+    best = old.wait(5)
+    assert old.simulations == 0 and list(best['Player']) == list(first['Player'])
+
+    engine.apply_pick(first.iloc[0]['Player'])
+    engine.get_recommendations(5, deadline_ms=50)
+    assert engine.refinement is not old
+    assert first.iloc[0]['Player'] not in list(engine.refinement.wait(5)['Player'])
+    print("✅ Deadline and state changes handled")
+
+
+if __name__ == "__main__":
+    test_heuristic_then_refined()
+    test_deadline_and_new_state()
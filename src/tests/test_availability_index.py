@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test script for the incremental availability index
+Checks the index against a full pandas re-filter after every pick
+"""
+
+import random
+import time
+
+import pandas as pd
+
+from availability_index import AvailabilityIndex
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+
+
+def test_index_matches_filter():
+    """Best-by-VOR, best-by-ADP and counts should match a pandas filter"""
+    df = load_and_clean_data()
+    index = AvailabilityIndex.from_frame(df)
+    rng = random.Random(3)
+    drafted = set()
+
+    for row in rng.sample(range(len(df)), 120):
+        index.mark_drafted(row)
+        drafted.add(row)
+        available = df.drop(index=list(drafted))
+
+        assert index.count() == len(available)
+        for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']:
+            pos_players = available[available['Position'] == pos]
+            assert index.count(pos) == len(pos_players)
+            if len(pos_players) == 0:
+                assert index.best_by_vor(pos) is None
+                continue
+            assert index.best_by_vor(pos) == pos_players['VOR'].idxmax()
+            assert index.best_by_adp(pos) == pos_players['ADP'].idxmin()
+            for player_row, vor in pos_players['VOR'].head(5).items():
+                assert index.vor_rank(player_row) == (pos_players['VOR'] > vor).sum()
+            for target in (1, 30, 90, 200):
+                adp = pd.to_numeric(pos_players['ADP'], errors='coerce')
+                later = pos_players[(adp >= target) | adp.isna()]
+                expected = later['VOR'].idxmax() if len(later) else None
+                assert index.best_by_vor_from_adp(pos, target) == expected
+
+    # undo half of the picks
+    for row in list(drafted)[:60]:
+        index.mark_available(row)
+        drafted.discard(row)
+    assert index.count() == len(df) - len(drafted)
+    print("✅ Availability index matches pandas filtering")
+
+
+def test_engine_update_cost():
+    """Time single-pick updates through the engine"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    names = list(df['Player'])
+    drafted = set()
+
+    start = time.perf_counter()
+    for name in names[:200]:
+        drafted.add(name)
+        engine.update_draft_state(drafted, {}, len(drafted) + 1)
+    elapsed = time.perf_counter() - start
+
+    assert len(engine.available_df) == len(df[~df['Player'].isin(drafted)])
+    print(f"⏱️  200 picks in {elapsed * 1000:.1f} ms ({elapsed / 200 * 1e6:.0f} µs per pick)")
+
+
+def test_live_dropoff():
+    """Live dropoff and cliffs should match a sorted pandas walk, including undrafts"""
+    df = load_and_clean_data()
+    index = AvailabilityIndex.from_frame(df)
+    rng = random.Random(5)
+    drafted = set()
+
+    for step in range(300):
+        row = rng.randrange(len(df))
+        if step % 4 == 3 and drafted:
+            row = rng.choice(sorted(drafted))
+            index.mark_available(row)
+            drafted.discard(row)
+        else:
+            index.mark_drafted(row)
+            drafted.add(row)
+
+        if step % 20:
+            continue
+        available = df.drop(index=list(drafted))
+        for pos in ['RB', 'WR', 'TE']:
+            ranked = available[available['Position'] == pos].sort_values('VOR', ascending=False, kind='stable')
+            gaps = ranked['VOR'] - ranked['VOR'].shift(-1)
+            for player_row, gap in gaps.head(10).items():
+                live = index.live_dropoff(player_row)
+                assert live == gap or (pd.isna(live) and pd.isna(gap))
+            rows, next_rows, cliff_gaps = index.cliffs(pos, 5)
+            assert list(rows) == list(gaps[gaps > 5].index)
+            assert all(index.live_dropoff(r) == g for r, g in zip(rows, cliff_gaps))
+    print("✅ Live dropoff matches the board")
+
+
+def test_tier_counters():
+    """Position x tier counters should match a pandas count, and forks keep their own"""
+    df = load_and_clean_data()
+    index = AvailabilityIndex.from_frame(df)
+    rng = random.Random(8)
+    drafted = set()
+
+    for step in range(200):
+        row = rng.randrange(len(df))
+        if step % 5 == 4 and drafted:
+            row = rng.choice(sorted(drafted))
+            index.mark_available(row)
+            drafted.discard(row)
+        else:
+            index.mark_drafted(row)
+            drafted.add(row)
+
+    available = df.drop(index=list(drafted))
+    for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']:
+        expected = available[available['Position'] == pos]['Tier'].value_counts().sort_index()
+        assert index.tier_counts(pos) == {int(tier): int(count) for tier, count in expected.items()}
+        for tier in (1, 2, 3):
+            assert index.tier_count(pos, tier) == int((available[available['Position'] == pos]['Tier'] == tier).sum())
+    assert index.tier_counts() == {int(t): int(c) for t, c in available['Tier'].value_counts().sort_index().items()}
+
+    fork = index.copy()
+    row = int(available.index[0])
+    pos, tier = df.at[row, 'Position'], int(df.at[row, 'Tier'])
+    before = index.tier_count(pos, tier)
+    fork.mark_drafted(row)
+    assert fork.tier_count(pos, tier) == before - 1 and index.tier_count(pos, tier) == before
+    print("✅ Tier counters match the board")
+
+
+if __name__ == "__main__":
+    test_index_matches_filter()
+    test_engine_update_cost()
+    test_live_dropoff()
+    test_tier_counters()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for per-engine league configuration
+Checks several leagues and draft slots can be evaluated in one process
+"""
+
+from config import LeagueConfig
+from data_loader import get_projections
+from draft_analyzer import analyze_roster_needs, is_my_pick
+from recommendation_engine import RecommendationEngine
+
+
+def test_every_pick_has_one_owner():
+    """Across all draft slots, each pick belongs to exactly one team"""
+    league = LeagueConfig(total_teams=10)
+    slots = [league.with_draft_slot(slot) for slot in range(10)]
+    for pick in range(1, 161):
+        owners = [slot.your_draft_slot for slot in slots if is_my_pick(pick, slot)]
+        assert len(owners) == 1
+    # snake order: slot 0 picks 1st and 20th, slot 9 picks 10th and 11th
+    assert slots[0].next_picks(1, 2) == [1, 20]
+    assert slots[9].next_picks(1, 2) == [10, 11]
+    print("✅ Snake draft picks are split across all slots")
+
+
+def test_engines_keep_their_own_league():
+    """Two engines with different leagues share projections but not settings"""
+    df = get_projections('non_ppr')
+    superflex = LeagueConfig(starting_lineup={'QB': 2, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DST': 1})
+    standard = RecommendationEngine(df, LeagueConfig(your_draft_slot=0))
+    two_qb = RecommendationEngine(df, superflex)
+
+    for engine in (standard, two_qb):
+        engine.update_draft_state(set(), {'QB': 1}, 1)
+    # one QB fills a 1-QB lineup (diminishing returns) but only half of a 2-QB one
+    assert standard.get_position_urgency_breakdown('QB')['roster_need'] < 0
+    assert two_qb.get_position_urgency_breakdown('QB')['roster_need'] > 0
+    assert standard._calculate_next_picks(1) == [1, 24, 25]
+
+    needs = analyze_roster_needs({'QB': 1}, None, superflex)
+    assert needs['QB']['priority'] == 'critical'
+    assert analyze_roster_needs({'QB': 1}, None)['QB']['priority'] == 'high'
+    print("✅ Engines and analyzers use their own league settings")
+
+
+def test_second_qb_in_two_qb_league():
+    """A 2-QB lineup keeps recommending QB after the first one; a 1-QB lineup stops"""
+    df = get_projections('non_ppr')
+    superflex = LeagueConfig(starting_lineup={'QB': 2, 'RB': 2, 'WR': 2, 'TE': 1, 'FLEX': 1, 'K': 1, 'DST': 1})
+    assert superflex.recommendation_cap('QB') == 2 and LeagueConfig().recommendation_cap('QB') == 1
+    # everything but QB is full, so QB is the only open position
+    roster = {'QB': 1, 'RB': 6, 'WR': 6, 'TE': 3}
+
+    two_qb = RecommendationEngine(df, superflex)
+    two_qb.update_draft_state(set(), roster, 30)
+    assert two_qb.get_recommended_position() == 'QB'
+    assert two_qb.get_recommendations(3).attrs['recommended_position'] == 'QB'
+    scenarios = two_qb.evaluate_scenarios(two_qb.slot_scenarios()[:2])
+    assert (scenarios['recommended_position'] == 'QB').all()
+    shadow = two_qb.enable_shadow()
+    two_qb.result_cache.clear()
+    two_qb.get_recommendations(3)
+    assert shadow.summary()['diverged'] == 0
+
+    standard = RecommendationEngine(df, LeagueConfig())
+    standard.update_draft_state(set(), roster, 30)
+    assert standard._position_blocked('QB')
+    assert standard.get_recommended_position() != 'QB'
+    print("✅ Second QB recommended only in a 2-QB lineup")
+
+
+if __name__ == "__main__":
+    test_every_pick_has_one_owner()
+    test_engines_keep_their_own_league()
+    test_second_qb_in_two_qb_league()
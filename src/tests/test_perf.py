@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for per-stage timing hooks
+Checks recorded stages and histograms over a few picks, and the cost when disabled
+"""
+
+import threading
+import time
+
+import perf
+from data_loader import load_and_clean_data
+from draft_analyzer import get_overall_pick_recommendations, get_strategic_insights
+from recommendation_engine import RecommendationEngine
+
+
+def test_stages_recorded():
+    """A refresh inside recording() should show up per stage with consistent histograms"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    order = list(df.sort_values('ADP')['Player'])
+
+    with perf.recording():
+        for pick in range(1, 13):
+            drafted = set(order[:pick - 1])
+            engine.update_draft_state(drafted, {}, pick)
+            engine.get_recommendations(5)
+            engine.get_strategic_insights()
+            get_strategic_insights(df, pick, 12, drafted)
+            get_overall_pick_recommendations(df, drafted, {}, pick)
+    stats = engine.get_perf_stats()
+
+    for stage in ['engine.state_update', 'engine.urgency', 'engine.expected_player', 'engine.scoring',
+                  'engine.sort', 'engine.recommendations', 'engine.insights',
+                  'analyzer.state_update', 'analyzer.insights', 'analyzer.recommendations']:
+        assert stage in stats, stage
+        entry = stats[stage]
+        assert sum(entry['histogram'].values()) == entry['calls'] > 0
+        assert entry['min_us'] <= entry['mean_us'] <= entry['max_us']
+    assert stats['engine.state_update']['calls'] == 12
+    assert set(engine.get_perf_stats('analyzer.')) == {stage for stage in stats if stage.startswith('analyzer.')}
+
+    # nothing is recorded once the block ends, or from other threads inside it
+    engine.get_recommendations(3)
+    with perf.recording(reset_stats=False):
+        worker = threading.Thread(target=engine.get_position_analysis, args=('QB', 3))
+        worker.start()
+        worker.join()
+    assert perf.get_perf_stats() == stats
+    for stage, entry in list(stats.items())[:5]:
+        print(f"   {stage:<28} {entry['calls']:4d} calls {entry['total_ms']:8.2f} ms")
+
+
+def test_disabled_hooks_record_nothing():
+    """Disabled hooks should pass calls through and record no samples"""
+    calls = []
+    hooked = perf.timed('test.noop')(lambda value: calls.append(value) or value)
+    perf.disable()
+    perf.reset()
+    assert [hooked(i) for i in range(1000)] == list(range(1000)) and len(calls) == 1000
+    assert perf.get_perf_stats() == {}
+
+    # reported, not asserted: wall-clock numbers vary with machine load
+    def noop():
+        return None
+    hooked_noop = perf.timed('test.noop')(noop)
+    start = time.perf_counter()
+    for _ in range(100000):
+        noop()
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(100000):
+        hooked_noop()
+    overhead = (time.perf_counter() - start - plain) / 100000
+    assert perf.get_perf_stats() == {}
+    print(f"⏱️  disabled hook overhead {overhead * 1e9:.0f} ns per call")
+
+
+if __name__ == "__main__":
+    test_stages_recorded()
+    test_disabled_hooks_record_nothing()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the struct-of-arrays player pool
+Checks the typed columns against the projections frame they came from
+"""
+
+import gc
+import weakref
+
+import numpy as np
+
+import player_pool
+from data_loader import get_projections, load_and_clean_data
+from player_pool import NO_TIER, DraftedSet, PlayerPool
+from draft_analyzer import get_best_by_position_available, get_tier_analysis
+from recommendation_engine import RecommendationEngine
+from state_cache import ZobristKeys
+
+
+def test_pool_matches_frame():
+    """Pool columns, position ids and name lookups should mirror the frame"""
+    df = load_and_clean_data()
+    pool = PlayerPool.for_frame(df)
+
+    assert PlayerPool.for_frame(df) is pool
+    assert pool.size == len(df)
+    assert np.allclose(pool.vor, df['VOR'].to_numpy(dtype=float), equal_nan=True)
+    assert np.allclose(pool.adp, df['ADP'].to_numpy(dtype=float), equal_nan=True)
+    assert NO_TIER not in set(pool.tier[df['Tier'].notna().to_numpy()])
+
+    for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']:
+        ids = pool.position_ids(pos)
+        assert list(ids) == list(np.flatnonzero(df['Position'].to_numpy() == pos))
+
+    drafted = set(df['Player'].head(30))
+    mask = pool.available_mask(drafted)
+    assert list(mask) == list(~df['Player'].isin(drafted))
+    assert pool.row(5)['Player'] == df['Player'].iloc[5]
+    print("✅ Player pool mirrors the projections frame")
+
+
+def test_drafted_set():
+    """DraftedSet should behave like a set of names and copy independently"""
+    df = load_and_clean_data()
+    pool = PlayerPool.for_frame(df)
+    names = list(df['Player'])
+
+    drafted = DraftedSet(pool, names[:10] + ['Not A Player'])
+    assert len(drafted) == len(set(names[:10])) + 1
+    assert names[3] in drafted and 'Not A Player' in drafted and names[50] not in drafted
+    assert set(drafted) == set(names[:10]) | {'Not A Player'}
+
+    snapshot = drafted.copy()
+    drafted.add(names[50])
+    drafted.discard(names[0])
+    assert names[50] not in snapshot and names[0] in snapshot
+    assert set(snapshot | drafted) == set(names[:10]) | {'Not A Player', names[50]}
+    assert list(pool.available_mask(drafted)) == list(~df['Player'].isin(set(drafted)))
+
+    # the engine accepts both plain sets and drafted sets, including undo
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(drafted, {}, len(drafted) + 1)
+    assert len(engine.available_df) == len(df[~df['Player'].isin(set(drafted))])
+    engine.update_draft_state(set(names[:5]), {}, 6)
+    assert len(engine.available_df) == len(df[~df['Player'].isin(set(names[:5]))])
+    print("✅ Drafted set tracks names as a mask")
+
+
+def test_top_available_orders():
+    """Maintained VOR/ceiling/ADP orders should match a stable sort of the undrafted pool"""
+    df = load_and_clean_data()
+    pool = PlayerPool.for_frame(df)
+    drafted = DraftedSet(pool, df.sort_values('ADP')['Player'].head(70))
+    available = df[~df['Player'].isin(set(drafted))]
+
+    for column, ascending in (('VOR', False), ('ceiling', False), ('ADP', True)):
+        for position in (None, 'RB', 'TE'):
+            rows = available if position is None else available[available['Position'] == position]
+            expected = rows.sort_values(column, ascending=ascending, kind='stable').head(25)
+            top = pool.top_available(column, drafted, 25, position)
+            assert list(pool.to_frame(top)['Player']) == list(expected['Player'])
+    assert pool.sort_order('VOR') is pool.sort_order('VOR')
+    print("✅ Maintained sort orders match sort_values")
+
+
+def test_shared_projections():
+    """Engines on the same scoring format share one table and one pool"""
+    df = get_projections('non_ppr')
+    assert get_projections('non_ppr') is df
+    assert get_projections('half_ppr') is not df
+
+    first = RecommendationEngine(df)
+    second = RecommendationEngine(df)
+    assert first.df is df and second.df is df
+    assert first.pool is second.pool
+    assert not first.pool.vor.flags.writeable
+
+    first.update_draft_state(set(df['Player'].head(10)), {}, 11)
+    assert second.available_df is None and 'Drafted' not in df.columns
+    print("✅ Engines share read-only projections")
+
+
+def test_pool_released_with_frame():
+    """Dropping the last reference to a frame frees its pool and per-pool caches"""
+    df = load_and_clean_data().copy()
+    key = id(df)
+    drafted = set(df['Player'].head(10))
+    get_best_by_position_available(df, drafted)
+    get_tier_analysis(df, drafted)
+    pool = weakref.ref(PlayerPool.for_frame(df))
+    ZobristKeys.for_pool(pool())
+    assert key in player_pool._POOL_CACHE
+
+    del df
+    gc.collect()
+    assert key not in player_pool._POOL_CACHE
+    assert pool() is None
+    print("✅ Pool cache lets go of dropped frames")
+
+
+if __name__ == "__main__":
+    test_pool_matches_frame()
+    test_drafted_set()
+    test_top_available_orders()
+    test_shared_projections()
+    test_pool_released_with_frame()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for partial top-k selection and lazy ranked pages
+Checks both against a full stable sort, including ties and missing values
+"""
+
+import numpy as np
+
+from data_loader import load_and_clean_data
+from player_pool import PlayerPool
+from ranking import RankedPages, top_k
+from recommendation_engine import RecommendationEngine
+
+
+def test_top_k_matches_full_sort():
+    """top_k should equal the head of a stable descending sort"""
+    rng = np.random.default_rng(5)
+    for _ in range(200):
+        values = rng.integers(0, 20, size=rng.integers(1, 60)).astype(float)
+        values[rng.random(len(values)) < 0.1] = np.nan
+        full = np.argsort(np.where(np.isnan(values), np.inf, -values), kind='stable')
+        for k in (1, 5, len(values)):
+            assert list(top_k(values, k)) == list(full[:k])
+        ascending = np.argsort(np.where(np.isnan(values), np.inf, values), kind='stable')
+        assert list(top_k(values, 3, descending=False)) == list(ascending[:3])
+    print("✅ top_k matches a full stable sort")
+
+
+def test_ranked_pages():
+    """Pages should continue the ranking where the last page stopped"""
+    df = load_and_clean_data()
+    pool = PlayerPool.for_frame(df)
+    ids = pool.position_ids('WR')
+    pages = RankedPages(pool, ids, pool.vor[ids])
+
+    first = pages.next_page(10)
+    second = pages.next_page(10)
+    expected = df[df['Position'] == 'WR'].sort_values('VOR', ascending=False, kind='stable')
+    assert list(first['Player']) == list(expected['Player'].head(10))
+    assert list(second['Player']) == list(expected['Player'].iloc[10:20])
+    assert pages.remaining == len(ids) - 20
+
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(set(), {}, 1)
+    ranked = engine.iter_ranked_players('RB').next_page(5, 'composite_score')
+    analysis = engine.get_position_analysis('RB', 5)
+    assert list(ranked['Player']) == list(analysis['Player'])
+    assert np.allclose(ranked['composite_score'], analysis['composite_score'])
+    print("✅ Ranked pages continue the full ranking")
+
+
+if __name__ == "__main__":
+    test_top_k_matches_full_sort()
+    test_ranked_pages()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for replacement levels and VOR recomputed per league lineup
+Checks FLEX allocation on a small pool and the per-lineup cache on the projections
+"""
+
+import time
+
+import pandas as pd
+
+from config import LeagueConfig
+from data_loader import get_projections
+from player_pool import PlayerPool
+from recommendation_engine import RecommendationEngine
+from replacement import compute_vor, replacement_levels, starter_slots
+
+
+def test_flex_slots():
+    """FLEX slots should go to the best RB/WR/TE left after the dedicated starters"""
+    df = pd.DataFrame({
+        'Player': ['RB1', 'RB2', 'RB3', 'RB4', 'WR1', 'WR2', 'WR3', 'TE1', 'TE2'],
+        'Position': ['RB', 'RB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'TE'],
+        'points': [200, 180, 150, 90, 190, 120, 110, 100, 60],
+    })
+    pool = PlayerPool(df)
+    league = LeagueConfig(total_teams=2, starting_lineup={'RB': 1, 'WR': 1, 'TE': 0, 'FLEX': 1})
+
+    # after RB1/RB2 and WR1/WR2 start, RB3 (150) and WR3 (110) beat TE1 (100) for FLEX
+    assert starter_slots(pool, league) == {'QB': 0, 'RB': 3, 'WR': 3, 'TE': 0, 'K': 0, 'DST': 0}
+    levels = replacement_levels(pool, league)
+    assert levels == {'RB': 90.0, 'WR': 110.0, 'TE': 100.0}
+    assert list(compute_vor(pool, league)) == [110, 90, 60, 0, 80, 10, 0, 0, -40]
+
+    # with RB1 and WR1 drafted, their dedicated slots are filled
+    available = ~df['Player'].isin(['RB1', 'WR1']).to_numpy()
+    live = replacement_levels(pool, league, available, {'RB': 1, 'WR': 1})
+    assert live == levels
+    print("✅ FLEX slots and replacement levels check out")
+
+
+def test_league_projections_cached():
+    """Each lineup gets its own shared projections; switching back is a cache hit"""
+    base = get_projections()
+    standard = LeagueConfig()
+    superflex = LeagueConfig(total_teams=10, starting_lineup={'QB': 2, 'RB': 2, 'WR': 3, 'TE': 1, 'FLEX': 2, 'K': 1, 'DST': 1})
+
+    standard_df = get_projections(league_config=standard)
+    superflex_df = get_projections(league_config=superflex)
+    assert standard_df is not base and 'VOR' in standard_df
+    assert (superflex_df['VOR'] != standard_df['VOR']).any()
+    # VOR stays points minus one replacement level per position
+    for frame in (standard_df, superflex_df):
+        assert frame.groupby('Position').apply(lambda g: (g['points'] - g['VOR']).nunique()).eq(1).all()
+
+    start = time.perf_counter()
+    assert get_projections(league_config=LeagueConfig()) is standard_df
+    elapsed = time.perf_counter() - start
+    assert base['VOR'].equals(get_projections()['VOR'])
+    print(f"⏱️  switching leagues back took {elapsed * 1e6:.0f} µs")
+
+
+def test_live_levels():
+    """Drafting starters in points order should leave the replacement level alone"""
+    df = get_projections()
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(set(), {}, 1)
+    static = engine.get_replacement_levels(live=False)
+    assert engine.get_replacement_levels() == static
+
+    rbs = df[df['Position'] == 'RB'].sort_values('points', ascending=False)['Player']
+    engine.update_draft_state(set(rbs.head(20)), {}, 21)
+    assert engine.get_replacement_levels()['RB'] == static['RB']
+
+    # a run on bench RBs uses up starting slots and raises the bar
+    engine.update_draft_state(set(rbs.iloc[40:64]), {}, 25)
+    assert engine.get_replacement_levels()['RB'] > static['RB']
+    print("✅ Live replacement levels follow the board")
+
+
+if __name__ == "__main__":
+    test_flex_slots()
+    test_league_projections_cached()
+    test_live_levels()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized scoring kernel
+Hand-checks each component on a small synthetic pool
+"""
+
+import numpy as np
+import pandas as pd
+
+from scoring import BREAKDOWN_COLUMNS, score_frame
+
+
+def test_score_components():
+    """Each component should follow the composite score rules"""
+    df = pd.DataFrame({
+        'Player': ['Elite', 'Faller', 'Reach', 'Unknown'],
+        'VOR': [100.0, 50.0, 20.0, 10.0],
+        'Tier': [1, 3, 7, np.nan],
+        'dropoff': [30.0, 20.0, 5.0, np.nan],
+        'ADP': [1.0, 40.0, 'NA', 5.0],
+        'floor': [90.0, 40.0, 15.0, np.nan],
+        'ceiling': [120.0, 70.0, 30.0, np.nan],
+        'uncertainty': [10, 20, 30, 40],
+    })
+
+    scores = score_frame(df, current_pick=20, current_round=2)
+    print(scores)
+
+    assert list(scores['tier_bonus']) == [7.5, 4.5, 0.0, 0.0]
+    assert list(scores['cliff_bonus']) == [10.0, 5.0, 0.0, 0.0]
+    assert list(scores['adp_value']) == [0.0, 5.0, 0.0, 0.0]
+    # 19 picks past ADP is a full reach, 15 picks is 1.25 per pick
+    assert list(scores['reach_cost']) == [15.0, 0.0, 0.0, 15.0]
+    # early rounds lean on floor, missing floor/ceiling gives no tilt
+    assert np.isclose(scores['risk_tilt'].iloc[0], (90 - 100) * 0.2 - 10 * 0.1)
+    assert scores['risk_tilt'].iloc[3] == 0
+
+    expected = 100 * 0.70 + 7.5 * 0.15 + 10 * 0.10 + 0 * 0.05 + scores['risk_tilt'].iloc[0] - 15
+    assert np.isclose(scores['composite_score'].iloc[0], expected)
+
+    late = score_frame(df, current_pick=130, current_round=11)
+    assert np.isclose(late['risk_tilt'].iloc[1], (70 - 50) * 0.2 - 20 * 0.05)
+    print("✅ Scoring kernel components check out")
+
+
+def test_breakdowns_match_scores():
+    """Breakdowns come from the scoring pass and add up to the ranking score"""
+    from data_loader import get_projections
+    from recommendation_engine import RecommendationEngine
+
+    engine = RecommendationEngine(get_projections())
+    engine.update_draft_state(set(), {}, 30)
+
+    table = engine.get_score_breakdowns()
+    assert list(table.columns) == ['Player', 'Position'] + BREAKDOWN_COLUMNS
+    assert len(table) == len(engine.df)
+    parts = table[BREAKDOWN_COLUMNS[:-1]].sum(axis=1)
+    assert np.allclose(parts, table['total_score'])
+    assert table['total_score'].is_monotonic_decreasing
+
+    # the per-player breakdown matches the table and the score used for ranking
+    for label in table.index[:5]:
+        player = engine.df.loc[label]
+        breakdown = engine.get_detailed_score_breakdown(player)
+        assert breakdown['total_score'] == engine.calculate_player_score(player)
+        assert breakdown == {column: table.loc[label, column] for column in BREAKDOWN_COLUMNS}
+
+    recommendations = engine.get_recommendations(5)
+    rb_table = engine.get_score_breakdowns(recommendations.attrs['recommended_position'])
+    assert list(rb_table['total_score'][:5]) == list(recommendations['composite_score'])
+    print("✅ Score breakdowns match the scoring pass")
+
+
+if __name__ == "__main__":
+    test_score_components()
+    test_breakdowns_match_scores()
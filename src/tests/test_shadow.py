@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for shadow mode
+Checks the engine against the pandas reference over a mock draft and catches a corrupted result
+"""
+
+import recommendation_engine
+import scoring
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+
+
+def test_shadow_agrees_over_a_draft():
+    """Every sampled call over a mock draft should match the reference"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    shadow = engine.enable_shadow(sample_rate=1.0)
+    order = list(df.sort_values('ADP')['Player'])
+    roster = {}
+    for pick in range(1, 97):
+        engine.update_draft_state(set(order[:pick - 1]), dict(roster), pick)
+        recommendations = engine.get_recommendations(5)
+        engine.get_position_analysis('TE', 5)
+        if engine.league_config.is_my_pick(pick):
+            position = recommendations.attrs['recommended_position']
+            roster[position] = roster.get(position, 0) + 1
+
+    summary = shadow.summary()
+    assert summary['checked'] == 192 and summary['diverged'] == 0, shadow.divergences()[:3]
+    assert summary['timed'] == 192
+    print(f"⏱️  fast {summary['fast_ms']:.2f} ms vs reference {summary['reference_ms']:.2f} ms per call")
+
+
+def test_shadow_records_divergence():
+    """A wrong cached result should be recorded with both positions and timings"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(set(), {}, 6)
+    good = engine.get_recommendations(5)
+
+    # swap the cached answer for a different ranking with shifted scores
+    key = ('recommendations', (5,), engine.state_key())
+    bad = good.iloc[::-1].copy()
+    bad['composite_score'] += 1.0
+    engine.result_cache.put(key, bad)
+    shadow = engine.enable_shadow(sample_rate=1.0)
+    engine.get_recommendations(5)
+
+    record = shadow.divergences()[0]
+    assert record['call'] == 'recommendations' and not record['players_match']
+    assert record['position'] == record['reference_position'] == good.attrs['recommended_position']
+    assert record['fast_ms'] >= 0 and record['reference_ms'] > 0
+    # the answer came from the cache, so it doesn't count towards the timings
+    assert record['cached'] and shadow.summary()['timed'] == 0
+
+    # sampling off means no checks at all
+    engine.enable_shadow(sample_rate=0.0)
+    engine.get_recommendations(5)
+    assert engine.shadow.summary()['checked'] == 0
+    print("✅ Shadow mode records divergences")
+
+
+def test_shadow_catches_scoring_bug():
+    """A bug in the vectorized scoring kernel should not carry over to the reference"""
+    df = load_and_clean_data()
+    original = scoring.score_components
+
+    def broken(inputs, current_pick, current_round):
+        components = original(inputs, current_pick, current_round)
+        components['composite_score'] = components['composite_score'] + components['tier_bonus']
+        return components
+
+    scoring.score_components = recommendation_engine.score_components = broken
+    try:
+        engine = RecommendationEngine(df)
+        shadow = engine.enable_shadow(sample_rate=1.0)
+        engine.update_draft_state(set(), {}, 6)
+        engine.get_recommendations(5)
+    finally:
+        scoring.score_components = recommendation_engine.score_components = original
+    assert shadow.summary()['diverged'] == 1
+    print("✅ Shadow mode catches a scoring kernel bug")
+
+
+if __name__ == "__main__":
+    test_shadow_agrees_over_a_draft()
+    test_shadow_records_divergence()
+    test_shadow_catches_scoring_bug()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for speculative precomputation between our picks
+Checks the predicted board branches and that our pick is served from the warmed cache
+"""
+
+import time
+
+import numpy as np
+
+from data_loader import load_and_clean_data
+from player_pool import PlayerPool
+from recommendation_engine import RecommendationEngine
+from speculation import likely_branches
+
+
+def test_likely_branches():
+    """The ADP order comes first and the simulated branches follow by frequency"""
+    df = load_and_clean_data()
+    pool = PlayerPool.for_frame(df)
+    available = np.ones(len(df), dtype=bool)
+    rng = np.random.default_rng(3)
+
+    branches = likely_branches(pool, available, 4, 6, 300, rng)
+    assert len(branches) == 6 and all(len(gone) == 4 for gone, _ in branches)
+    adp_order = np.argsort(np.where(np.isnan(pool.adp), np.inf, pool.adp), kind='stable')[:4]
+    assert set(branches[0][0]) == set(adp_order)
+    shares = [share for _, share in branches[1:]]
+    assert shares == sorted(shares, reverse=True) and sum(share for _, share in branches) <= 1
+    assert len(likely_branches(pool, available, 0, 6, 300, rng)[0][0]) == 0
+    print("✅ Board branches ranked by likelihood")
+
+
+def test_our_pick_is_warm():
+    """After speculating, the ADP-order board at our pick is a cache hit and matches a fresh engine"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    order = list(df.sort_values('ADP')['Player'])
+    engine.update_draft_state(set(order[:17]), {'RB': 1}, 18)
+    assert engine.speculate(5, seed=1) is engine.speculate(5, seed=1)
+    speculator = engine.speculator
+    assert speculator.wait(10) and speculator.warmed > 0
+    # one pick left before ours: the likeliest branches cover most outcomes
+    assert speculator.coverage > 0.5
+
+    engine.update_draft_state(set(order[:18]), {'RB': 1}, 19)
+    assert engine.speculate(5) is None
+    hits = engine.get_cache_stats()['hits']
+    start = time.perf_counter()
+    recommendations = engine.get_recommendations(5)
+    insights = engine.get_strategic_insights()
+    elapsed = time.perf_counter() - start
+    assert engine.get_cache_stats()['hits'] == hits + 2
+
+    fresh = RecommendationEngine(df)
+    fresh.update_draft_state(set(order[:18]), {'RB': 1}, 19)
+    assert recommendations.equals(fresh.get_recommendations(5))
+    assert insights == fresh.get_strategic_insights()
+    print(f"⏱️  warmed answer at our pick in {elapsed * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    test_likely_branches()
+    test_our_pick_is_warm()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the Zobrist-keyed recommendation cache
+Checks the incremental state hash, cache hits on repeated calls and LRU eviction
+"""
+
+import time
+
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+from state_cache import LRUCache, ZobristKeys
+
+
+def test_incremental_hash():
+    """Picks and board updates should keep the hash equal to one computed from scratch"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    keys = ZobristKeys.for_pool(engine.pool)
+    names = list(df.sort_values('VOR', ascending=False)['Player'].head(12))
+
+    engine.update_draft_state(set(names[:5]) | {'Not A Player'}, {'RB': 1}, 6)
+    assert engine._drafted_hash == keys.drafted_hash(engine.drafted_players)
+    engine.apply_pick(names[5])
+    engine.apply_pick(names[5])
+    assert engine._drafted_hash == keys.drafted_hash(engine.drafted_players)
+    # undo part of the board, as a resync would
+    engine.update_draft_state(set(names[3:9]), {'RB': 1}, 10)
+    assert engine._drafted_hash == keys.drafted_hash(engine.drafted_players)
+
+    other = RecommendationEngine(df)
+    other.update_draft_state(set(names[3:9]), {'RB': 1}, 10)
+    assert other.state_key() == engine.state_key()
+    other.update_draft_state(set(names[3:9]), {'RB': 2}, 10)
+    assert other.state_key() != engine.state_key()
+    print("✅ Incremental hash matches a full recompute")
+
+
+def test_repeat_calls_hit_cache():
+    """Repeated calls on the same state should come from the cache and stay independent"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    engine.update_draft_state(set(df['Player'].head(8)), {}, 9)
+
+    first = engine.get_recommendations(10)
+    insights = engine.get_strategic_insights()
+    engine.get_position_analysis('RB', 5)
+    start = time.perf_counter()
+    again = engine.get_recommendations(10)
+    engine.get_strategic_insights()
+    engine.get_position_analysis('RB', 5)
+    elapsed = time.perf_counter() - start
+    assert again.equals(first)
+    assert engine.get_cache_stats()['hits'] == 3
+
+    # callers can't change what the cache holds
+    again['composite_score'] = 0.0
+    first.iloc[0, first.columns.get_loc('composite_score')] = -1.0
+    assert engine.get_recommendations(10)['composite_score'].iloc[0] != -1.0
+    first = engine.get_recommendations(10)
+    insights['position_urgencies'].clear()
+    assert engine.get_recommendations(10).equals(first)
+    assert engine.get_strategic_insights()['position_urgencies']
+
+    # a pick changes the key, and going back to the old board hits again
+    engine.apply_pick(first.iloc[0]['Player'])
+    assert not engine.get_recommendations(10).equals(first)
+    engine.update_draft_state(set(df['Player'].head(8)), {}, 9)
+    assert engine.get_recommendations(10).equals(first)
+    print(f"⏱️  3 cached calls in {elapsed * 1e6:.0f} µs")
+
+
+def test_lru_eviction():
+    """The least recently used entry goes first once the cache is full"""
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None and cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats() == {'size': 2, 'maxsize': 2, 'hits': 3, 'misses': 1, 'evictions': 1}
+    print("✅ LRU eviction and stats check out")
+
+
+if __name__ == "__main__":
+    test_incremental_hash()
+    test_repeat_calls_hit_cache()
+    test_lru_eviction()
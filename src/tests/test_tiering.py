@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script for live tier re-clustering
+Checks the optimal 1-D k-means against a brute-force DP and the engine's per-pick tiers
+"""
+
+import time
+
+import numpy as np
+
+import tiering
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+from tiering import optimal_tiers
+
+
+def _squared_error(values, tiers):
+    return sum(((values[tiers == t] - values[tiers == t].mean()) ** 2).sum() for t in np.unique(tiers))
+
+
+def _brute_force_error(values, k):
+    n = len(values)
+    cost = lambda a, b: ((values[a:b + 1] - values[a:b + 1].mean()) ** 2).sum()
+    best = [cost(0, i) for i in range(n)]
+    for layer in range(1, k):
+        best = [np.inf] * layer + [min(best[j - 1] + cost(j, i) for j in range(layer, i + 1)) for i in range(layer, n)]
+    return best[-1]
+
+
+def test_optimal_tiers():
+    """Both DP layers should find the minimum squared error grouping"""
+    rng = np.random.default_rng(7)
+    dense_limit = tiering.DENSE_LIMIT
+    try:
+        for limit in (dense_limit, 0):
+            tiering.DENSE_LIMIT = limit
+            for _ in range(150):
+                values = np.sort(np.round(rng.normal(50, 30, rng.integers(1, 35))))[::-1]
+                k = int(rng.integers(1, 7))
+                tiers = optimal_tiers(values, k)
+                groups = min(k, len(np.unique(values)))
+                assert tiers[0] == 1 and np.all(np.diff(tiers) >= 0) and tiers.max() == groups
+                if groups > 1:
+                    assert np.isclose(_squared_error(values, tiers), _brute_force_error(values, groups))
+    finally:
+        tiering.DENSE_LIMIT = dense_limit
+    print("✅ Tiers match a brute-force DP")
+
+
+def test_live_tiers_follow_the_board():
+    """Live tiers should cover only undrafted players and re-cluster the drafted position"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    drafted = set()
+    engine.update_draft_state(drafted, {}, 1)
+    before = engine.get_live_tiers()
+    assert len(before) == df['VOR'].notna().sum()
+
+    rb = df[df['Position'] == 'RB'].sort_values('VOR', ascending=False)['Player']
+    start = time.perf_counter()
+    for pick, name in enumerate(rb.head(6), 2):
+        drafted.add(name)
+        engine.update_draft_state(drafted, {}, pick)
+        tiers = engine.get_live_tiers()
+    elapsed = time.perf_counter() - start
+
+    assert not df.loc[tiers.index, 'Player'].isin(drafted).any()
+    # untouched positions keep their cached tiers
+    for pos in ['QB', 'WR', 'TE']:
+        assert engine.get_live_tiers(pos).equals(before[df.loc[before.index, 'Position'] == pos])
+    rb_tiers = engine.get_live_tiers('RB')
+    assert rb_tiers.iloc[0] == 1 and rb_tiers.is_monotonic_increasing
+    print(f"⏱️  6 picks with re-tiering in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_optimal_tiers()
+    test_live_tiers_follow_the_board()
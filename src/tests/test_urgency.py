@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for position urgency caching and the all-position table
+Checks urgency is computed once per draft state and refreshed on updates
+"""
+
+from data_loader import load_and_clean_data
+from recommendation_engine import URGENCY_COLUMNS, RecommendationEngine
+
+
+def test_urgency_cached_per_state():
+    """A full refresh should compute each position's urgency only once"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    calls = []
+    compute = engine._compute_urgency_table
+    engine._compute_urgency_table = lambda: calls.append(engine.current_pick) or compute()
+
+    drafted = set(df.sort_values('ADP')['Player'].head(20))
+    engine.update_draft_state(drafted, {'RB': 1, 'WR': 1}, 21)
+    first = engine.get_position_urgency('RB')
+    engine.get_recommended_position()
+    engine.get_recommendations(top_n=5)
+    engine.get_strategic_insights()
+    breakdown = engine.get_position_urgency_breakdown('RB')
+    assert calls == [21]
+    assert breakdown['total_urgency'] == first
+
+    # callers can't poison the cache through the breakdown they get back
+    breakdown['total_urgency'] = 0
+    assert engine.get_position_urgency('RB') == first
+
+    # a new state invalidates the cache
+    drafted.add(df.loc[df['Position'] == 'RB'].sort_values('VOR')['Player'].iloc[-1])
+    engine.update_draft_state(drafted, {'RB': 1, 'WR': 1}, 22)
+    engine.get_position_urgency('RB')
+    assert calls == [21, 22]
+    print("✅ Urgency computed once per draft state")
+
+
+def test_all_position_table():
+    """The grouped pass should agree with each position's breakdown"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    drafted = set(df.sort_values('ADP')['Player'].head(60))
+    engine.update_draft_state(drafted, {'QB': 1, 'RB': 2, 'WR': 2}, 61)
+
+    table = engine.get_position_urgencies()
+    print(table)
+    assert list(table.columns) == URGENCY_COLUMNS
+    assert set(table.index) == {'QB', 'RB', 'WR', 'TE', 'K', 'DST'}
+    for pos, row in table.iterrows():
+        assert row.to_dict() == engine.get_position_urgency_breakdown(pos)
+    assert engine.get_recommended_position() == table.loc[['RB', 'WR', 'TE'], 'total_urgency'].idxmax()
+    print("✅ All-position urgency table matches breakdowns")
+
+
+def test_urgency_ignores_index_labels():
+    """Percentiles come from VOR ranks, not from the frame's index labels"""
+    df = load_and_clean_data()
+    relabeled = df.copy()
+    relabeled.index = relabeled.index[::-1] * 7 + 1000
+    drafted = set(df.sort_values('ADP')['Player'].head(30))
+
+    tables = []
+    for frame in (df, relabeled):
+        engine = RecommendationEngine(frame)
+        engine.update_draft_state(drafted, {'RB': 1, 'WR': 1}, 31)
+        tables.append(engine.get_position_urgencies())
+    assert tables[0].equals(tables[1])
+
+    # the best available player is the 100th percentile, so waiting never gains value
+    assert (tables[0]['opportunity_cost'] >= 0).all()
+    print("✅ Urgency percentiles are independent of index labels")
+
+
+def test_pick_deltas():
+    """apply_pick should match a full update and only recompute the drafted position"""
+    df = load_and_clean_data()
+    by_adp = list(df.sort_values('ADP')['Player'])
+    delta = RecommendationEngine(df)
+    full = RecommendationEngine(df)
+    delta.update_draft_state(set(), {}, 1)
+    drafted = set()
+
+    reused = 0
+    for pick, name in enumerate(by_adp[:40], 1):
+        before = dict(delta._urgency_table())
+        keys = {pos: cached[0] for pos, cached in delta._position_rows.items()}
+        delta.apply_pick(name, pick + 1)
+        drafted.add(name)
+        full.update_draft_state(drafted, {}, pick + 1)
+
+        after = delta._urgency_table()
+        assert after == full._urgency_table()
+        assert set(delta.drafted_players) == drafted
+        assert delta.get_recommendations(5)['Player'].tolist() == full.get_recommendations(5)['Player'].tolist()
+
+        # positions nobody drafted from keep their cached rows unless our next pick moved
+        position = df.loc[df['Player'] == name, 'Position'].iloc[0]
+        for pos, row in after.items():
+            if pos != position and keys[pos][1:] == delta._position_rows[pos][0][1:]:
+                assert row is before[pos]
+                reused += 1
+    assert reused > 150
+    print(f"✅ Pick deltas match full updates ({reused} position rows reused)")
+
+
+if __name__ == "__main__":
+    test_urgency_cached_per_state()
+    test_all_position_table()
+    test_urgency_ignores_index_labels()
+    test_pick_deltas()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for batch what-if evaluation
+Checks that one vectorized call matches evaluating every scenario on its own engine
+"""
+
+import time
+
+import numpy as np
+
+from data_loader import load_and_clean_data
+from recommendation_engine import RecommendationEngine
+
+
+def _single_state(engine, scenario):
+    """The scenario's state on a forked engine, the slow way"""
+    fork = engine.fork()
+    if scenario.draft_slot is not None:
+        fork.league_config = engine.league_config.with_draft_slot(scenario.draft_slot)
+    drafted = engine.drafted_players.copy()
+    for name in scenario.drafted:
+        drafted.add(name)
+    roster = engine.drafted_positions if scenario.drafted_positions is None else scenario.drafted_positions
+    fork.update_draft_state(drafted, roster, scenario.current_pick or engine.current_pick)
+    return fork
+
+
+def test_batch_matches_single_states():
+    """Candidates removed, candidates taken and every draft slot should match one-by-one results"""
+    df = load_and_clean_data()
+    engine = RecommendationEngine(df)
+    drafted = list(df.sort_values('ADP')['Player'].head(29))
+    engine.update_draft_state(set(drafted), {'RB': 1, 'WR': 1}, 30)
+    scenarios = engine.candidate_scenarios(10) + engine.candidate_scenarios(10, take=True) + engine.slot_scenarios()
+    assert len(scenarios) == 20 + engine.league_config.total_teams
+
+    start = time.perf_counter()
+    results = engine.evaluate_scenarios(scenarios, top_n=3)
+    elapsed = time.perf_counter() - start
+    assert list(results['players'].index) == [scenario.label for scenario in scenarios]
+
+    for row, scenario in enumerate(scenarios):
+        fork = _single_state(engine, scenario)
+        urgencies = fork.get_position_urgencies()['total_urgency']
+        assert np.array_equal(results['urgencies'].iloc[row].dropna().to_numpy(), urgencies.to_numpy())
+        recommendations = fork.get_recommendations(3)
+        assert results['recommended_position'].iloc[row] == recommendations.attrs['recommended_position']
+        assert list(results['players'].iloc[row]) == list(recommendations['Player'])
+        assert np.array_equal(results['scores'].iloc[row].to_numpy(), recommendations['composite_score'].to_numpy())
+
+    # the engine's own state is untouched
+    assert engine.current_pick == 30 and len(engine.drafted_players) == 29
+    print(f"⏱️  {len(scenarios)} scenarios in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_batch_matches_single_states()
@@ -0,0 +1,111 @@
+import numpy as np
+
+# groups to use when the projections carry no tiers to size them from
+DEFAULT_TIERS = 6
+
+# boards up to this size run each DP layer as one dense pass; larger boards
+# use the O(n log n) divide-and-conquer layer
+DENSE_LIMIT = 200
+
+
+def _segment_cost(s1: np.ndarray, s2: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Squared error of values[start:end + 1] around their mean, from prefix sums"""
+    count = end - start + 1
+    total = s1[end + 1] - s1[start]
+    return (s2[end + 1] - s2[start]) - total * total / count
+
+
+def _dense_costs(s1: np.ndarray, s2: np.ndarray) -> np.ndarray:
+    """Segment cost for every (start, end) pair; empty segments cost inf"""
+    n = len(s1) - 1
+    start = np.arange(n)[:, None]
+    end = np.arange(n)[None, :]
+    cost = _segment_cost(s1, s2, start, np.maximum(end, start))
+    return np.where(end >= start, cost, np.inf)
+
+
+def _dense_layer(previous: np.ndarray, costs: np.ndarray, first: int):
+    """One k-means DP layer over ends first..n-1 as a single matrix pass"""
+    # total[j - first, i]: best cost with the last group spanning j..i
+    total = previous[first - 1:-1, None] + costs[first:]
+    split = np.argmin(total, axis=0) + first
+    cost = total[split - first, np.arange(len(previous))]
+    cost[:first] = np.inf
+    return cost, split
+
+
+def _dp_layer(previous: np.ndarray, s1: np.ndarray, s2: np.ndarray, first: int):
+    """One k-means DP layer over ends first..n-1, using divide and conquer on the
+    monotone split point; every recursion level is evaluated in one vectorized pass"""
+    n = len(previous)
+    cost = np.full(n, np.inf)
+    split = np.zeros(n, dtype=np.int64)
+
+    # pending subproblems: ends [lo, hi] whose best split lies in [jlo, jhi]
+    lo = np.array([first])
+    hi = np.array([n - 1])
+    jlo = np.array([first])
+    jhi = np.array([n - 1])
+    while len(lo):
+        mid = (lo + hi) // 2
+        jend = np.minimum(mid, jhi)
+        lengths = jend - jlo + 1
+        offsets = np.cumsum(lengths) - lengths
+        task = np.repeat(np.arange(len(lo)), lengths)
+        start = jlo[task] + np.arange(len(task)) - offsets[task]
+        end = mid[task]
+        values = previous[start - 1] + _segment_cost(s1, s2, start, end)
+
+        # leftmost best split per subproblem keeps the split points monotone
+        best = np.minimum.reduceat(values, offsets)
+        hits = np.flatnonzero(values <= best[task])
+        hit_task = task[hits]
+        chosen = start[hits[np.concatenate(([True], hit_task[1:] != hit_task[:-1]))]]
+        cost[mid] = best
+        split[mid] = chosen
+
+        left = mid > lo
+        right = mid < hi
+        lo, hi, jlo, jhi = (np.concatenate((lo[left], mid[right] + 1)), np.concatenate((mid[left] - 1, hi[right])),
+                            np.concatenate((jlo[left], chosen[right])), np.concatenate((chosen[left], jhi[right])))
+    return cost, split
+
+
+def optimal_tiers(values: np.ndarray, k: int) -> np.ndarray:
+    """1-based tier of each value, from optimal 1-D k-means into at most k groups.
+    values must be sorted best first; tier 1 holds the first values."""
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=np.int8)
+    # more groups than distinct values would only split ties
+    k = int(min(k, n, np.count_nonzero(np.diff(values)) + 1))
+    if k <= 1:
+        return np.ones(n, dtype=np.int8)
+
+    # centred prefix sums keep the squared-error differences accurate
+    centred = values - values.mean()
+    s1 = np.r_[0.0, np.cumsum(centred)]
+    s2 = np.r_[0.0, np.cumsum(centred * centred)]
+
+    costs = _dense_costs(s1, s2) if n <= DENSE_LIMIT else None
+    cost = _segment_cost(s1, s2, np.zeros(n, dtype=np.int64), np.arange(n))
+    splits = []
+    for layer in range(1, k):
+        if costs is not None:
+            cost, split = _dense_layer(cost, costs, layer)
+        else:
+            cost, split = _dp_layer(cost, s1, s2, layer)
+        splits.append(split)
+
+    # walk the split points back from the last value
+    starts = []
+    end = n - 1
+    for split in reversed(splits):
+        start = int(split[end])
+        starts.append(start)
+        end = start - 1
+    labels = np.zeros(n, dtype=np.int8)
+    labels[np.array(starts, dtype=np.int64)] = 1
+    labels[0] += 1
+    return np.cumsum(labels).astype(np.int8)
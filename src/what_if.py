@@ -0,0 +1,71 @@
+import numpy as np
+from typing import Dict, Iterable, Optional, Tuple
+from ranking import sort_keys
+
+
+class Scenario:
+    """One hypothetical draft state, described relative to an engine's current one"""
+
+    def __init__(self, label: str, drafted: Iterable[str] = (), current_pick: Optional[int] = None,
+                 draft_slot: Optional[int] = None, drafted_positions: Optional[Dict[str, int]] = None):
+        self.label = label
+        # players gone from the board on top of the ones already drafted
+        self.drafted = list(drafted)
+        self.current_pick = current_pick
+        # 0-based like LeagueConfig.your_draft_slot
+        self.draft_slot = draft_slot
+        self.drafted_positions = drafted_positions
+
+    def __repr__(self) -> str:
+        return f"Scenario({self.label!r})"
+
+
+def _first_slot(mask: np.ndarray) -> np.ndarray:
+    """Column of the first True per row (0 for rows with none)"""
+    return mask.argmax(axis=1)
+
+
+def board_terms(position_index, adp: np.ndarray, available: np.ndarray, next_pick: np.ndarray,
+                current_pick: np.ndarray, total_teams: int) -> Tuple[np.ndarray, ...]:
+    """Board-dependent urgency inputs for one position across scenarios (rows of available).
+    Returns players left, VOR percentile of the best now, VOR percentile expected at
+    the next pick and the live dropoff below the best, matching the per-state queries."""
+    by_vor = position_index.by_vor
+    sorted_vor = position_index.sorted_vor
+    board = available[:, by_vor]
+    rows = np.arange(len(board))
+    count = board.sum(axis=1)
+    seen = np.cumsum(board, axis=1)
+    # available players strictly ahead of a slot's tie group, like vor_rank()
+    ahead = seen - board
+    safe_count = np.maximum(count, 1)
+
+    top = _first_slot(board)
+    vor_pct_now = 1 - ahead[rows, position_index.tie_start[top]] / safe_count
+
+    # best VOR with ADP at or after the pick (missing ADP counts), else the k-th best
+    adp_keys = adp[by_vor]
+    adp_keys = np.where(np.isnan(adp_keys), np.inf, adp_keys)
+    reachable = board & (adp_keys[None, :] >= next_pick[:, None])
+    has_reachable = reachable.any(axis=1)
+    depth = np.maximum(1, (next_pick - current_pick) // total_teams)
+    fallback = _first_slot(seen >= depth[:, None])
+    expected = np.where(has_reachable, _first_slot(reachable), fallback)
+    has_expected = has_reachable | (depth < count)
+    vor_pct_next = np.where(has_expected, 1 - ahead[rows, position_index.tie_start[expected]] / safe_count, 0.5)
+
+    second = _first_slot(seen >= 2)
+    dropoff = np.where(count >= 2, sorted_vor[top] - sorted_vor[second], np.nan)
+    return count, vor_pct_now, vor_pct_next, dropoff
+
+
+def ranked_matrix(ids: np.ndarray, scores: np.ndarray, available: np.ndarray, top_n: int) -> np.ndarray:
+    """Top top_n ids per scenario (rows of scores and available) by score, ties in
+    input order; -1 pads short boards"""
+    keys = sort_keys(scores[:, ids], descending=True)
+    board = available[:, ids]
+    # unavailable players sort after every available one
+    order = np.lexsort((keys, ~board), axis=-1)[:, :top_n]
+    ranked = ids[order]
+    ranked[~np.take_along_axis(board, order, axis=1)] = -1
+    return ranked